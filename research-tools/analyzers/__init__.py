@@ -3,3 +3,25 @@ Analyzers
 
 Data analysis utilities for layer separation and mapping.
 """
+
+from lazy_exports import TYPE_CHECKING, attach
+
+# Public name -> defining submodule; imported on first attribute access
+_LAZY_ATTRS = {
+    "CharacterDiff": "data_comparator",
+    "DataComparator": "data_comparator",
+    "VerseDiff": "data_comparator",
+    "BitParallelDiff": "diff_engine",
+    "DifflibDiff": "diff_engine",
+    "DiffResult": "diff_engine",
+    "get_diff_backend": "diff_engine",
+    "PerformanceAnalyzer": "performance_metrics",
+    "PerformanceMetrics": "performance_metrics",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from .data_comparator import CharacterDiff, DataComparator, VerseDiff
+    from .diff_engine import BitParallelDiff, DifflibDiff, DiffResult, get_diff_backend
+    from .performance_metrics import PerformanceAnalyzer, PerformanceMetrics
@@ -5,20 +5,24 @@ Tier 2 (Reusable Research Tool)
 
 Compare Quranic data at character-level and verse-level.
 Useful for validating cross-Qiraat/Narration variations.
+
+Diffs are computed by a pluggable backend (see diff_engine): minimal
+bit-parallel LCS diffs by default, or difflib.SequenceMatcher.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
-import difflib
+
+from .diff_engine import DEFAULT_DIFF_BACKEND, DiffBackend, Opcode, get_diff_backend
 
 
 @dataclass
 class CharacterDiff:
     """Difference at character level."""
 
-    position: int
-    char1: str
-    char2: str
+    position: int  # Index in str1 (for an insertion, the index it precedes)
+    char1: str  # '' for an insertion
+    char2: str  # '' for a deletion
     context_before: str
     context_after: str
 
@@ -42,14 +46,20 @@ class DataComparator:
     Provides character-level and verse-level diff utilities.
     """
 
-    def __init__(self, context_window: int = 10):
+    def __init__(
+        self,
+        context_window: int = 10,
+        backend: Union[str, DiffBackend] = DEFAULT_DIFF_BACKEND
+    ):
         """
         Initialize comparator.
 
         Args:
             context_window: Number of characters to show before/after diff
+            backend: Diff backend name ("bitparallel" or "difflib") or instance
         """
         self.context_window = context_window
+        self.backend = get_diff_backend(backend)
 
     def compare_strings(self, str1: str, str2: str) -> List[CharacterDiff]:
         """
@@ -62,50 +72,49 @@ class DataComparator:
         Returns:
             List of character differences
         """
+        return self._character_diffs(str1, str2, self.backend.diff(str1, str2).opcodes)
+
+    def _character_diffs(self, str1: str, str2: str, opcodes: List[Opcode]) -> List[CharacterDiff]:
+        """
+        Convert diff opcodes into character differences (positions in str1).
+
+        Replaced characters are paired in order. Characters of str2 with no
+        counterpart (an insert, or the longer side of a replace) are
+        insertions: char1 is '' and position is the index in str1 they are
+        inserted before.
+        """
         differences = []
 
-        # Use difflib for sequence matching
-        matcher = difflib.SequenceMatcher(None, str1, str2)
-
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-            if tag == 'replace':
-                # Characters are different
-                for pos in range(i1, i2):
-                    if pos < len(str1) and pos < len(str2):
-                        context_start = max(0, pos - self.context_window)
-                        context_end = min(len(str1), pos + self.context_window + 1)
-
-                        diff = CharacterDiff(
-                            position=pos,
-                            char1=str1[pos],
-                            char2=str2[pos] if pos < len(str2) else '',
-                            context_before=str1[context_start:pos],
-                            context_after=str1[pos + 1:context_end]
-                        )
-                        differences.append(diff)
-
-            elif tag == 'delete':
-                # Character exists in str1 but not str2
-                for pos in range(i1, i2):
-                    context_start = max(0, pos - self.context_window)
-                    context_end = min(len(str1), pos + self.context_window + 1)
-
-                    diff = CharacterDiff(
-                        position=pos,
-                        char1=str1[pos],
-                        char2='',
-                        context_before=str1[context_start:pos],
-                        context_after=str1[pos + 1:context_end]
-                    )
-                    differences.append(diff)
-
-            elif tag == 'insert':
-                # Character exists in str2 but not str1
-                # (represented as position in str2)
-                pass  # Handle insertions separately if needed
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag == 'equal':
+                continue
+
+            # Characters exist in str1 (replaced, or deleted once str2's run ends)
+            for pos in range(i1, i2):
+                j = j1 + pos - i1
+                differences.append(
+                    self._character_diff(str1, pos, str1[pos], str2[j] if j < j2 else '')
+                )
+
+            # Characters exist in str2 but not str1
+            for j in range(j1 + i2 - i1, j2):
+                differences.append(self._character_diff(str1, i2, '', str2[j]))
 
         return differences
 
+    def _character_diff(self, str1: str, pos: int, char1: str, char2: str) -> CharacterDiff:
+        """Build a CharacterDiff at a str1 position with its surrounding context."""
+        context_start = max(0, pos - self.context_window)
+        # An insertion sits before str1[pos], so the context after starts there
+        after = pos + 1 if char1 else pos
+        return CharacterDiff(
+            position=pos,
+            char1=char1,
+            char2=char2,
+            context_before=str1[context_start:pos],
+            context_after=str1[after:after + self.context_window]
+        )
+
     def compare_verses(
         self,
         verse1_data: Dict[str, str],
@@ -126,10 +135,10 @@ class DataComparator:
         text1 = verse1_data.get(text_field, '')
         text2 = verse2_data.get(text_field, '')
 
-        char_diffs = self.compare_strings(text1, text2)
-
-        # Calculate similarity ratio
-        similarity = difflib.SequenceMatcher(None, text1, text2).ratio()
+        # One diff gives both the character differences and the similarity ratio
+        result = self.backend.diff(text1, text2)
+        char_diffs = self._character_diffs(text1, text2, result.opcodes)
+        similarity = result.ratio
 
         return VerseDiff(
             surah=verse1_data.get('surah', 0),
@@ -189,7 +198,7 @@ class DataComparator:
         Returns:
             Similarity ratio (0.0 to 1.0, where 1.0 is identical)
         """
-        return difflib.SequenceMatcher(None, str1, str2).ratio()
+        return self.backend.ratio(str1, str2)
 
     def format_diff(self, char_diff: CharacterDiff) -> str:
         """
@@ -0,0 +1,298 @@
+"""
+Diff Engine
+
+Tier 2 (Reusable Research Tool)
+
+Pluggable diff backends for DataComparator. Each backend returns
+difflib-style opcodes and the similarity ratio from a single pass over two
+strings (or any sequences of hashable items, e.g. lists of words).
+
+Backends:
+    "bitparallel"  Minimal diff (longest common subsequence) computed with
+                   bit-parallel LCS: Python integers serve as bit vectors,
+                   so each item of the second sequence costs a few integer
+                   operations over the whole first sequence. Small inputs
+                   are traced back from the stored rows; large inputs are
+                   split Hirschberg-style first, so memory stays linear.
+                   Default.
+    "difflib"      difflib.SequenceMatcher (the previous behaviour). Its
+                   junk and matching heuristics are not minimal: on
+                   diacritic-heavy Arabic text it misses many matches.
+
+The ratio is 2 * matches / (len(a) + len(b)), as in SequenceMatcher.ratio();
+with "bitparallel" the matches are a longest common subsequence, so ratios
+are higher than difflib's whenever difflib's alignment is not minimal.
+
+Example:
+    >>> result = get_diff_backend("bitparallel").diff(hafs_text, warsh_text)
+    >>> result.ratio
+    0.93
+    >>> for tag, i1, i2, j1, j2 in result.opcodes:
+    ...     print(tag, hafs_text[i1:i2], warsh_text[j1:j2])
+"""
+
+import difflib
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Dict, Hashable, List, Sequence, Tuple, Type, Union
+
+# (tag, i1, i2, j1, j2) as returned by difflib.SequenceMatcher.get_opcodes()
+Opcode = Tuple[str, int, int, int, int]
+
+# (i, j, size): a[i:i + size] == b[j:j + size]
+MatchingBlock = Tuple[int, int, int]
+
+# Largest len(a) * len(b) traced back from stored rows (about 512 KB of bit
+# vectors); larger inputs are split first
+MAX_TRACEBACK_CELLS = 1 << 22
+
+DEFAULT_DIFF_BACKEND = "bitparallel"
+
+
+@dataclass
+class DiffResult:
+    """Opcodes and match count of a diff between two sequences."""
+
+    opcodes: List[Opcode]
+    matches: int  # Items in "equal" opcodes
+    size: int  # len(a) + len(b)
+
+    @property
+    def ratio(self) -> float:
+        """Similarity ratio (0.0 to 1.0, where 1.0 is identical)."""
+        return 2.0 * self.matches / self.size if self.size else 1.0
+
+
+class BitParallelDiff:
+    """Minimal diffs with bit-parallel LCS (see module docstring)."""
+
+    name = "bitparallel"
+
+    def __init__(self, max_traceback_cells: int = MAX_TRACEBACK_CELLS):
+        """
+        Initialize backend.
+
+        Args:
+            max_traceback_cells: Largest len(a) * len(b) solved directly;
+                                 larger inputs are split in linear space
+        """
+        self.max_traceback_cells = max_traceback_cells
+
+    def diff(self, a: Sequence[Hashable], b: Sequence[Hashable]) -> DiffResult:
+        """
+        Compute a minimal diff.
+
+        Args:
+            a: First sequence
+            b: Second sequence
+
+        Returns:
+            DiffResult whose "equal" opcodes form a longest common subsequence
+        """
+        blocks: List[MatchingBlock] = []
+        self._compare(a, b, 0, len(a), 0, len(b), blocks)
+        return DiffResult(_opcodes(blocks, len(a), len(b)),
+                          sum(block[2] for block in blocks), len(a) + len(b))
+
+    def ratio(self, a: Sequence[Hashable], b: Sequence[Hashable]) -> float:
+        """Similarity ratio without computing opcodes."""
+        size = len(a) + len(b)
+        if not size:
+            return 1.0
+        return 2.0 * (len(a) - _lcs_vector(a, b).bit_count()) / size
+
+    def _compare(
+        self,
+        a: Sequence[Hashable],
+        b: Sequence[Hashable],
+        a_lo: int,
+        a_hi: int,
+        b_lo: int,
+        b_hi: int,
+        blocks: List[MatchingBlock]
+    ):
+        """Append the matching blocks of a[a_lo:a_hi] and b[b_lo:b_hi] in order."""
+        start = a_lo
+        while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+            a_lo += 1
+            b_lo += 1
+        if a_lo > start:
+            blocks.append((start, b_lo - (a_lo - start), a_lo - start))
+        end = a_hi
+        while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+            a_hi -= 1
+            b_hi -= 1
+
+        n = a_hi - a_lo
+        m = b_hi - b_lo
+        if n and m:
+            if n * m <= self.max_traceback_cells or m < 2:
+                _traceback(a[a_lo:a_hi], b[b_lo:b_hi], a_lo, b_lo, blocks)
+            else:
+                b_mid = b_lo + m // 2
+                a_mid = a_lo + _split(a[a_lo:a_hi], b[b_lo:b_mid], b[b_mid:b_hi])
+                self._compare(a, b, a_lo, a_mid, b_lo, b_mid, blocks)
+                self._compare(a, b, a_mid, a_hi, b_mid, b_hi, blocks)
+        if end > a_hi:
+            blocks.append((a_hi, b_hi, end - a_hi))
+
+
+class DifflibDiff:
+    """difflib.SequenceMatcher backend (heuristic, not minimal)."""
+
+    name = "difflib"
+
+    def diff(self, a: Sequence[Hashable], b: Sequence[Hashable]) -> DiffResult:
+        """Compute opcodes and matches with one SequenceMatcher."""
+        matcher = difflib.SequenceMatcher(None, a, b)
+        matches = sum(block.size for block in matcher.get_matching_blocks())
+        return DiffResult(matcher.get_opcodes(), matches, len(a) + len(b))
+
+    def ratio(self, a: Sequence[Hashable], b: Sequence[Hashable]) -> float:
+        """SequenceMatcher.ratio()."""
+        return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+DiffBackend = Union[BitParallelDiff, DifflibDiff]
+
+# Backend name -> class
+DIFF_BACKENDS: Dict[str, Type[DiffBackend]] = {
+    BitParallelDiff.name: BitParallelDiff,
+    DifflibDiff.name: DifflibDiff,
+}
+
+
+def get_diff_backend(backend: Union[str, DiffBackend] = DEFAULT_DIFF_BACKEND) -> DiffBackend:
+    """
+    Resolve a diff backend.
+
+    Args:
+        backend: Name from DIFF_BACKENDS, or any object with diff(a, b)
+                 and ratio(a, b) methods
+
+    Returns:
+        Backend instance
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if not isinstance(backend, str):
+        return backend
+    try:
+        return DIFF_BACKENDS[backend]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown diff backend {backend!r} (choose from {sorted(DIFF_BACKENDS)})"
+        ) from None
+
+
+def _match_masks(a: Sequence[Hashable]) -> Dict[Hashable, int]:
+    """Item -> bit mask of its positions in a."""
+    positions: Dict[Hashable, List[int]] = {}
+    for i, item in enumerate(a):
+        positions.setdefault(item, []).append(i)
+    return {item: sum(1 << i for i in indices) for item, indices in positions.items()}
+
+
+def _lcs_vector(a: Sequence[Hashable], b: Sequence[Hashable]) -> int:
+    """
+    Final bit-parallel LCS vector of a against b.
+
+    Bit i is 0 where the LCS of a[:i + 1] and b is one longer than that of
+    a[:i] and b, so the LCS length is the number of zero bits.
+    """
+    masks = _match_masks(a)
+    full = (1 << len(a)) - 1
+    v = full
+    get = masks.get
+    for item in b:
+        u = v & get(item, 0)
+        v = ((v + u) | (v - u)) & full
+    return v
+
+
+def _traceback(
+    a: Sequence[Hashable],
+    b: Sequence[Hashable],
+    a_offset: int,
+    b_offset: int,
+    blocks: List[MatchingBlock]
+):
+    """Append the matching blocks of one LCS of a and b, traced back from all rows."""
+    masks = _match_masks(a)
+    full = (1 << len(a)) - 1
+    v = full
+    rows = [v]
+    append = rows.append
+    get = masks.get
+    for item in b:
+        u = v & get(item, 0)
+        v = ((v + u) | (v - u)) & full
+        append(v)
+
+    found: List[MatchingBlock] = []
+    i, j = len(a), len(b)
+    run = 0
+    while i and j:
+        if a[i - 1] == b[j - 1]:
+            i -= 1
+            j -= 1
+            run += 1
+            continue
+        if run:
+            found.append((a_offset + i, b_offset + j, run))
+            run = 0
+        if rows[j] >> (i - 1) & 1:  # LCS(a[:i - 1], b[:j]) is as long
+            i -= 1
+        else:
+            j -= 1
+    if run:
+        found.append((a_offset + i, b_offset + j, run))
+    found.reverse()
+    blocks.extend(found)
+
+
+def _split(a: Sequence[Hashable], b_left: Sequence[Hashable], b_right: Sequence[Hashable]) -> int:
+    """
+    Hirschberg split: the i maximizing LCS(a[:i], b_left) + LCS(a[i:], b_right).
+
+    Both terms come from one bit-parallel pass each (forward over b_left,
+    backward over b_right), so no rows are stored.
+    """
+    n = len(a)
+    forward = _prefix_zeros(_lcs_vector(a, b_left), n)
+    backward = _prefix_zeros(_lcs_vector(a[::-1], b_right[::-1]), n)
+    return max(range(n + 1), key=lambda i: forward[i] + backward[n - i])
+
+
+def _prefix_zeros(v: int, n: int) -> List[int]:
+    """Zero bits among the lowest i bits of v, for i in 0..n."""
+    bits = format(v, f"0{n}b")[::-1] if n else ""
+    return list(accumulate(map("0".__eq__, bits), initial=0))
+
+
+def _opcodes(blocks: List[MatchingBlock], n: int, m: int) -> List[Opcode]:
+    """Convert ordered matching blocks into difflib-style opcodes."""
+    opcodes: List[Opcode] = []
+    i = j = 0
+    for ai, bj, size in blocks:
+        if opcodes and opcodes[-1][0] == "equal" and ai == i and bj == j:
+            _, i1, _, j1, _ = opcodes.pop()  # Merge adjacent blocks
+            opcodes.append(("equal", i1, ai + size, j1, bj + size))
+            i, j = ai + size, bj + size
+            continue
+        if i < ai and j < bj:
+            opcodes.append(("replace", i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(("delete", i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, ai, j, bj))
+        opcodes.append(("equal", ai, ai + size, bj, bj + size))
+        i, j = ai + size, bj + size
+    if i < n and j < m:
+        opcodes.append(("replace", i, n, j, m))
+    elif i < n:
+        opcodes.append(("delete", i, n, j, m))
+    elif j < m:
+        opcodes.append(("insert", i, n, j, m))
+    return opcodes
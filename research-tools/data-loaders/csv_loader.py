@@ -4,11 +4,75 @@ CSV Data Loader
 Tier 2 (Reusable Research Tool)
 
 Loads Quranic data from CSV format for validation purposes.
+
+Besides row dicts, files can be read as columnar CSVTables with column
+projection, NumPy dtype coercion and chunked iteration, so large files are
+processed in bounded memory and table-level metadata (e.g. layer name) is
+stored once rather than on every row. NumPy is only imported when a dtype
+map is used.
 """
 
 import csv
+from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Rows per chunk for iter_chunks
+DEFAULT_CHUNK_ROWS = 10000
+
+# Accepted spellings of boolean cells (case-insensitive, surrounding spaces ignored)
+BOOL_VALUES = {"true": True, "1": True, "false": False, "0": False}
+
+# Column data: NumPy array for typed columns, list of str otherwise
+Column = Union["np.ndarray", List[str]]
+
+
+@dataclass
+class CSVTable:
+    """Columnar CSV data with table-level metadata."""
+
+    columns: Dict[str, Column]
+    metadata: Dict[str, Any] = field(default_factory=dict)  # e.g. {"layer": "L5", "source": ...}
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    @property
+    def column_names(self) -> List[str]:
+        """Column names in file order."""
+        return list(self.columns)
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate rows as dicts (NumPy scalars converted to Python values).
+
+        Yields:
+            Row dictionaries
+        """
+        names = self.column_names
+        values = [
+            column if isinstance(column, list) else column.tolist()
+            for column in self.columns.values()
+        ]
+        for row in zip(*values):
+            yield dict(zip(names, row))
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """
+        Convert to the row-dict form returned by CSVLoader.load_csv.
+
+        Returns:
+            List of dictionaries, one per row
+        """
+        return list(self.iter_rows())
 
 
 class CSVLoader:
@@ -45,17 +109,153 @@ class CSVLoader:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        path = Path(file_path)
-        if not path.is_absolute():
-            path = self.data_dir / path
-
-        if not path.exists():
-            raise FileNotFoundError(f"CSV file not found: {path}")
+        path = self._resolve_path(file_path)
 
         with open(path, 'r', encoding=encoding) as f:
             reader = csv.DictReader(f)
             return list(reader)
 
+    def iter_chunks(
+        self,
+        file_path: Union[str, Path],
+        columns: Optional[Sequence[str]] = None,
+        dtypes: Optional[Dict[str, Any]] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        encoding: str = 'utf-8-sig',
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Iterator[CSVTable]:
+        """
+        Read a CSV file as a sequence of columnar chunks.
+
+        Only the projected columns are kept, and each chunk holds at most
+        chunk_rows rows, so memory is bounded regardless of file size.
+
+        Args:
+            file_path: Path to CSV file (absolute or relative to data_dir)
+            columns: Columns to read, in output order (default: all)
+            dtypes: Column -> NumPy dtype (e.g. {"sura_no": np.int32});
+                    other columns stay lists of str
+            chunk_rows: Maximum rows per chunk
+            encoding: File encoding (default strips a UTF-8 BOM)
+            metadata: Table-level metadata attached to every chunk
+
+        Yields:
+            CSVTable chunks
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If projected/typed columns are missing or a value
+                        cannot be converted to its dtype
+
+        Example:
+            >>> for chunk in loader.iter_chunks(path, ["sura_no", "aya_text"],
+            ...                                 {"sura_no": np.int32}):
+            ...     counts += np.bincount(chunk["sura_no"], minlength=115)
+        """
+        path = self._resolve_path(file_path)
+        dtypes = dtypes or {}
+        table_metadata = {"source": str(path), **(metadata or {})}
+
+        with open(path, 'r', encoding=encoding, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            names = list(columns) if columns is not None else header
+            missing = [name for name in [*names, *dtypes] if name not in header]
+            if missing:
+                raise ValueError(f"Missing required columns: {missing}")
+
+            indices = [header.index(name) for name in names]
+            project = itemgetter(*indices) if len(indices) > 1 else None
+            width = len(header)
+
+            while True:
+                rows = []
+                for row in reader:
+                    if len(row) != width:
+                        if not row:
+                            continue
+                        raise ValueError(
+                            f"Row {reader.line_num} has {len(row)} fields, expected {width}"
+                        )
+                    rows.append(project(row) if project else (row[indices[0]],))
+                    if len(rows) == chunk_rows:
+                        break
+
+                if not rows:
+                    return
+
+                yield CSVTable(
+                    {
+                        name: self._coerce_column(name, values, dtypes.get(name))
+                        for name, values in zip(names, zip(*rows))
+                    },
+                    dict(table_metadata)
+                )
+
+                if len(rows) < chunk_rows:
+                    return
+
+    def load_columns(
+        self,
+        file_path: Union[str, Path],
+        columns: Optional[Sequence[str]] = None,
+        dtypes: Optional[Dict[str, Any]] = None,
+        encoding: str = 'utf-8-sig',
+        metadata: Optional[Dict[str, Any]] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> CSVTable:
+        """
+        Load a CSV file as a single columnar table.
+
+        The file is read chunk by chunk, so only the projected columns of the
+        whole file are ever held in memory.
+
+        Args:
+            file_path: Path to CSV file (absolute or relative to data_dir)
+            columns: Columns to read, in output order (default: all)
+            dtypes: Column -> NumPy dtype; other columns stay lists of str
+            encoding: File encoding (default strips a UTF-8 BOM)
+            metadata: Table-level metadata (e.g. {"layer": "L5"})
+            chunk_rows: Rows read per chunk
+
+        Returns:
+            CSVTable
+
+        Example:
+            >>> table = loader.load_columns(
+            ...     "hafsData_v2-0.csv", ["sura_no", "aya_no"],
+            ...     {"sura_no": np.int32, "aya_no": np.int32})
+            >>> int(table["aya_no"].max())
+            286
+        """
+        parts: Dict[str, List[Column]] = {}
+        table_metadata = None
+
+        for chunk in self.iter_chunks(
+            file_path, columns, dtypes, chunk_rows, encoding, metadata
+        ):
+            table_metadata = chunk.metadata
+            for name, values in chunk.columns.items():
+                parts.setdefault(name, []).append(values)
+
+        if table_metadata is None:  # Header only (or empty file)
+            path = self._resolve_path(file_path)
+            return CSVTable({}, {"source": str(path), **(metadata or {})})
+
+        merged = {}
+        for name, chunks in parts.items():
+            if isinstance(chunks[0], list):
+                merged[name] = [value for values in chunks for value in values]
+            else:
+                import numpy as np
+
+                merged[name] = np.concatenate(chunks)
+
+        return CSVTable(merged, table_metadata)
+
     def load_layer_data(
         self,
         file_path: Union[str, Path],
@@ -79,16 +279,40 @@ class CSVLoader:
 
         return data
 
+    def load_layer_table(
+        self,
+        file_path: Union[str, Path],
+        layer_name: str,
+        columns: Optional[Sequence[str]] = None,
+        dtypes: Optional[Dict[str, Any]] = None
+    ) -> CSVTable:
+        """
+        Load CSV data for a specific layer as a columnar table.
+
+        Unlike load_layer_data, the layer name is stored once in the table
+        metadata instead of being copied onto every row.
+
+        Args:
+            file_path: Path to CSV file
+            layer_name: Name of the layer (for metadata)
+            columns: Columns to read (default: all)
+            dtypes: Column -> NumPy dtype; other columns stay lists of str
+
+        Returns:
+            CSVTable with metadata["layer"] set
+        """
+        return self.load_columns(file_path, columns, dtypes, metadata={"layer": layer_name})
+
     def validate_required_columns(
         self,
-        data: List[Dict[str, str]],
+        data: Union[List[Dict[str, str]], CSVTable],
         required_columns: List[str]
     ) -> bool:
         """
         Validate that all required columns are present.
 
         Args:
-            data: Loaded CSV data
+            data: Loaded CSV data (row dicts or CSVTable)
             required_columns: List of required column names
 
         Returns:
@@ -97,10 +321,13 @@ class CSVLoader:
         Raises:
             ValueError: If required columns are missing
         """
-        if not data:
+        if not len(data):
             raise ValueError("Empty dataset")
 
-        actual_columns = set(data[0].keys())
+        if isinstance(data, CSVTable):
+            actual_columns = set(data.column_names)
+        else:
+            actual_columns = set(data[0].keys())
         required_set = set(required_columns)
 
         missing = required_set - actual_columns
@@ -108,3 +335,41 @@ class CSVLoader:
             raise ValueError(f"Missing required columns: {missing}")
 
         return True
+
+    def _resolve_path(self, file_path: Union[str, Path]) -> Path:
+        """Resolve a path against data_dir and check it exists."""
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = self.data_dir / path
+
+        if not path.exists():
+            raise FileNotFoundError(f"CSV file not found: {path}")
+
+        return path
+
+    def _coerce_column(self, name: str, values: tuple, dtype: Any) -> Column:
+        """Convert a column of strings to its dtype (list of str if none)."""
+        if dtype is None or dtype is str:
+            return list(values)
+
+        import numpy as np
+
+        if np.dtype(dtype).kind in ("U", "O"):
+            return list(values)
+
+        if np.dtype(dtype).kind == "b":
+            # astype(bool) would make every non-empty string True, "False" included
+            try:
+                return np.array([BOOL_VALUES[v.strip().lower()] for v in values], dtype=dtype)
+            except KeyError as e:
+                raise ValueError(
+                    f"Column '{name}' cannot be converted to bool: {e.args[0]!r} "
+                    f"(expected one of {sorted(BOOL_VALUES)})"
+                ) from None
+
+        try:
+            return np.array(values).astype(dtype)
+        except ValueError as e:
+            raise ValueError(
+                f"Column '{name}' cannot be converted to {np.dtype(dtype)}: {e}"
+            ) from e
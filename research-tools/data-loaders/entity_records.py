@@ -0,0 +1,193 @@
+"""
+Entity Records
+
+Tier 2 (Reusable Research Tool)
+
+Frozen, slotted record types for ayah, word, character and symbol entities.
+
+Plain dicts carry a hash table per entity, which dominates memory at word
+and character granularity. These dataclasses store the same fields in
+fixed slots and convert losslessly to and from the existing dict shapes:
+
+- AyahRecord:   QS-QIRAAT ayah record (id, jozz, page, sura_no, ...)
+- WordRecord:   WRD layer entity (schemas/wrd-word-structure)
+- CharRecord:   CHR layer entity (schemas/chr-character-composition)
+- SymbolRecord: SYM layer entity (schemas/sym-character-symbols)
+
+Array-valued fields are held as tuples so records stay immutable; they are
+returned as lists by to_dict(). Optional fields left as None are omitted.
+"""
+
+import sys
+from dataclasses import MISSING, dataclass, field, fields
+from typing import ClassVar, Dict, List, Optional, Tuple, Union
+
+
+# Record class -> (field names, required field names)
+_FIELD_CACHE: Dict[type, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+
+def _record_fields(cls: type) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Get (all, required) field names of a record class, excluding ClassVars."""
+    cached = _FIELD_CACHE.get(cls)
+    if cached is None:
+        record_fields = fields(cls)
+        cached = (
+            tuple(f.name for f in record_fields),
+            tuple(
+                f.name for f in record_fields
+                if f.default is MISSING and f.default_factory is MISSING
+            ),
+        )
+        _FIELD_CACHE[cls] = cached
+    return cached
+
+
+class _EntityRecord:
+    """Dict conversion shared by the entity record types."""
+
+    __slots__ = ()
+
+    # Fields stored as tuples but exchanged as lists
+    _sequence_fields: ClassVar[Tuple[str, ...]] = ()
+    # Low-cardinality text fields shared across records via sys.intern
+    _interned_fields: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict):
+        """
+        Build a record from its dict form.
+
+        Keys that are not fields of the record (e.g. `_layer`, `_context`)
+        are ignored.
+
+        Args:
+            data: Entity dict
+
+        Returns:
+            Record instance
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        names, required = _record_fields(cls)
+        values = {name: data[name] for name in names if name in data}
+
+        missing = [name for name in required if name not in values]
+        if missing:
+            raise ValueError(f"Missing fields for {cls.__name__}: {', '.join(missing)}")
+
+        for name in cls._sequence_fields:
+            if values.get(name) is not None:
+                values[name] = tuple(values[name])
+        for name in cls._interned_fields:
+            if isinstance(values.get(name), str):
+                values[name] = sys.intern(values[name])
+
+        return cls(**values)
+
+    @classmethod
+    def from_dicts(cls, records: List[Dict]) -> List:
+        """
+        Build records from a list of dicts.
+
+        Args:
+            records: Entity dicts
+
+        Returns:
+            List of record instances
+        """
+        return [cls.from_dict(record) for record in records]
+
+    def to_dict(self) -> Dict:
+        """
+        Convert the record to its dict form.
+
+        Returns:
+            Entity dict (None-valued optional fields omitted)
+        """
+        result = {}
+        for name in _record_fields(type(self))[0]:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if name in self._sequence_fields:
+                value = list(value)
+            result[name] = value
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class AyahRecord(_EntityRecord):
+    """QS-QIRAAT ayah record."""
+
+    _interned_fields: ClassVar[Tuple[str, ...]] = ("sura_name_en", "sura_name_ar")
+
+    id: int
+    jozz: int
+    page: Union[int, str]  # "34-35" when the ayah spans pages
+    sura_no: int
+    sura_name_en: str
+    sura_name_ar: str
+    line_start: int
+    line_end: int
+    aya_no: int
+    aya_text: str
+    aya_text_emlaey: Optional[str] = None  # Hafs only
+
+
+@dataclass(frozen=True, slots=True)
+class WordRecord(_EntityRecord):
+    """WRD layer word entity."""
+
+    _sequence_fields: ClassVar[Tuple[str, ...]] = ("character_refs", "character_range")
+    _interned_fields: ClassVar[Tuple[str, ...]] = ("word_type",)
+
+    word_id: str
+    verse_ref: str
+    word_position: int
+    character_refs: Tuple[str, ...]
+    character_range: Optional[Tuple[int, int]] = None
+    morphology: Optional[Dict] = field(default=None, hash=False)
+    word_count_contribution: Optional[int] = None
+    word_type: Optional[str] = None
+    sentence_ref: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class CharRecord(_EntityRecord):
+    """CHR layer character entity."""
+
+    _interned_fields: ClassVar[Tuple[str, ...]] = (
+        "base_letter", "phonetic_class", "tajweed_class", "orthography_type"
+    )
+
+    character_id: str
+    narration_ref: str
+    verse_ref: str
+    position: int
+    base_letter: str
+    phonetic_class: str
+    orthography_type: str
+    tajweed_class: Optional[str] = None
+    word_ref: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolRecord(_EntityRecord):
+    """SYM layer symbol (diacritic) entity."""
+
+    _sequence_fields: ClassVar[Tuple[str, ...]] = ("ligature_context",)
+    _interned_fields: ClassVar[Tuple[str, ...]] = (
+        "symbol_type", "symbol_codepoint", "positional_form", "font_variant"
+    )
+
+    symbol_id: str
+    character_ref: str
+    symbol_type: str
+    symbol_codepoint: str
+    tajweed_rule: Optional[str] = None
+    narration_specific: Optional[bool] = None
+    positional_form: Optional[str] = None
+    ligature_context: Optional[Tuple[str, ...]] = None
+    font_variant: Optional[str] = None
@@ -0,0 +1,270 @@
+"""
+Multi-Format Loader
+
+Tier 2 (Reusable Research Tool)
+
+Loads a QS-QIRAAT riwaya from any of its shipped source formats (.json,
+.csv, .txt, .sql, .xml) into the same stream of typed records, using a
+dedicated parser per format:
+
+- json: single json.loads over the file bytes
+- csv:  csv.reader (UTF-8 BOM stripped), header zipped onto rows
+- txt:  tab-separated lines split directly (the files carry no quoting)
+- sql:  one INSERT per line; the VALUES tuple is read with csv.reader
+        using MySQL quoting rules
+- xml:  xml.etree iterparse, clearing each <ROW> once consumed
+
+Typed records use a single schema regardless of source: integer fields are
+ints (None for empty cells), and `page` is an int, or a "first-last" string
+for ayat that span pages (matching riwaya_corpus.format_page with
+page_format="int").
+"""
+
+import csv
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+from riwaya_corpus import INT_FIELDS
+
+
+SOURCE_FORMATS = ("json", "csv", "txt", "sql", "xml")
+
+_SQL_VALUES_MARKER = ") VALUES ("
+
+
+def detect_format(file_path: Union[str, Path]) -> str:
+    """
+    Detect the source format of a QS-QIRAAT data file from its suffix.
+
+    Args:
+        file_path: Data file path
+
+    Returns:
+        One of SOURCE_FORMATS
+
+    Raises:
+        ValueError: If the suffix is not a supported format
+    """
+    fmt = Path(file_path).suffix.lower().lstrip(".")
+    if fmt not in SOURCE_FORMATS:
+        raise ValueError(
+            f"Unsupported source format '{fmt}' for {file_path} "
+            f"(expected one of {', '.join(SOURCE_FORMATS)})"
+        )
+    return fmt
+
+
+def find_sources(file_path: Union[str, Path]) -> Dict[str, Path]:
+    """
+    Find every shipped format of the riwaya a data file belongs to.
+
+    Args:
+        file_path: Any data file of the riwaya (e.g. hafsData_v2-0.json)
+
+    Returns:
+        Mapping of format -> path, for the formats present on disk
+    """
+    path = Path(file_path)
+    sources = {}
+    for fmt in SOURCE_FORMATS:
+        candidate = path.with_suffix(f".{fmt}")
+        if candidate.exists():
+            sources[fmt] = candidate
+    return sources
+
+
+def coerce_record(raw: Dict) -> Dict:
+    """
+    Convert a raw record (string or JSON-typed values) to the typed schema.
+
+    Args:
+        raw: Record as produced by any format parser
+
+    Returns:
+        New record with integer string fields as ints (None for empty
+        cells) and page as int or span string; values of other types are
+        passed through unchanged
+    """
+    record = dict(raw)
+    for name in INT_FIELDS:
+        value = record.get(name)
+        if not isinstance(value, str):
+            continue  # Already typed by the parser (int, float, None)
+        if not value.strip():
+            record[name] = None  # Empty cell
+        elif name == "page" and not value.isdigit():
+            record[name] = value  # "34-35": ayah spans two pages
+        else:
+            record[name] = int(value)
+    return record
+
+
+def iter_typed_records(
+    file_path: Union[str, Path],
+    fmt: Optional[str] = None
+) -> Iterator[Dict]:
+    """
+    Yield typed records from a QS-QIRAAT data file in any shipped format.
+
+    Args:
+        file_path: Data file path
+        fmt: Source format (detected from the suffix if omitted)
+
+    Yields:
+        Typed record dicts in file order
+
+    Raises:
+        ValueError: If the format is unsupported or the file is malformed
+
+    Example:
+        >>> for record in iter_typed_records("warshData_v2-1.sql"):
+        ...     print(record["sura_no"], record["aya_no"], record["page"])
+    """
+    fmt = fmt or detect_format(file_path)
+    if fmt not in _PARSERS:
+        raise ValueError(f"Unsupported source format '{fmt}'")
+
+    try:
+        for raw in _PARSERS[fmt](Path(file_path)):
+            yield coerce_record(raw)
+    except UnicodeDecodeError as e:
+        raise ValueError(f"{file_path} is not valid UTF-8: {e}") from e
+
+
+def load_typed_records(
+    file_path: Union[str, Path],
+    fmt: Optional[str] = None
+) -> List[Dict]:
+    """
+    Load all typed records from a QS-QIRAAT data file.
+
+    Args:
+        file_path: Data file path
+        fmt: Source format (detected from the suffix if omitted)
+
+    Returns:
+        List of typed record dicts in file order
+    """
+    return list(iter_typed_records(file_path, fmt))
+
+
+def cross_check(
+    sources: Dict[str, Union[str, Path]],
+    limit: int = 10
+) -> Dict[str, List[str]]:
+    """
+    Compare the typed records of several formats of the same riwaya.
+
+    The first source in the mapping is the reference; each other format is
+    compared against it record by record.
+
+    Args:
+        sources: Mapping of format -> path (e.g. from find_sources)
+        limit: Maximum differences reported per format
+
+    Returns:
+        Mapping of format -> list of difference descriptions (empty if equal);
+        a format that fails to parse is reported as unreadable
+    """
+    formats = list(sources)
+    if not formats:
+        return {}
+
+    reference_fmt = formats[0]
+    reference = load_typed_records(sources[reference_fmt], reference_fmt)
+    report = {reference_fmt: []}
+
+    for fmt in formats[1:]:
+        try:
+            records = load_typed_records(sources[fmt], fmt)
+        except ValueError as e:
+            report[fmt] = [f"unreadable: {e}"]
+            continue
+
+        differences = []
+
+        if len(records) != len(reference):
+            differences.append(
+                f"record count {len(records)} != {len(reference)} ({reference_fmt})"
+            )
+
+        for i, (expected, actual) in enumerate(zip(reference, records)):
+            if expected == actual:
+                continue
+            fields = sorted(
+                name for name in set(expected) | set(actual)
+                if expected.get(name) != actual.get(name)
+            )
+            differences.append(f"record {i} (id={expected.get('id')}): {', '.join(fields)}")
+            if len(differences) >= limit:
+                break
+
+        report[fmt] = differences
+
+    return report
+
+
+def _parse_json(path: Path) -> Iterator[Dict]:
+    """Parse a JSON array file."""
+    data = json.loads(path.read_bytes())
+    if not isinstance(data, list):
+        raise ValueError(f"Expected a JSON array in {path}")
+    return iter(data)
+
+
+def _parse_csv(path: Path) -> Iterator[Dict]:
+    """Parse a comma-separated file with a header row."""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        for row in reader:
+            yield dict(zip(header, row))
+
+
+def _parse_txt(path: Path) -> Iterator[Dict]:
+    """Parse a tab-separated file with a header row."""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        header = f.readline().rstrip("\r\n").split("\t")
+        for line in f:
+            line = line.rstrip("\r\n")
+            if line:
+                yield dict(zip(header, line.split("\t")))
+
+
+def _parse_sql(path: Path) -> Iterator[Dict]:
+    """Parse a dump of single-row INSERT statements."""
+    header = None
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        lines = (line for line in f if line.startswith("INSERT INTO"))
+        for line_number, line in enumerate(lines, 1):
+            columns, marker, values = line.rstrip().partition(_SQL_VALUES_MARKER)
+            if not marker or not values.endswith(");"):
+                raise ValueError(f"Unsupported INSERT statement #{line_number} in {path}")
+
+            if header is None:
+                column_list = columns[columns.index("(") + 1:]
+                header = [name.strip().strip("`") for name in column_list.split(",")]
+
+            row = next(csv.reader(
+                [values[:-2]], quotechar="'", escapechar="\\", doublequote=True
+            ))
+            yield dict(zip(header, row))
+
+
+def _parse_xml(path: Path) -> Iterator[Dict]:
+    """Parse <DATA><ROW>...</ROW></DATA> XML."""
+    for _, element in ET.iterparse(path, events=("end",)):
+        if element.tag == "ROW":
+            yield {child.tag: child.text or "" for child in element}
+            element.clear()
+
+
+_PARSERS: Dict[str, Callable[[Path], Iterator[Dict]]] = {
+    "json": _parse_json,
+    "csv": _parse_csv,
+    "txt": _parse_txt,
+    "sql": _parse_sql,
+    "xml": _parse_xml,
+}
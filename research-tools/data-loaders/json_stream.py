@@ -0,0 +1,145 @@
+"""
+Streaming JSON Reader
+
+Tier 2 (Reusable Research Tool)
+
+Incremental reader for files whose top level is a JSON array (the QS-QIRAAT
+layout). Elements are decoded and yielded one at a time while the file is
+read in fixed-size chunks, so memory stays bounded by the chunk size plus the
+largest single element rather than the whole file.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterator, TextIO, Union
+
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_TAIL = re.compile(r"[0-9+\-.eE]*\Z")
+
+
+class _ChunkBuffer:
+    """Text buffer over a file that is refilled and trimmed on demand."""
+
+    def __init__(self, f: TextIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int) -> bool:
+        """Append up to size characters; returns False at end of file."""
+        if self.eof:
+            return False
+
+        chunk = self.f.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        # Drop consumed text so the buffer does not grow with the file
+        if self.pos:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        self.text += chunk
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill(self.chunk_size):
+                return ""
+
+
+def iter_json_array(
+    source: Union[str, Path, TextIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = 'utf-8-sig'
+) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    Args:
+        source: File path or an open text file
+        chunk_size: Characters read per chunk
+        encoding: File encoding when a path is given (default strips a UTF-8 BOM)
+
+    Yields:
+        Decoded array elements in file order
+
+    Raises:
+        json.JSONDecodeError: If the file is not a well-formed JSON array
+
+    Example:
+        >>> for record in iter_json_array("hafsData_v2-0.json"):
+        ...     hasher.update(record["aya_text"].encode("utf-8"))
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'r', encoding=encoding) as f:
+            yield from _iter_array(f, chunk_size)
+    else:
+        yield from _iter_array(source, chunk_size)
+
+
+def _iter_array(f: TextIO, chunk_size: int) -> Iterator[Any]:
+    """Decode array elements from an open text file."""
+    decoder = json.JSONDecoder()
+    buf = _ChunkBuffer(f, chunk_size)
+
+    if buf.peek() != "[":
+        raise json.JSONDecodeError("Expected '[' at start of JSON array", buf.text, buf.pos)
+    buf.pos += 1
+
+    expect_value = True
+    after_comma = False
+    while True:
+        char = buf.peek()
+
+        if char == "]":
+            if after_comma:
+                raise json.JSONDecodeError("Trailing comma in JSON array", buf.text, buf.pos)
+            return
+        if char == "":
+            raise json.JSONDecodeError("Unterminated JSON array", buf.text, buf.pos)
+
+        if not expect_value:
+            if char != ",":
+                raise json.JSONDecodeError("Expected ',' or ']'", buf.text, buf.pos)
+            buf.pos += 1
+            expect_value = after_comma = True
+            continue
+
+        yield _decode_next(decoder, buf)
+        expect_value = after_comma = False
+
+
+def _decode_next(decoder: json.JSONDecoder, buf: _ChunkBuffer) -> Any:
+    """Decode one element, reading more input until it is complete."""
+    read_size = buf.chunk_size
+
+    while True:
+        try:
+            value, end = decoder.raw_decode(buf.text, buf.pos)
+        except json.JSONDecodeError:
+            # Incomplete element: read more (doubling, so huge elements stay linear)
+            if not buf.fill(read_size):
+                raise
+            read_size *= 2
+            continue
+
+        # A number cut at the chunk edge ("1." of "1.5") decodes as a shorter number;
+        # only accept it once something other than number characters follows
+        if _NUMBER_TAIL.match(buf.text, end) and buf.fill(read_size):
+            read_size *= 2
+            continue
+
+        buf.pos = end
+        return value
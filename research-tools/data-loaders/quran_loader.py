@@ -3,16 +3,22 @@ Quran Data Loader
 
 Tier 2 (Reusable Research Tool)
 
-Loads Quranic data from various sources (JSON, CSV) with support for
-multiple Qiraat and Narrations.
+Loads Quranic data from various sources (JSON, CSV, TXT, SQL, XML) with
+support for multiple Qiraat and Narrations.
 """
 
+import copy
+import hashlib
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 
+# Snapshot stage name for merged whole-ayah corpora
+WHOLE_AYAT_STAGE = "whole_ayat"
+
+
 @dataclass
 class QuranContext:
     """Context information for Quranic data."""
@@ -26,6 +32,54 @@ class QuranContext:
         return f"{self.qiraat} ({self.narration})"
 
 
+@dataclass
+class VerseIndex:
+    """
+    Lookup tables over a loaded dataset (see QuranLoader.build_verse_index).
+
+    The index holds the verse dicts of the data it was built from; rebuild
+    it after adding or removing verses.
+    """
+
+    surahs: Dict[int, List[Dict]]  # surah -> verse dicts in source order
+    verses: Dict[Tuple[int, int], Dict]  # (surah, verse) -> verse dict
+
+    def get(self, surah: int, verse: Optional[int] = None) -> Union[List, Dict]:
+        """
+        Look up a verse, or all verses of a surah, in O(1).
+
+        Raises:
+            ValueError: If the surah or verse is not found
+        """
+        if verse is None:
+            if surah not in self.surahs:
+                raise ValueError(f"Surah {surah} not found")
+            return self.surahs[surah]
+
+        verse_data = self.verses.get((surah, verse))
+        if verse_data is None:
+            if surah not in self.surahs:
+                raise ValueError(f"Surah {surah} not found")
+            raise ValueError(f"Verse {surah}:{verse} not found")
+        return verse_data
+
+    def get_many(self, refs: Iterable[Tuple[int, int]]) -> List[Dict]:
+        """
+        Look up many (surah, verse) refs, in the order given.
+
+        Raises:
+            ValueError: If any reference is not found
+        """
+        refs = list(refs)
+        results = [self.verses.get(ref) for ref in refs]
+        missing = [ref for ref, result in zip(refs, results) if result is None]
+        if missing:
+            shown = ", ".join(f"{s}:{v}" for s, v in missing[:10])
+            more = f" (+{len(missing) - 10} more)" if len(missing) > 10 else ""
+            raise ValueError(f"Verses not found: {shown}{more}")
+        return results
+
+
 class QuranLoader:
     """
     Load Quranic data from various sources.
@@ -36,14 +90,22 @@ class QuranLoader:
     - Multiple Qiraat/Narrations
     """
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """
         Initialize loader.
 
         Args:
             data_dir: Base directory for data files. If None, uses current directory.
+            cache_dir: Directory for compiled corpus snapshots. If None, snapshots are disabled.
         """
         self.data_dir = Path(data_dir) if data_dir else Path.cwd()
+        self.snapshot_cache = None
+        # Source path -> ((size, mtime_ns) of the source, whole-ayah corpus)
+        self._whole_ayat: Dict[Path, Tuple[Tuple[int, int], object]] = {}
+
+        if cache_dir:
+            from snapshot_cache import SnapshotCache
+            self.snapshot_cache = SnapshotCache(cache_dir)
 
     def load_json(
         self,
@@ -64,27 +126,171 @@ class QuranLoader:
             FileNotFoundError: If file doesn't exist
             json.JSONDecodeError: If JSON is malformed
         """
-        path = Path(file_path)
-        if not path.is_absolute():
-            path = self.data_dir / path
-
-        if not path.exists():
-            raise FileNotFoundError(f"Data file not found: {path}")
+        path = self._resolve_path(file_path)
 
         with open(path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        # Attach context metadata if provided
-        if context:
-            data['_context'] = {
-                'qiraat': context.qiraat,
-                'narration': context.narration,
-                'edition': context.edition,
-                'manuscript': context.manuscript
-            }
+        # Attach context metadata if provided (flat QS-QIRAAT lists have no slot for it)
+        if context and isinstance(data, dict):
+            data['_context'] = self._context_dict(context)
 
         return data
 
+    def iter_records(
+        self,
+        file_path: Union[str, Path],
+        chunk_size: int = 1 << 16
+    ) -> Iterator[Dict]:
+        """
+        Stream records from a JSON file whose top level is an array.
+
+        Records are yielded as soon as they are decoded, with memory bounded
+        by the chunk size plus one record, so validation, hashing or counting
+        can start before the file has been read.
+
+        Args:
+            file_path: Path to JSON file (absolute or relative to data_dir)
+            chunk_size: Characters read per chunk
+
+        Yields:
+            Record dicts in file order
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            json.JSONDecodeError: If JSON is malformed
+
+        Example:
+            >>> verse_count = sum(1 for _ in loader.iter_records(hafs_path))
+        """
+        from json_stream import iter_json_array
+
+        return iter_json_array(self._resolve_path(file_path), chunk_size=chunk_size)
+
+    def load_records(
+        self,
+        file_path: Union[str, Path],
+        fmt: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Load typed QS-QIRAAT records from any shipped source format.
+
+        JSON, CSV, TXT, SQL and XML files all produce the same records:
+        integer fields as ints and page as an int or "first-last" span.
+
+        Args:
+            file_path: Path to data file (absolute or relative to data_dir)
+            fmt: Source format ("json", "csv", "txt", "sql", "xml");
+                 detected from the suffix if omitted
+
+        Returns:
+            List of typed record dicts in file order
+
+        Raises:
+            ValueError: If the format is unsupported or the file is malformed
+        """
+        from format_loader import load_typed_records
+
+        return load_typed_records(self._resolve_path(file_path), fmt)
+
+    def load_corpus(
+        self,
+        file_path: Union[str, Path],
+        context: Optional[QuranContext] = None
+    ):
+        """
+        Load a QS-QIRAAT riwaya JSON file into a columnar RiwayaCorpus.
+
+        Integer fields become NumPy arrays and text fields a single UTF-8
+        buffer with offsets, which is far smaller than a list of dicts and
+        allows vectorized filtering by surah or page. If the loader has a
+        cache_dir, a valid snapshot is memory-mapped instead of parsing JSON,
+        and a fresh snapshot is written after every rebuild.
+
+        Args:
+            file_path: Path to QS-QIRAAT JSON file (absolute or relative to data_dir)
+            context: Optional context information to attach to the corpus
+
+        Returns:
+            RiwayaCorpus
+
+        Example:
+            >>> loader = QuranLoader(data_dir=Path("data/QS - QIRAAT"))
+            >>> corpus = loader.load_corpus(hafs_path)
+            >>> len(corpus.surah(2))
+            286
+        """
+        from riwaya_corpus import RiwayaCorpus
+
+        path = self._resolve_path(file_path)
+
+        if self.snapshot_cache:
+            corpus = self.snapshot_cache.load(path)
+            if corpus is not None:
+                corpus.context = self._context_dict(context)
+                return corpus
+
+        raw = path.read_bytes()
+        records = json.loads(raw)
+        if not isinstance(records, list):
+            raise ValueError("Expected a QS-QIRAAT record list")
+
+        corpus = RiwayaCorpus.from_records(records, context=self._context_dict(context))
+
+        if self.snapshot_cache:
+            self.snapshot_cache.store(path, corpus, source_sha256=hashlib.sha256(raw).hexdigest())
+
+        return corpus
+
+    def load_whole_ayat(
+        self,
+        file_path: Union[str, Path],
+        context: Optional[QuranContext] = None
+    ):
+        """
+        Load a riwaya as canonical whole-ayah records.
+
+        Pipeline stage on top of load_corpus: ayat split across pages are
+        merged into one row with their text, page span (page .. page_end)
+        and line span. The result is memoized per loader while the source
+        file's size and mtime are unchanged and, if the loader has a
+        cache_dir, persisted as its own snapshot so other tools reuse it
+        without re-merging. Each call returns a shallow copy with its own
+        context; the column arrays are shared and must not be modified.
+
+        Args:
+            file_path: Path to QS-QIRAAT JSON file (absolute or relative to data_dir)
+            context: Optional context information to attach to the corpus
+
+        Returns:
+            RiwayaCorpus with one row per (sura_no, aya_no)
+
+        Example:
+            >>> ayat = loader.load_whole_ayat(hafs_path)
+            >>> ayat.record(0)["fragment_count"]
+            1
+        """
+        from riwaya_corpus import merge_split_ayat
+
+        path = self._resolve_path(file_path).resolve()
+        stat = path.stat()
+        source_key = (stat.st_size, stat.st_mtime_ns)
+
+        memo = self._whole_ayat.get(path)
+        corpus = memo[1] if memo is not None and memo[0] == source_key else None
+        if corpus is None and self.snapshot_cache:
+            corpus = self.snapshot_cache.load(path, stage=WHOLE_AYAT_STAGE)
+
+        if corpus is None:
+            corpus = merge_split_ayat(self.load_corpus(path))
+            if self.snapshot_cache:
+                self.snapshot_cache.store(path, corpus, stage=WHOLE_AYAT_STAGE)
+
+        self._whole_ayat[path] = (source_key, corpus)
+        result = copy.copy(corpus)
+        result.context = self._context_dict(context)
+        return result
+
     def load_qiraat_dataset(
         self,
         qiraat: str,
@@ -122,35 +328,110 @@ class QuranLoader:
             filename = f"{narration.lower()}.json"
             return self.load_json(filename, context=context)
 
-    def get_verses(self, data: Dict, surah: int, verse: Optional[int] = None) -> Union[List, Dict]:
+    def build_verse_index(self, data: Union[Dict, List]) -> VerseIndex:
         """
-        Extract verse(s) from loaded data.
+        Build a (surah, verse) index over loaded data.
+
+        Supports both the nested format ({'surahs': [{'number', 'verses'}]})
+        and the flat QS-QIRAAT record list (sura_no / aya_no fields). Build
+        it once and pass it to get_verses / get_verses_many (or use its own
+        get / get_many) for repeated O(1) lookups.
 
         Args:
             data: Loaded Quran data
+
+        Returns:
+            VerseIndex
+
+        Raises:
+            ValueError: If data format is not recognized
+
+        Example:
+            >>> index = loader.build_verse_index(hafs_data)
+            >>> loader.get_verses(index, 2, 255)
+        """
+        index = VerseIndex(surahs={}, verses={})
+
+        if isinstance(data, dict) and 'surahs' in data:
+            for surah_data in data['surahs']:
+                verses = surah_data.get('verses', [])
+                index.surahs.setdefault(surah_data['number'], verses)
+                for verse_data in verses:
+                    ref = (surah_data['number'], verse_data['number'])
+                    index.verses.setdefault(ref, verse_data)
+            return index
+
+        if isinstance(data, list):
+            for record in data:
+                ref = (record['sura_no'], record['aya_no'])
+                index.surahs.setdefault(ref[0], []).append(record)
+                # Keep the first record if an ayah is repeated
+                index.verses.setdefault(ref, record)
+            return index
+
+        raise ValueError("Unexpected data format")
+
+    def get_verses(
+        self,
+        data: Union[Dict, List, VerseIndex],
+        surah: int,
+        verse: Optional[int] = None
+    ) -> Union[List, Dict]:
+        """
+        Extract verse(s) from loaded data.
+
+        Raw data is scanned for this one lookup. For repeated lookups, build
+        a VerseIndex once (build_verse_index) and pass it instead.
+
+        Args:
+            data: VerseIndex, or loaded Quran data (nested dict or flat
+                  QS-QIRAAT record list)
             surah: Surah number (1-114)
             verse: Optional verse number. If None, returns all verses in surah.
 
         Returns:
             Single verse dict if verse specified, otherwise list of verses
         """
-        # This is a placeholder - actual implementation depends on QS-QIRAAT schema
-        # Will be refined based on actual data structure
+        if isinstance(data, VerseIndex):
+            return data.get(surah, verse)
+        return self._scan_verses(data, surah, verse)
 
-        if 'surahs' in data:
-            surah_data = next((s for s in data['surahs'] if s['number'] == surah), None)
-            if not surah_data:
-                raise ValueError(f"Surah {surah} not found")
+    def get_verses_many(
+        self,
+        data: Union[Dict, List, VerseIndex],
+        refs: Iterable[Tuple[int, int]]
+    ) -> List[Dict]:
+        """
+        Look up many verses in one call.
 
-            if verse is None:
-                return surah_data.get('verses', [])
-            else:
-                verse_data = next((v for v in surah_data['verses'] if v['number'] == verse), None)
-                if not verse_data:
-                    raise ValueError(f"Verse {surah}:{verse} not found")
-                return verse_data
+        Raw data is scanned once for the requested refs only; pass a
+        VerseIndex to reuse the lookup tables across calls.
 
-        raise ValueError("Unexpected data format")
+        Args:
+            data: VerseIndex, or loaded Quran data (nested dict or flat
+                  QS-QIRAAT record list)
+            refs: Iterable of (surah, verse) tuples
+
+        Returns:
+            List of verse dicts in the order of refs
+
+        Raises:
+            ValueError: If any reference is not found
+
+        Example:
+            >>> loader.get_verses_many(hafs_data, [(1, 1), (2, 255), (114, 6)])
+        """
+        if isinstance(data, VerseIndex):
+            return data.get_many(refs)
+        refs = list(refs)
+        wanted = set(refs)
+        found: Dict[Tuple[int, int], Dict] = {}
+        for ref, verse_data in self._iter_verses(data):
+            if ref in wanted and ref not in found:
+                found[ref] = verse_data
+                if len(found) == len(wanted):
+                    break
+        return VerseIndex(surahs={}, verses=found).get_many(refs)
 
     def get_text(self, verse_data: Dict) -> str:
         """
@@ -163,8 +444,76 @@ class QuranLoader:
             Verse text string
         """
         # Flexible extraction - try multiple common field names
-        for field in ['text', 'verse_text', 'content', 'ayah']:
+        for field in ['text', 'verse_text', 'content', 'ayah', 'aya_text']:
             if field in verse_data:
                 return verse_data[field]
 
         raise ValueError("No text field found in verse data")
+
+    def _scan_verses(
+        self, data: Union[Dict, List], surah: int, verse: Optional[int]
+    ) -> Union[List, Dict]:
+        """Find verse(s) in raw data without building an index."""
+        if isinstance(data, dict) and 'surahs' in data:
+            surah_data = next((s for s in data['surahs'] if s['number'] == surah), None)
+            if not surah_data:
+                raise ValueError(f"Surah {surah} not found")
+            if verse is None:
+                return surah_data.get('verses', [])
+            verse_data = next(
+                (v for v in surah_data.get('verses', []) if v['number'] == verse), None
+            )
+            if not verse_data:
+                raise ValueError(f"Verse {surah}:{verse} not found")
+            return verse_data
+
+        if isinstance(data, list):
+            if verse is None:
+                records = [r for r in data if r['sura_no'] == surah]
+                if not records:
+                    raise ValueError(f"Surah {surah} not found")
+                return records
+            record = next(
+                (r for r in data if r['sura_no'] == surah and r['aya_no'] == verse), None
+            )
+            if record is None:
+                if not any(r['sura_no'] == surah for r in data):
+                    raise ValueError(f"Surah {surah} not found")
+                raise ValueError(f"Verse {surah}:{verse} not found")
+            return record
+
+        raise ValueError("Unexpected data format")
+
+    def _iter_verses(self, data: Union[Dict, List]) -> Iterator[Tuple[Tuple[int, int], Dict]]:
+        """Yield ((surah, verse), verse dict) over raw data in source order."""
+        if isinstance(data, dict) and 'surahs' in data:
+            for surah_data in data['surahs']:
+                for verse_data in surah_data.get('verses', []):
+                    yield (surah_data['number'], verse_data['number']), verse_data
+        elif isinstance(data, list):
+            for record in data:
+                yield (record['sura_no'], record['aya_no']), record
+        else:
+            raise ValueError("Unexpected data format")
+
+    def _resolve_path(self, file_path: Union[str, Path]) -> Path:
+        """Resolve a path relative to data_dir and check it exists."""
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = self.data_dir / path
+
+        if not path.exists():
+            raise FileNotFoundError(f"Data file not found: {path}")
+
+        return path
+
+    def _context_dict(self, context: Optional[QuranContext]) -> Optional[Dict]:
+        """Convert a QuranContext to its metadata dict form."""
+        if not context:
+            return None
+        return {
+            'qiraat': context.qiraat,
+            'narration': context.narration,
+            'edition': context.edition,
+            'manuscript': context.manuscript
+        }
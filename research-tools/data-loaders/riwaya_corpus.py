@@ -0,0 +1,457 @@
+"""
+Riwaya Corpus
+
+Tier 2 (Reusable Research Tool)
+
+Columnar in-memory store for QS-QIRAAT riwaya data. Integer fields are held
+as NumPy arrays and text fields as one UTF-8 buffer with offsets, so several
+riwayat can be loaded side by side and filtered without Python loops.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+# QS-QIRAAT record layout (field order matches the source JSON files)
+RECORD_FIELDS = (
+    "id", "jozz", "page", "sura_no", "sura_name_en", "sura_name_ar",
+    "line_start", "line_end", "aya_no", "aya_text", "aya_text_emlaey",
+)
+
+INT_FIELDS = ("id", "jozz", "page", "sura_no", "line_start", "line_end", "aya_no")
+TEXT_FIELDS = ("aya_text", "aya_text_emlaey")
+
+# Only the Hafs files ship the emlaey (search) text
+OPTIONAL_FIELDS = ("aya_text_emlaey",)
+
+# Stored once per surah instead of once per ayah
+SURAH_NAME_FIELDS = ("sura_name_en", "sura_name_ar")
+
+# Ayat spanning two pages carry a "34-35" style page value in some riwayat;
+# the column store keeps the first page in "page" and the last in "page_end"
+PAGE_END_FIELD = "page_end"
+
+# Number of source records merged into a whole-ayah row
+FRAGMENT_COUNT_FIELD = "fragment_count"
+
+INT_DTYPE = np.int32
+OFFSET_DTYPE = np.int64
+
+AYA_MARKER_SEPARATOR = "\xa0"
+
+
+def parse_page(value: Union[int, str]) -> Tuple[int, int]:
+    """
+    Parse a QS-QIRAAT page value into a (first, last) page span.
+
+    Args:
+        value: Page number, numeric string, or "first-last" range string
+
+    Returns:
+        Tuple of (first_page, last_page)
+    """
+    if isinstance(value, int):
+        return (value, value)
+
+    first, _, last = str(value).partition("-")
+    return (int(first), int(last or first))
+
+
+def strip_aya_marker(text: str) -> str:
+    """
+    Remove the trailing NBSP + aya marker glyph from aya_text.
+
+    Args:
+        text: Ayah text as stored in QS-QIRAAT aya_text
+
+    Returns:
+        Text without the end-of-ayah marker
+    """
+    if len(text) >= 2 and text[-2] == AYA_MARKER_SEPARATOR:
+        return text[:-2]
+    return text
+
+
+def format_page(first: int, last: int, page_format: str = "int") -> Union[int, str]:
+    """
+    Format a page span back into its QS-QIRAAT source form.
+
+    Args:
+        first: First page of the ayah
+        last: Last page of the ayah
+        page_format: "int" for integer pages, "text" for string pages
+
+    Returns:
+        Page value as stored in the source file
+    """
+    if first != last:
+        return f"{first}-{last}"
+    return first if page_format == "int" else str(first)
+
+
+class TextColumn:
+    """
+    Variable-length text column stored as a single UTF-8 buffer.
+
+    Value ``i`` is ``buffer[offsets[i]:offsets[i + 1]]`` decoded as UTF-8.
+    """
+
+    def __init__(self, buffer: np.ndarray, offsets: np.ndarray):
+        """
+        Initialize column.
+
+        Args:
+            buffer: uint8 array holding all values back to back
+            offsets: int64 array of length n + 1 with value boundaries
+        """
+        self.buffer = buffer
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, values: Sequence[str]) -> "TextColumn":
+        """
+        Build a column from Python strings.
+
+        Args:
+            values: Text values
+
+        Returns:
+            TextColumn holding the encoded values
+        """
+        encoded = [v.encode("utf-8") for v in values]
+        lengths = np.fromiter((len(e) for e in encoded), dtype=OFFSET_DTYPE, count=len(encoded))
+
+        offsets = np.zeros(len(encoded) + 1, dtype=OFFSET_DTYPE)
+        np.cumsum(lengths, out=offsets[1:])
+
+        buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(buffer, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.buffer[start:end].tobytes().decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        data = self.buffer.tobytes()
+        offsets = self.offsets.tolist()
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            yield data[start:end].decode("utf-8")
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Encoded byte length of every value."""
+        return np.diff(self.offsets)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the buffer and offsets."""
+        return self.buffer.nbytes + self.offsets.nbytes
+
+    def take(self, indices: np.ndarray) -> "TextColumn":
+        """
+        Gather a subset of values into a new compact column.
+
+        Args:
+            indices: Row indices to keep (in output order)
+
+        Returns:
+            New TextColumn
+        """
+        starts = self.offsets[:-1][indices]
+        lengths = self.lengths[indices]
+
+        offsets = np.zeros(len(indices) + 1, dtype=OFFSET_DTYPE)
+        np.cumsum(lengths, out=offsets[1:])
+
+        # Byte positions in the source buffer, built without a Python loop
+        byte_index = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return TextColumn(self.buffer[byte_index], offsets)
+
+
+class RiwayaCorpus:
+    """
+    Columnar store for one riwaya of the QS-QIRAAT dataset.
+
+    Integer fields (sura_no, aya_no, page, ...) are NumPy arrays, text fields
+    are TextColumns, and surah names are kept once per surah.
+
+    Example:
+        >>> corpus = RiwayaCorpus.from_records(records)
+        >>> baqarah = corpus.surah(2)
+        >>> baqarah["aya_no"].max()
+        286
+    """
+
+    def __init__(
+        self,
+        int_columns: Dict[str, np.ndarray],
+        text_columns: Dict[str, TextColumn],
+        surah_names: Optional[Dict[int, Dict[str, str]]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        page_format: str = "int"
+    ):
+        """
+        Initialize corpus.
+
+        Args:
+            int_columns: Integer columns by field name (equal lengths)
+            text_columns: Text columns by field name (equal lengths)
+            surah_names: Surah number -> {"sura_name_en", "sura_name_ar"}
+            context: Optional Qiraat/Narration context metadata
+            page_format: How the source stored pages ("int" or "text")
+        """
+        lengths = {len(c) for c in int_columns.values()} | {len(c) for c in text_columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have mismatched lengths: {sorted(lengths)}")
+
+        self.int_columns = int_columns
+        self.text_columns = text_columns
+        self.surah_names = surah_names or {}
+        self.context = context
+        self.page_format = page_format
+
+    @classmethod
+    def from_records(
+        cls,
+        records: List[Dict[str, Any]],
+        context: Optional[Dict[str, Any]] = None
+    ) -> "RiwayaCorpus":
+        """
+        Build a corpus from QS-QIRAAT per-ayah records.
+
+        Args:
+            records: List of record dicts as found in the JSON files
+                    (aya_text_emlaey is optional)
+            context: Optional Qiraat/Narration context metadata
+
+        Returns:
+            RiwayaCorpus
+
+        Raises:
+            ValueError: If a record is missing a required field
+        """
+        first = records[0] if records else {}
+        required = [f for f in RECORD_FIELDS if f not in OPTIONAL_FIELDS]
+        missing = [f for f in required if records and f not in first]
+        if missing:
+            raise ValueError(f"Missing fields in records: {missing}")
+
+        count = len(records)
+        int_columns = {
+            name: np.fromiter((r[name] for r in records), dtype=INT_DTYPE, count=count)
+            for name in INT_FIELDS
+            if name != "page"
+        }
+
+        pages = np.array([parse_page(r["page"]) for r in records], dtype=INT_DTYPE).reshape(-1, 2)
+        int_columns["page"] = pages[:, 0].copy()
+        int_columns[PAGE_END_FIELD] = pages[:, 1].copy()
+        page_format = "text" if records and isinstance(first["page"], str) else "int"
+        text_columns = {
+            name: TextColumn.from_strings([r[name] for r in records])
+            for name in TEXT_FIELDS
+            if name in first or name not in OPTIONAL_FIELDS
+        }
+
+        surah_names: Dict[int, Dict[str, str]] = {}
+        for r in records:
+            if r["sura_no"] not in surah_names:
+                surah_names[r["sura_no"]] = {f: r[f] for f in SURAH_NAME_FIELDS}
+
+        return cls(int_columns, text_columns, surah_names, context=context, page_format=page_format)
+
+    def __len__(self) -> int:
+        for column in self.int_columns.values():
+            return len(column)
+        for column in self.text_columns.values():
+            return len(column)
+        return 0
+
+    def __getitem__(self, name: str) -> Union[np.ndarray, TextColumn]:
+        """Get a column by field name."""
+        if name in self.int_columns:
+            return self.int_columns[name]
+        if name in self.text_columns:
+            return self.text_columns[name]
+        raise KeyError(f"Unknown column: {name}")
+
+    @property
+    def fields(self) -> List[str]:
+        """Column names (integer columns first, then text columns)."""
+        return list(self.int_columns) + list(self.text_columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the column data."""
+        return (
+            sum(c.nbytes for c in self.int_columns.values())
+            + sum(c.nbytes for c in self.text_columns.values())
+        )
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """
+        Materialize one row as a record dict.
+
+        Args:
+            index: Row index
+
+        Returns:
+            Dict in the QS-QIRAAT field order (extra columns appended)
+        """
+        return next(self.select([index]).iter_records())
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over rows as record dicts.
+
+        Yields:
+            Record dicts in row order, with page values in their source form
+        """
+        fields = self._record_fields()
+        columns = {name: col.tolist() for name, col in self.int_columns.items()}
+        texts = {name: iter(col) for name, col in self.text_columns.items()}
+        sura_numbers = columns.get("sura_no")
+        page_ends = columns.get(PAGE_END_FIELD)
+
+        for i in range(len(self)):
+            names = self.surah_names.get(sura_numbers[i], {}) if sura_numbers else {}
+            row = {}
+            for name in fields:
+                if name == "page" and page_ends:
+                    row[name] = format_page(columns[name][i], page_ends[i], self.page_format)
+                elif name in columns:
+                    row[name] = columns[name][i]
+                elif name in texts:
+                    row[name] = next(texts[name])
+                else:
+                    row[name] = names.get(name)
+            yield row
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize all rows as record dicts."""
+        return list(self.iter_records())
+
+    def select(self, selector: Union[np.ndarray, Sequence[int]]) -> "RiwayaCorpus":
+        """
+        Create a sub-corpus from a boolean mask or row indices.
+
+        Args:
+            selector: Boolean mask of length len(self), or integer row indices
+
+        Returns:
+            New RiwayaCorpus with only the selected rows
+        """
+        selector = np.asarray(selector)
+        indices = np.flatnonzero(selector) if selector.dtype == bool else selector.astype(np.intp)
+
+        int_columns = {name: col[indices] for name, col in self.int_columns.items()}
+        text_columns = {name: col.take(indices) for name, col in self.text_columns.items()}
+
+        sura_numbers = int_columns.get("sura_no", np.zeros(0, dtype=INT_DTYPE))
+        kept = set(np.unique(sura_numbers).tolist())
+        surah_names = {k: v for k, v in self.surah_names.items() if k in kept}
+
+        return RiwayaCorpus(
+            int_columns, text_columns, surah_names,
+            context=self.context, page_format=self.page_format
+        )
+
+    def surah(self, sura_no: int) -> "RiwayaCorpus":
+        """Get all rows of a surah."""
+        return self.select(self.int_columns["sura_no"] == sura_no)
+
+    def page(self, page: int) -> "RiwayaCorpus":
+        """Get all rows on a page (including ayat that continue onto it)."""
+        first = self.int_columns["page"]
+        last = self.int_columns.get(PAGE_END_FIELD, first)
+        return self.select((first <= page) & (last >= page))
+
+    def surah_verse_counts(self) -> Dict[int, int]:
+        """
+        Count distinct ayat per surah.
+
+        Returns:
+            Dictionary of sura_no -> number of distinct aya_no values
+        """
+        keys = np.unique(
+            self.int_columns["sura_no"].astype(np.int64) * 1000 + self.int_columns["aya_no"]
+        )
+        surahs, counts = np.unique(keys // 1000, return_counts=True)
+        return dict(zip(surahs.tolist(), counts.tolist()))
+
+    def _record_fields(self) -> List[str]:
+        """Record field order: QS-QIRAAT layout first, then any extra columns."""
+        known = [
+            f for f in RECORD_FIELDS
+            if f in self.int_columns or f in self.text_columns
+            or (f in SURAH_NAME_FIELDS and "sura_no" in self.int_columns)
+        ]
+        extra = [f for f in self.fields if f not in RECORD_FIELDS and f != PAGE_END_FIELD]
+        return known + extra
+
+
+def merge_split_ayat(corpus: RiwayaCorpus) -> RiwayaCorpus:
+    """
+    Merge ayat split across several records into canonical whole-ayah rows.
+
+    Rows are grouped by (sura_no, aya_no) in one sorted pass. Each output row
+    keeps the first id/jozz, the page span (page .. page_end) and line span
+    (line_start of the first fragment, line_end of the last) of its group,
+    plus a fragment_count column. Fragment texts are joined with a space;
+    every fragment but the last loses its aya marker, so merged and unsplit
+    ayat end the same way.
+
+    Args:
+        corpus: Corpus as loaded from a QS-QIRAAT file
+
+    Returns:
+        New RiwayaCorpus with one row per (sura_no, aya_no), in canonical order
+    """
+    if not len(corpus):
+        return corpus
+
+    keys = corpus["sura_no"].astype(np.int64) * 1000 + corpus["aya_no"]
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    ends = np.r_[starts[1:], len(order)] - 1
+    first_rows, last_rows = order[starts], order[ends]
+
+    int_columns = {
+        name: column[first_rows]
+        for name, column in corpus.int_columns.items()
+        if name not in ("line_end", PAGE_END_FIELD, FRAGMENT_COUNT_FIELD)
+    }
+    int_columns["line_end"] = corpus["line_end"][last_rows]
+
+    page_end = corpus.int_columns.get(PAGE_END_FIELD, corpus["page"])
+    int_columns["page"] = np.minimum.reduceat(corpus["page"][order], starts)
+    int_columns[PAGE_END_FIELD] = np.maximum.reduceat(page_end[order], starts)
+
+    fragment_counts = np.diff(np.r_[starts, len(order)]).astype(INT_DTYPE)
+    int_columns[FRAGMENT_COUNT_FIELD] = fragment_counts
+
+    split_groups = np.flatnonzero(fragment_counts > 1)
+    text_columns = {}
+    for name, column in corpus.text_columns.items():
+        if not len(split_groups):
+            text_columns[name] = column.take(first_rows)
+            continue
+
+        values = list(column.take(first_rows))
+        for group in split_groups.tolist():
+            fragments = [column[i] for i in order[starts[group]:ends[group] + 1].tolist()]
+            values[group] = " ".join(
+                [strip_aya_marker(f) for f in fragments[:-1]] + [fragments[-1]]
+            )
+        text_columns[name] = TextColumn.from_strings(values)
+
+    return RiwayaCorpus(
+        int_columns, text_columns, dict(corpus.surah_names),
+        context=corpus.context, page_format=corpus.page_format
+    )
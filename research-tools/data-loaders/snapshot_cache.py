@@ -0,0 +1,256 @@
+"""
+Snapshot Cache
+
+Tier 2 (Reusable Research Tool)
+
+On-disk compiled snapshots of parsed riwaya data. Each snapshot stores the
+RiwayaCorpus integer columns as .npy files and every text column as a raw
+UTF-8 blob plus offsets, all memory-mapped on load, so warm loads skip JSON
+parsing entirely.
+
+Snapshots are keyed by source file path and validated against the source
+size, mtime and SHA-256 recorded when the snapshot was built.
+
+Each store writes its files into a new data-{token}/ directory inside the
+snapshot and then atomically replaces the manifest that names it, so a
+reader still mapping the previous files never sees them change; older data
+directories are removed afterwards (on POSIX, open maps stay valid).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from riwaya_corpus import OFFSET_DTYPE, RiwayaCorpus, TextColumn
+
+
+SNAPSHOT_FORMAT_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """
+    Compute SHA-256 of a file without reading it into memory at once.
+
+    Args:
+        path: File path
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex-encoded hash
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SnapshotCache:
+    """
+    Store and reload compiled RiwayaCorpus snapshots.
+
+    A snapshot is valid while the source file keeps the size and mtime it had
+    when the snapshot was built. If only the mtime changed (e.g. after a
+    checkout), the SHA-256 decides; a matching hash refreshes the snapshot
+    instead of rebuilding it.
+
+    Example:
+        >>> cache = SnapshotCache(Path(".cache/qs-qiraat"))
+        >>> corpus = cache.load(source) or build_and_store(source)
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], verify_hash: bool = False):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory holding snapshots (created on first store)
+            verify_hash: If True, always compare the source SHA-256 on load,
+                        not only when size/mtime changed
+        """
+        self.cache_dir = Path(cache_dir)
+        self.verify_hash = verify_hash
+
+    def snapshot_dir(self, source_path: Union[str, Path], stage: str = "corpus") -> Path:
+        """
+        Get the snapshot directory for a source file.
+
+        Args:
+            source_path: Source data file
+            stage: Pipeline stage the snapshot belongs to (e.g., "corpus")
+
+        Returns:
+            Snapshot directory path
+        """
+        source = Path(source_path).resolve()
+        key = hashlib.sha1(f"{source}|{stage}".encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{source.stem}-{stage}-{key}"
+
+    def load(
+        self,
+        source_path: Union[str, Path],
+        stage: str = "corpus"
+    ) -> Optional[RiwayaCorpus]:
+        """
+        Load a snapshot if it is still valid for the source file.
+
+        Args:
+            source_path: Source data file
+            stage: Pipeline stage the snapshot belongs to
+
+        Returns:
+            Memory-mapped RiwayaCorpus, or None if missing or stale
+        """
+        snapshot = self.snapshot_dir(source_path, stage)
+        manifest = self._read_manifest(snapshot)
+        if manifest is None or manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            return None
+
+        if not self._is_fresh(Path(source_path), snapshot, manifest):
+            return None
+
+        data = snapshot / manifest["data_dir"]
+        try:
+            int_columns = {
+                name: np.load(data / f"{name}.npy", mmap_mode='r')
+                for name in manifest["int_columns"]
+            }
+            text_columns = {
+                name: TextColumn(
+                    self._map_blob(data / f"{name}.blob"),
+                    np.load(data / f"{name}.offsets.npy", mmap_mode='r')
+                )
+                for name in manifest["text_columns"]
+            }
+        except FileNotFoundError:
+            return None  # Replaced by a concurrent store after the manifest was read
+        surah_names = {int(k): v for k, v in manifest["surah_names"].items()}
+
+        return RiwayaCorpus(
+            int_columns, text_columns, surah_names, page_format=manifest["page_format"]
+        )
+
+    def store(
+        self,
+        source_path: Union[str, Path],
+        corpus: RiwayaCorpus,
+        stage: str = "corpus",
+        source_sha256: Optional[str] = None
+    ) -> Path:
+        """
+        Write a snapshot for a source file.
+
+        Args:
+            source_path: Source data file the corpus was built from
+            corpus: Corpus to persist
+            stage: Pipeline stage the snapshot belongs to
+            source_sha256: Source hash if already known (computed otherwise)
+
+        Returns:
+            Snapshot directory path
+        """
+        source = Path(source_path)
+        snapshot = self.snapshot_dir(source, stage)
+
+        # Fresh files only: readers may still map the previous snapshot's files
+        data_name = f"data-{uuid.uuid4().hex[:16]}"
+        data = snapshot / data_name
+        data.mkdir(parents=True)
+
+        for name, column in corpus.int_columns.items():
+            np.save(data / f"{name}.npy", np.ascontiguousarray(column))
+
+        for name, column in corpus.text_columns.items():
+            (data / f"{name}.blob").write_bytes(column.buffer.tobytes())
+            np.save(data / f"{name}.offsets.npy", column.offsets.astype(OFFSET_DTYPE))
+
+        stat = source.stat()
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "stage": stage,
+            "data_dir": data_name,
+            "source": {
+                "path": str(source.resolve()),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": source_sha256 or file_sha256(source),
+            },
+            "row_count": len(corpus),
+            "int_columns": list(corpus.int_columns),
+            "text_columns": list(corpus.text_columns),
+            "surah_names": {str(k): v for k, v in corpus.surah_names.items()},
+            "page_format": corpus.page_format,
+        }
+        self._write_manifest(snapshot, manifest)
+        self._remove_stale_data(snapshot, keep=data_name)
+
+        return snapshot
+
+    def invalidate(self, source_path: Union[str, Path], stage: str = "corpus"):
+        """
+        Mark the snapshot for a source file as stale.
+
+        Args:
+            source_path: Source data file
+            stage: Pipeline stage the snapshot belongs to
+        """
+        (self.snapshot_dir(source_path, stage) / MANIFEST_NAME).unlink(missing_ok=True)
+
+    def _is_fresh(self, source: Path, snapshot: Path, manifest: Dict) -> bool:
+        """Check the recorded size/mtime/SHA-256 against the source file."""
+        if not source.exists():
+            return False
+
+        recorded = manifest["source"]
+        stat = source.stat()
+
+        if stat.st_size != recorded["size"]:
+            return False
+
+        if stat.st_mtime_ns == recorded["mtime_ns"] and not self.verify_hash:
+            return True
+
+        if file_sha256(source) != recorded["sha256"]:
+            return False
+
+        # Same content with a new mtime: refresh so the next load is stat-only
+        if stat.st_mtime_ns != recorded["mtime_ns"]:
+            recorded["mtime_ns"] = stat.st_mtime_ns
+            self._write_manifest(snapshot, manifest)
+
+        return True
+
+    def _remove_stale_data(self, snapshot: Path, keep: str):
+        """Delete data directories no longer named by the manifest."""
+        current = self._read_manifest(snapshot) or {}
+        for path in snapshot.glob("data-*"):
+            if path.name not in (keep, current.get("data_dir")):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _map_blob(self, path: Path) -> np.ndarray:
+        """Memory-map a text blob (np.memmap rejects empty files)."""
+        if path.stat().st_size == 0:
+            return np.zeros(0, dtype=np.uint8)
+        return np.memmap(path, dtype=np.uint8, mode='r')
+
+    def _read_manifest(self, snapshot: Path) -> Optional[Dict]:
+        """Read a snapshot manifest, or None if absent or unreadable."""
+        try:
+            with open(snapshot / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_manifest(self, snapshot: Path, manifest: Dict):
+        """Atomically write a snapshot manifest."""
+        tmp_path = snapshot / f"{MANIFEST_NAME}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, snapshot / MANIFEST_NAME)
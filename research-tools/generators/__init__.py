@@ -3,3 +3,51 @@ Generators
 
 Layer data generation utilities.
 """
+
+from lazy_exports import TYPE_CHECKING, attach
+
+# Public name -> defining submodule; imported on first attribute access
+_LAZY_ATTRS = {
+    "BuildCache": "build_cache",
+    "BuildResult": "build_cache",
+    "CanonicalEncoder": "canonical_json",
+    "canonical_dumps": "canonical_json",
+    "LayerContainer": "layer_container",
+    "LayerContainerWriter": "layer_container",
+    "write_layer_container": "layer_container",
+    "LayerGenerator": "layer_generator",
+    "LayerMetadata": "layer_generator",
+    "iter_layer_entities": "layer_generator",
+    "read_layer_metadata": "layer_generator",
+    "parse_metadata_line": "layer_generator",
+    "ShardedLayer": "layer_shards",
+    "ShardInfo": "layer_shards",
+    "write_layer_shards": "layer_shards",
+    "MerkleTree": "merkle_tree",
+    "MerkleDiff": "merkle_tree",
+    "RelationshipIndex": "relationship_index",
+    "SemanticHasher": "semantic_hasher",
+    "uuid_generator": "uuid_generator",
+    "UUIDTable": "uuid_tables",
+    "UUIDTables": "uuid_tables",
+    "UUIDResolver": "uuid_resolver",
+    "ResolvedID": "uuid_resolver",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from .build_cache import BuildCache, BuildResult
+    from .canonical_json import CanonicalEncoder, canonical_dumps
+    from .layer_container import LayerContainer, LayerContainerWriter, write_layer_container
+    from .layer_generator import (
+        LayerGenerator, LayerMetadata, iter_layer_entities, parse_metadata_line,
+        read_layer_metadata,
+    )
+    from .layer_shards import ShardedLayer, ShardInfo, write_layer_shards
+    from .merkle_tree import MerkleDiff, MerkleTree
+    from .relationship_index import RelationshipIndex
+    from .semantic_hasher import SemanticHasher
+    from . import uuid_generator
+    from .uuid_tables import UUIDTable, UUIDTables
+    from .uuid_resolver import ResolvedID, UUIDResolver
@@ -0,0 +1,312 @@
+"""
+Layer Build Cache
+
+Tier 2 (Reusable Research Tool)
+
+Incremental layer builds. Each partition of a layer (see
+LayerGenerator.partitions(), e.g. one per surah) is keyed by the
+SemanticHasher hash of:
+- the layer name and number
+- the generator code version (code_version, or a hash of the source of
+  the modules defining its class and base classes)
+- the generator's hash algorithm
+- the generator parameters and the context
+- the partition key and the partition input content
+
+Outputs are stored content-addressed under the cache directory, so a
+rebuild regenerates only partitions whose key changed and reuses the rest.
+Fixing one surah's source therefore regenerates one partition per affected
+layer. A source given as a file path is keyed by the file's size and
+content hash (see file_fingerprint), so editing the file invalidates it;
+layers whose source is a key they load from (e.g. a riwaya name) must
+override partitions() to return the loaded content.
+
+Partitions are stored as JSON, and freshly generated partitions are merged
+in the same decoded form as cached ones, so a cold and an incremental
+build return equal data. Like saved layer files, that data is JSON-typed:
+16-byte binary IDs come back as UUID strings and tuples as lists.
+
+Cache layout:
+    {cache_dir}/{layer_name}/{key[:2]}/{key}.json
+
+Example:
+    >>> cache = BuildCache(".cache/layers")
+    >>> result = cache.build(generator, source_data, context)
+    >>> result.layer_data, result.rebuilt, result.reused
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from .semantic_hasher import SemanticHasher
+from .uuid_generator import json_default
+
+if TYPE_CHECKING:
+    from .layer_generator import LayerGenerator
+
+
+# Bump when the cache key composition or entry format changes
+CACHE_FORMAT_VERSION = 3
+
+
+@dataclass
+class BuildResult:
+    """Outcome of an incremental layer build."""
+
+    layer_name: str
+    layer_data: Dict[str, Any]
+    partition_keys: Dict[str, str]  # Partition -> cache key
+    rebuilt: List[str] = field(default_factory=list)  # Partitions generated
+    reused: List[str] = field(default_factory=list)  # Partitions loaded from cache
+
+
+class BuildCache:
+    """
+    Content-addressed cache of layer partition outputs.
+
+    The cache holds only a directory path, so it can be passed to worker
+    processes (e.g. by orchestration.LayerScheduler).
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for cached partition outputs
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hasher = SemanticHasher()
+
+    def build(
+        self,
+        generator: "LayerGenerator",
+        source_data: Any,
+        context: Dict[str, str],
+        dependencies: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> BuildResult:
+        """
+        Build a layer, regenerating only partitions whose inputs changed.
+
+        Args:
+            generator: Layer generator
+            source_data: Input data (format depends on layer)
+            context: Context dict with qiraat, narration, edition
+            dependencies: Layer name -> generated data of upstream layers
+
+        Returns:
+            BuildResult with the merged layer data and per-partition status
+        """
+        partitions = generator.partitions(source_data, context, dependencies or {})
+        base = self.base_key(generator, context)
+        result = BuildResult(generator.layer_name, {}, {})
+
+        parts = {}
+        for part_key, partition in partitions.items():
+            key = self.partition_key(base, part_key, partition)
+            result.partition_keys[part_key] = key
+
+            cached = self.get(generator.layer_name, key)
+            if cached is not None:
+                parts[part_key] = cached
+                result.reused.append(part_key)
+            else:
+                generated = generator.generate_partition(partition, context)
+                parts[part_key] = self.put(generator.layer_name, key, generated)
+                result.rebuilt.append(part_key)
+
+        result.layer_data = generator.merge_partitions(parts)
+        return result
+
+    def check_source(self, generator: "LayerGenerator", source_data: Any):
+        """
+        Check that a layer build's cache key will cover its source content.
+
+        A layer using the default partitions() is keyed by its source as
+        passed, which only works for in-memory data or a file path (hashed
+        by content). A key that the layer loads from is rejected.
+
+        Raises:
+            ValueError: If the source is a string or path that is not a file
+                        and the generator does not override partitions()
+        """
+        from .layer_generator import LayerGenerator
+
+        if type(generator).partitions is not LayerGenerator.partitions:
+            return
+        if isinstance(source_data, (str, os.PathLike)) and not os.path.isfile(source_data):
+            raise ValueError(
+                f"Layer {generator.layer_name}: source {str(source_data)!r} is not a file, "
+                "so the build cache cannot see its content; override partitions() "
+                "to return the loaded input"
+            )
+
+    def base_key(self, generator: "LayerGenerator", context: Dict[str, str]) -> str:
+        """
+        Hash everything that applies to all partitions of a layer build.
+
+        Returns:
+            Hex-encoded hash
+        """
+        return self.hasher.hash_dict({
+            "cache_format": CACHE_FORMAT_VERSION,
+            "layer": generator.layer_name,
+            "layer_number": generator.layer_number,
+            "code_version": code_version(generator),
+            "hash_algorithm": generator.hash_algorithm,
+            "parameters": generator.get_parameters(),
+            "context": context,
+        })
+
+    def partition_key(self, base_key: str, part_key: str, partition: Any) -> str:
+        """
+        Hash one partition's input on top of the layer base key.
+
+        Returns:
+            Hex-encoded hash
+        """
+        content_hash = self.hasher.hash_json(partition)
+        return self.hasher.hash_string(f"{base_key}:{part_key}:{content_hash}")
+
+    def get(self, layer_name: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached partition output.
+
+        Returns:
+            Partial layer data, or None if not cached
+        """
+        path = self._entry_path(layer_name, key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            return None  # Corrupt entry: treat as a miss, it will be rewritten
+
+    def put(self, layer_name: str, key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a partition output (written atomically).
+
+        Returns:
+            The data as get() will return it (decoded from the stored JSON)
+        """
+        path = self._entry_path(layer_name, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        encoded = json.dumps(data, ensure_ascii=False, default=json_default)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(encoded)
+        os.replace(tmp_path, path)
+        return json.loads(encoded)
+
+    def prune(self, layer_name: str, keep: Iterable[str]) -> int:
+        """
+        Delete cached entries of a layer except the given keys.
+
+        Args:
+            layer_name: Layer whose entries to prune
+            keep: Cache keys to keep (e.g. BuildResult.partition_keys values)
+
+        Returns:
+            Number of entries deleted
+        """
+        keep = set(keep)
+        removed = 0
+        for path in (self.cache_dir / layer_name).glob("*/*.json"):
+            if path.stem not in keep:
+                path.unlink()
+                removed += 1
+        return removed
+
+    def clear(self, layer_name: Optional[str] = None):
+        """Delete cached entries of one layer, or of all layers."""
+        target = self.cache_dir / layer_name if layer_name else self.cache_dir
+        shutil.rmtree(target, ignore_errors=True)
+
+    def _entry_path(self, layer_name: str, key: str) -> Path:
+        return self.cache_dir / layer_name / key[:2] / f"{key}.json"
+
+
+def code_version(generator: "LayerGenerator") -> str:
+    """
+    Get the code version of a generator.
+
+    Returns generator.code_version if set, otherwise a hash of the source of
+    every module that defines the generator's class or one of its base
+    classes, so edits to a base class invalidate the cache too. Helper
+    modules outside the class hierarchy are not covered: set code_version
+    for generators whose output depends on them.
+
+    Raises:
+        ValueError: If code_version is unset and a module's source is
+                    unavailable (e.g. a class defined interactively)
+    """
+    if generator.code_version is not None:
+        return str(generator.code_version)
+    cls = type(generator)
+    digest = hashlib.sha256()
+    for module_name in dict.fromkeys(base.__module__ for base in cls.__mro__):
+        if module_name in ("builtins", "abc"):
+            continue
+        try:
+            source = inspect.getsource(sys.modules[module_name])
+        except (KeyError, OSError, TypeError):
+            raise ValueError(
+                f"Source of {module_name} is unavailable; set "
+                f"{cls.__qualname__}.code_version explicitly"
+            ) from None
+        digest.update(f"{module_name}\0{len(source)}\0".encode('utf-8'))
+        digest.update(source.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: Any) -> Dict[str, Any]:
+    """
+    Describe a source file by content, for use in cache keys.
+
+    Args:
+        path: File path (str or PathLike)
+
+    Returns:
+        {"size": bytes, "sha256": hex digest of the contents}
+
+    Raises:
+        ValueError: If path is not a file
+    """
+    if not os.path.isfile(path):
+        raise ValueError(f"Source {str(path)!r} is not a file")
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+            size += len(block)
+    return {"size": size, "sha256": digest.hexdigest()}
+
+
+def surah_partitions(
+    records: Iterable[Dict[str, Any]],
+    surah_field: str = "sura_no"
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group records by surah into partitions keyed "s001".."s114".
+
+    Args:
+        records: Records with a surah number field (e.g. ayah dicts)
+        surah_field: Name of the surah number field
+
+    Returns:
+        Partition key -> records of that surah, in surah order
+    """
+    groups: Dict[int, List[Dict[str, Any]]] = {}
+    for record in records:
+        groups.setdefault(int(record[surah_field]), []).append(record)
+    return {f"s{surah:03d}": groups[surah] for surah in sorted(groups)}
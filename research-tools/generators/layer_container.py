@@ -0,0 +1,556 @@
+"""
+Layer Container
+
+Tier 2 (Reusable Research Tool)
+
+Compact binary file format for layer entities, an alternative to the JSON
+written by LayerGenerator.save(). Entities are stored column by column in
+one block per surah, each column segment optionally zlib-compressed, with a
+JSON footer indexing blocks by surah and rows by verse. Readers memory-map
+the file and decode only the surah (and columns) they ask for.
+
+File layout:
+    header   MAGIC (8 bytes)
+    blocks   column segments of each surah block
+    footer   UTF-8 JSON: format version, metadata, compression, block index
+    trailer  footer length (uint64 LE) + MAGIC
+
+Column types (chosen per block from the values):
+    uuid   canonical UUID strings or 16-byte IDs, stored as 16 bytes each
+    int    int64          float  float64          bool   one byte each
+    str    uint64 offsets + UTF-8 data
+    uuid_list, int_list   lists of the above: uint64 offsets + items
+    json   any other values (objects, mixed types) as JSON text
+uuid and str columns with few distinct values (verse_ref, phonetic_class)
+are dictionary-encoded: the distinct values plus an int64 code per row.
+A column whose key is missing from some entities, or is None, also gets a
+mask segment, so entities round-trip to equal dicts (keys in column
+order). Binary IDs are read back as UUID strings, matching the JSON form.
+
+Example:
+    >>> write_layer_container(
+    ...     "layer-00-character-composition.qudl", entities,
+    ...     coordinates=lambda e: (e["surah"], e["verse"]),
+    ... )
+    >>> with LayerContainer("layer-00-character-composition.qudl") as layer:
+    ...     chars = layer.read_surah(2)
+    ...     ayat_al_kursi = layer.read_verse(2, 255)
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .uuid_generator import pack_ids, unpack_ids
+
+
+MAGIC = b"QUDLAYR\x01"
+CONTAINER_FORMAT_VERSION = 1
+CONTAINER_SUFFIX = ".qudl"
+COMPRESSIONS = ("zlib", "none")
+LIST_TYPES = ("uuid", "int")  # Element types stored natively in list columns
+
+_TRAILER = struct.Struct("<Q8s")
+_UUID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+_SWAP = sys.byteorder != "little"  # Numeric segments are stored little-endian
+
+# Mask values: key absent, value present, value is None
+_ABSENT, _PRESENT, _NONE = 0, 1, 2
+_MISSING = object()  # Placeholder for absent keys while decoding
+
+Coordinates = Callable[[Dict[str, Any]], Tuple[int, int]]
+
+
+class LayerContainerWriter:
+    """
+    Write a layer container block by block.
+
+    The file is assembled under a temporary name and renamed on close(), so
+    an interrupted write never leaves a container that looks complete.
+    """
+
+    def __init__(self, path: Union[str, Path], compression: str = "zlib"):
+        """
+        Initialize writer.
+
+        Args:
+            path: Output file
+            compression: "zlib" or "none"
+
+        Raises:
+            ValueError: If compression is unknown
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {COMPRESSIONS}, got {compression!r}")
+        self.path = Path(path)
+        self.compression = compression
+        self.blocks: List[Dict[str, Any]] = []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._partial_path = self.path.with_name(self.path.name + ".partial")
+        self._file = open(self._partial_path, "wb")
+        self._file.write(MAGIC)
+
+    def __enter__(self) -> "LayerContainerWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self._file.closed:
+            return
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write_block(self, surah: int, entities: List[Dict[str, Any]], verses: List[int]):
+        """
+        Append the entities of one surah.
+
+        Args:
+            surah: Surah number (each surah may be written once)
+            entities: Entity dicts in document order
+            verses: Verse number of each entity (non-decreasing)
+
+        Raises:
+            ValueError: If the surah was already written or verses are out of order
+        """
+        if any(block["surah"] == surah for block in self.blocks):
+            raise ValueError(f"Surah {surah} already written")
+        if len(verses) != len(entities):
+            raise ValueError("verses must give one verse number per entity")
+
+        verse_index = []
+        for row, verse in enumerate(verses):
+            if verse_index and verse == verse_index[-1][0]:
+                verse_index[-1][2] = row + 1
+            elif verse_index and verse < verse_index[-1][0]:
+                raise ValueError(f"Surah {surah}: entities are not in verse order")
+            else:
+                verse_index.append([verse, row, row + 1])
+
+        names: Dict[str, None] = {}
+        for entity in entities:
+            names.update(dict.fromkeys(entity))
+
+        columns = []
+        for name in names:
+            values = [entity.get(name, _MISSING) for entity in entities]
+            columns.append(self._write_column(name, values))
+
+        self.blocks.append({
+            "surah": surah,
+            "rows": len(entities),
+            "verses": verse_index,
+            "columns": columns,
+        })
+
+    def close(self, metadata: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Write the footer and move the file into place.
+
+        Args:
+            metadata: Layer metadata (layer_name, generated_at, ...)
+
+        Returns:
+            Path to the container
+        """
+        footer = json.dumps({
+            "format_version": CONTAINER_FORMAT_VERSION,
+            "metadata": metadata or {},
+            "compression": self.compression,
+            "entity_count": sum(block["rows"] for block in self.blocks),
+            "blocks": self.blocks,
+        }, ensure_ascii=False).encode("utf-8")
+        self._file.write(footer)
+        self._file.write(_TRAILER.pack(len(footer), MAGIC))
+        self._file.close()
+        os.replace(self._partial_path, self.path)
+        return self.path
+
+    def abort(self):
+        """Discard the partially written file."""
+        self._file.close()
+        self._partial_path.unlink(missing_ok=True)
+
+    def _write_column(self, name: str, values: List[Any]) -> Dict[str, Any]:
+        """Encode one column of a block and return its footer entry."""
+        mask = bytes(
+            _ABSENT if v is _MISSING else _NONE if v is None else _PRESENT for v in values
+        )
+        present = [v for v in values if v is not _MISSING and v is not None]
+        kind = _column_type(present)
+
+        if len(present) != len(values):
+            values = [_null_value(kind) if v is _MISSING or v is None else v for v in values]
+        spec: Dict[str, Any] = {"name": name, "type": kind}
+
+        # Dictionary-encode repetitive IDs and labels (verse_ref, phonetic_class, ...)
+        distinct = list(dict.fromkeys(values)) if kind in ("uuid", "str") else values
+        if len(distinct) <= len(values) // 2:
+            codes = {value: code for code, value in enumerate(distinct)}
+            spec["distinct"] = len(distinct)
+            spec["data"] = self._write_segment(_encode(kind, distinct))
+            spec["codes"] = self._write_segment(_encode("int", [codes[v] for v in values]))
+        else:
+            spec["data"] = self._write_segment(_encode(kind, values))
+        if mask.count(_PRESENT) != len(mask):
+            spec["mask"] = self._write_segment(mask)
+        return spec
+
+    def _write_segment(self, raw: bytes) -> List[int]:
+        """Write a (compressed) segment and return [offset, length, raw_length]."""
+        data = zlib.compress(raw, 6) if self.compression == "zlib" else raw
+        offset = self._file.tell()
+        self._file.write(data)
+        return [offset, len(data), len(raw)]
+
+
+class LayerContainer:
+    """
+    Memory-mapped reader for layer containers.
+
+    Only the blocks (and columns) that are requested are decoded.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a container.
+
+        Args:
+            path: Container file
+
+        Raises:
+            ValueError: If the file is not a complete layer container
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            self._file.close()
+            raise ValueError(f"Not a layer container: {self.path}")
+
+        size = len(self._map)
+        if size < len(MAGIC) + _TRAILER.size or self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a layer container: {self.path}")
+        footer_length, magic = _TRAILER.unpack_from(self._map, size - _TRAILER.size)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Layer container is truncated: {self.path}")
+
+        footer_start = size - _TRAILER.size - footer_length
+        footer = json.loads(self._map[footer_start:size - _TRAILER.size].decode("utf-8"))
+        if footer["format_version"] != CONTAINER_FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported layer container version: {footer['format_version']}")
+
+        self.metadata: Dict[str, Any] = footer["metadata"]
+        self.compression: str = footer["compression"]
+        self.entity_count: int = footer["entity_count"]
+        self._blocks = {block["surah"]: block for block in footer["blocks"]}
+
+    def __enter__(self) -> "LayerContainer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.entity_count
+
+    @property
+    def surahs(self) -> List[int]:
+        """Surah numbers present, in file order."""
+        return list(self._blocks)
+
+    def verses(self, surah: int) -> List[int]:
+        """Verse numbers present in a surah."""
+        return [verse for verse, _, _ in self._block(surah)["verses"]]
+
+    def column_names(self, surah: int) -> List[str]:
+        """Column names of a surah block."""
+        return [column["name"] for column in self._block(surah)["columns"]]
+
+    def read_surah(self, surah: int, columns: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        Decode the entities of one surah.
+
+        Args:
+            surah: Surah number
+            columns: Column names to include (default: all)
+
+        Returns:
+            Entity dicts in document order
+
+        Raises:
+            KeyError: If the surah is not in the container
+        """
+        block = self._block(surah)
+        return self._decode_rows(block, 0, block["rows"], columns)
+
+    def read_verse(
+        self,
+        surah: int,
+        verse: int,
+        columns: Optional[Iterable[str]] = None
+    ) -> List[Dict]:
+        """
+        Decode the entities of one verse.
+
+        Returns:
+            Entity dicts in document order (empty if the verse has none)
+
+        Raises:
+            KeyError: If the surah is not in the container
+        """
+        block = self._block(surah)
+        for number, start, end in block["verses"]:
+            if number == verse:
+                return self._decode_rows(block, start, end, columns)
+        return []
+
+    def column(self, surah: int, name: str) -> List[Any]:
+        """
+        Decode one column of a surah (None where the value is null or absent).
+
+        Raises:
+            KeyError: If the surah or column is not in the container
+        """
+        block = self._block(surah)
+        spec = next((c for c in block["columns"] if c["name"] == name), None)
+        if spec is None:
+            raise KeyError(f"Column {name!r} not in surah {surah}")
+        values = self._decode_column(spec, block["rows"])
+        return [None if v is _MISSING else v for v in values]
+
+    def iter_entities(self) -> Iterator[List[Dict]]:
+        """
+        Decode all entities, one surah block at a time.
+
+        Yields:
+            Lists of entity dicts
+        """
+        for surah in self._blocks:
+            yield self.read_surah(surah)
+
+    def to_layer_data(self) -> Dict[str, Any]:
+        """Decode everything as layer data ({"entities": [...]})."""
+        entities: List[Dict] = []
+        for chunk in self.iter_entities():
+            entities.extend(chunk)
+        return {"entities": entities}
+
+    def close(self):
+        """Release the memory map and file."""
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def _block(self, surah: int) -> Dict[str, Any]:
+        block = self._blocks.get(surah)
+        if block is None:
+            raise KeyError(f"Surah {surah} not in layer container {self.path.name}")
+        return block
+
+    def _segment(self, segment: List[int]) -> Union[bytes, memoryview]:
+        offset, length, _ = segment
+        if self.compression == "zlib":
+            return zlib.decompress(self._map[offset:offset + length])
+        return memoryview(self._map)[offset:offset + length]
+
+    def _decode_column(self, spec: Dict[str, Any], rows: int) -> List[Any]:
+        if "codes" in spec:
+            distinct = _decode(spec["type"], self._segment(spec["data"]), spec["distinct"])
+            codes = _decode("int", self._segment(spec["codes"]), rows)
+            values = list(map(distinct.__getitem__, codes))
+        else:
+            values = _decode(spec["type"], self._segment(spec["data"]), rows)
+        if "mask" in spec:
+            mask = bytes(self._segment(spec["mask"]))
+            values = [
+                v if m == _PRESENT else None if m == _NONE else _MISSING
+                for v, m in zip(values, mask)
+            ]
+        return values
+
+    def _decode_rows(
+        self,
+        block: Dict[str, Any],
+        start: int,
+        end: int,
+        columns: Optional[Iterable[str]]
+    ) -> List[Dict]:
+        wanted = set(columns) if columns is not None else None
+        specs = [c for c in block["columns"] if wanted is None or c["name"] in wanted]
+        names = [spec["name"] for spec in specs]
+        if not specs:
+            return [{} for _ in range(start, end)]
+
+        decoded = [self._decode_column(spec, block["rows"])[start:end] for spec in specs]
+        dense = [i for i, spec in enumerate(specs) if "mask" not in spec]
+        if len(dense) == len(specs):
+            return [dict(zip(names, row)) for row in zip(*decoded)]
+
+        # Build rows from the dense columns, then add values present in masked ones
+        rows = [dict(zip([names[i] for i in dense], row))
+                for row in zip(*(decoded[i] for i in dense))] if dense else \
+            [{} for _ in range(start, end)]
+        for i, spec in enumerate(specs):
+            if "mask" in spec:
+                name = names[i]
+                for row, value in zip(rows, decoded[i]):
+                    if value is not _MISSING:
+                        row[name] = value
+        return rows
+
+
+def write_layer_container(
+    path: Union[str, Path],
+    entities: Iterable[Dict[str, Any]],
+    coordinates: Coordinates,
+    metadata: Optional[Dict[str, Any]] = None,
+    compression: str = "zlib"
+) -> Path:
+    """
+    Write entities to a layer container, one block per surah.
+
+    Args:
+        path: Output file
+        entities: Entity dicts in document order (grouped by surah)
+        coordinates: Function returning (surah, verse) for an entity
+        metadata: Layer metadata stored in the footer
+        compression: "zlib" or "none"
+
+    Returns:
+        Path to the container
+
+    Raises:
+        ValueError: If a surah's entities are not contiguous or not in verse order
+    """
+    with LayerContainerWriter(path, compression) as writer:
+        surah = None
+        block: List[Dict[str, Any]] = []
+        verses: List[int] = []
+        for entity in entities:
+            entity_surah, verse = coordinates(entity)
+            if entity_surah != surah:
+                if block:
+                    writer.write_block(surah, block, verses)
+                surah, block, verses = entity_surah, [], []
+            block.append(entity)
+            verses.append(verse)
+        if block:
+            writer.write_block(surah, block, verses)
+        return writer.close(metadata)
+
+
+def _column_type(values: List[Any]) -> str:
+    """Pick the storage type for the non-null values of a column."""
+    if values and all(type(v) is list for v in values):
+        items = [item for v in values for item in v]
+        kind = _column_type(items) if items else "json"
+        return f"{kind}_list" if kind in LIST_TYPES else "json"
+
+    types = set(map(type, values))
+    if not types:
+        return "json"
+    if types <= {str, bytes} and all(
+        len(v) == 16 if type(v) is bytes else len(v) == 36 and _UUID_PATTERN.fullmatch(v)
+        for v in values
+    ):
+        return "uuid"
+    if types == {str}:
+        return "str"
+    if types == {int} and -2**63 <= min(values) and max(values) < 2**63:
+        return "int"
+    if types == {float}:
+        return "float"
+    if types == {bool}:
+        return "bool"
+    return "json"
+
+
+def _null_value(kind: str) -> Any:
+    """Placeholder stored for null/absent rows (hidden by the mask)."""
+    if kind.endswith("_list"):
+        return []
+    return {"uuid": bytes(16), "int": 0, "float": 0.0, "bool": False, "str": ""}.get(kind)
+
+
+def _encode(kind: str, values: List[Any]) -> bytes:
+    """Encode column values of a given type to bytes."""
+    if kind == "uuid":
+        return pack_ids(values)
+    if kind in ("int", "float"):
+        numbers = array("q" if kind == "int" else "d", values)
+        if _SWAP:
+            numbers.byteswap()
+        return numbers.tobytes()
+    if kind == "bool":
+        return bytes(values)
+    if kind.endswith("_list"):
+        items = [item for v in values for item in v]
+        return _encode_offsets(map(len, values)) + _encode(kind[:-len("_list")], items)
+
+    if kind == "json":
+        values = [json.dumps(v, ensure_ascii=False, separators=(",", ":")) for v in values]
+    encoded = [v.encode("utf-8") for v in values]
+    return _encode_offsets(map(len, encoded)) + b"".join(encoded)
+
+
+def _decode(kind: str, data: Union[bytes, memoryview], rows: int) -> List[Any]:
+    """Decode column bytes of a given type to values."""
+    if kind == "uuid":
+        return unpack_ids(data)
+    if kind in ("int", "float"):
+        numbers = array("q" if kind == "int" else "d")
+        numbers.frombytes(data)
+        if _SWAP:
+            numbers.byteswap()
+        return numbers.tolist()
+    if kind == "bool":
+        return [b == 1 for b in bytes(data)]
+
+    offsets = _decode_offsets(data, rows)
+    payload = data[8 * (rows + 1):]
+    if kind.endswith("_list"):
+        items = _decode(kind[:-len("_list")], payload, offsets[-1])
+        return [items[offsets[i]:offsets[i + 1]] for i in range(rows)]
+
+    raw = bytes(payload)
+    text = raw.decode("utf-8")
+    if text.isascii():  # Byte offsets are character offsets
+        values = [text[offsets[i]:offsets[i + 1]] for i in range(rows)]
+    else:
+        values = [raw[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(rows)]
+    if kind == "json":
+        return [json.loads(v) for v in values]
+    return values
+
+
+def _encode_offsets(lengths: Iterable[int]) -> bytes:
+    """Encode item lengths as n + 1 cumulative uint64 offsets."""
+    offsets = array("Q", [0])
+    total = 0
+    for length in lengths:
+        total += length
+        offsets.append(total)
+    if _SWAP:
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def _decode_offsets(data: Union[bytes, memoryview], rows: int) -> array:
+    offsets = array("Q")
+    offsets.frombytes(data[:8 * (rows + 1)])
+    if _SWAP:
+        offsets.byteswap()
+    return offsets
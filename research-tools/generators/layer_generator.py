@@ -4,13 +4,36 @@ Layer Generator Framework
 Tier 2 (Reusable Research Tool)
 
 Base framework for generating layer data.
+
+Layers can be written whole (generate + save, one JSON document) or streamed
+(generate_stream + save_stream, JSON Lines written chunk by chunk). Memory
+stays flat only for layers that generate chunk by chunk: those overriding
+generate_stream() or partitions(); any other layer is generated whole
+before its first chunk is written. A streamed file holds one
+entity per line followed by a final {"metadata": {...}} line; read it back
+with iter_layer_entities() and read_layer_metadata(), or parse that line
+with parse_metadata_line(). save_container() writes the compact binary form
+instead (see layer_container), and save_sharded() one shard per narration
+and surah with a manifest (see layer_shards).
 """
 
+import json
+import os
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
+from .uuid_generator import json_default
+
+if TYPE_CHECKING:
+    from .semantic_hasher import SemanticHasher
+
+
+# Entities per chunk for generate_stream() and iter_layer_entities()
+DEFAULT_CHUNK_SIZE = 10000
+
 
 @dataclass
 class LayerMetadata:
@@ -24,6 +47,7 @@ class LayerMetadata:
     generated_at: str  # ISO format timestamp
     entity_count: int
     dependencies: List[str]  # List of layer names this depends on
+    hash_algorithm: str = "sha256"  # SemanticHasher algorithm of hashes in the layer
 
 
 class LayerGenerator(ABC):
@@ -31,8 +55,23 @@ class LayerGenerator(ABC):
     Abstract base class for layer generators.
 
     Each layer implements this interface to generate its data.
+
+    For incremental builds (see build_cache.BuildCache), a layer can split
+    its input into partitions (e.g. one per surah) by overriding
+    partitions() and generate_partition(); unchanged partitions are then
+    reused instead of regenerated. Set code_version when the generation
+    logic depends on modules outside the class hierarchy, and bump it when
+    they change.
     """
 
+    # Generation logic version; None means "hash of the source of the modules
+    # defining the class and its bases"
+    code_version: Optional[str] = None
+
+    # SemanticHasher algorithm for hashes in this layer ("sha256" or "blake2b");
+    # recorded in the layer metadata
+    hash_algorithm: str = "sha256"
+
     def __init__(
         self,
         layer_name: str,
@@ -70,6 +109,29 @@ class LayerGenerator(ABC):
         """
         pass
 
+    def generate_with_dependencies(
+        self,
+        source_data: Any,
+        context: Dict[str, str],
+        dependencies: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Generate layer data given the outputs of the layers it depends on.
+
+        Called by orchestration.LayerScheduler, which passes upstream
+        outputs in memory. The default ignores them and calls generate();
+        layers that build on other layers override this.
+
+        Args:
+            source_data: Input data (format depends on layer)
+            context: Context dict with qiraat, narration, edition
+            dependencies: Layer name -> generated data, for get_dependencies()
+
+        Returns:
+            Generated layer data dictionary
+        """
+        return self.generate(source_data, context)
+
     @abstractmethod
     def validate(self, layer_data: Dict[str, Any]) -> bool:
         """
@@ -96,10 +158,104 @@ class LayerGenerator(ABC):
         """
         pass
 
+    def get_hasher(self) -> "SemanticHasher":
+        """
+        Get a SemanticHasher using this layer's hash_algorithm.
+
+        Returns:
+            SemanticHasher
+        """
+        from .semantic_hasher import SemanticHasher
+
+        return SemanticHasher(self.hash_algorithm)
+
+    def get_parameters(self) -> Dict[str, Any]:
+        """
+        Get generator parameters that affect the output (part of the build cache key).
+
+        Returns:
+            JSON-serializable parameter dict (default: none)
+        """
+        return {}
+
+    def partitions(
+        self,
+        source_data: Any,
+        context: Dict[str, str],
+        dependencies: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Split the layer input into independently generated partitions.
+
+        Each partition value must be JSON-serializable and hold the actual
+        content it is generated from (records, text, upstream entities, or
+        file hashes), since the build cache hashes it to detect changes. The
+        default is a single partition with the whole source and all
+        dependencies; a source file path is keyed by its contents (see
+        build_cache.file_fingerprint). Layers whose source is a key they load
+        from (e.g. a riwaya name) must override this to return the loaded
+        input.
+
+        Args:
+            source_data: Input data (format depends on layer)
+            context: Context dict with qiraat, narration, edition
+            dependencies: Layer name -> generated data of upstream layers
+
+        Returns:
+            Partition key (e.g. "s002") -> partition input, in output order
+
+        Raises:
+            ValueError: If source_data is a string or path that is not a file
+        """
+        partition = {"source": source_data, "dependencies": dependencies}
+        if isinstance(source_data, (str, os.PathLike)):
+            from .build_cache import file_fingerprint
+
+            partition["source_file"] = file_fingerprint(source_data)
+        return {"all": partition}
+
+    def generate_partition(self, partition: Any, context: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Generate the layer data of one partition.
+
+        Args:
+            partition: Partition input from partitions()
+            context: Context dict with qiraat, narration, edition
+
+        Returns:
+            Partial layer data dictionary
+        """
+        return self.generate_with_dependencies(
+            partition["source"], context, partition["dependencies"]
+        )
+
+    def merge_partitions(self, parts: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine partition outputs into the full layer data.
+
+        The default concatenates the "entities" lists in partition order (a
+        single partition is returned as is).
+
+        Args:
+            parts: Partition key -> partial layer data, in partitions() order
+
+        Returns:
+            Layer data dictionary
+        """
+        if len(parts) == 1:
+            return next(iter(parts.values()))
+        entities: List[Any] = []
+        for part in parts.values():
+            entities.extend(part.get("entities", []))
+        return {"entities": entities}
+
     def save(self, layer_data: Dict[str, Any], filename: Optional[str] = None) -> Path:
         """
         Save generated layer data to file.
 
+        Entity IDs may be carried as 16-byte values or packed "S16" arrays
+        (see uuid_generator binary=True); they are written as UUID strings.
+
         Args:
             layer_data: Generated data
             filename: Optional custom filename (default: {layer_name}.json)
@@ -107,9 +263,6 @@ class LayerGenerator(ABC):
         Returns:
             Path to saved file
         """
-        import json
-        from datetime import datetime
-
         if filename is None:
             filename = f"layer-{self.layer_number:02d}-{self.layer_name}.json"
 
@@ -121,6 +274,7 @@ class LayerGenerator(ABC):
             "metadata": {
                 "layer_name": self.layer_name,
                 "layer_number": self.layer_number,
+                "hash_algorithm": self.hash_algorithm,
                 "generated_at": datetime.utcnow().isoformat(),
                 "entity_count": len(layer_data.get("entities", []))
             },
@@ -128,6 +282,290 @@ class LayerGenerator(ABC):
         }
 
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+            json.dump(output_data, f, ensure_ascii=False, indent=2, default=json_default)
+
+        return output_path
+
+    def generate_stream(
+        self,
+        source_data: Any,
+        context: Dict[str, str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Generate layer entities as a sequence of chunks.
+
+        The default implementation generates one partition at a time (see
+        partitions() and generate_partition()) and slices its "entities"
+        list, so a partitioned layer holds one partition in memory. A layer
+        with the default single partition falls back to generate() and holds
+        the whole layer before the first chunk; layers too large for that
+        should override partitions() or this method (e.g. one surah at a
+        time).
+
+        Args:
+            source_data: Input data (format depends on layer)
+            context: Context dict with qiraat, narration, edition
+            chunk_size: Maximum entities per chunk
+
+        Yields:
+            Lists of entity dicts
+        """
+        if type(self).partitions is LayerGenerator.partitions:
+            parts: Iterable[Dict[str, Any]] = [self.generate(source_data, context)]
+        else:
+            parts = (
+                self.generate_partition(partition, context)
+                for partition in self.partitions(source_data, context, {}).values()
+            )
+        for part in parts:
+            entities = part.get("entities", [])
+            for start in range(0, len(entities), chunk_size):
+                yield entities[start:start + chunk_size]
+
+    def save_stream(
+        self,
+        chunks: Iterable[List[Dict[str, Any]]],
+        filename: Optional[str] = None
+    ) -> Path:
+        """
+        Write entity chunks incrementally as JSON Lines.
+
+        Each entity is written as one line as soon as its chunk arrives, and
+        the metadata line (entity_count, generated_at) is written last.
+        Only one chunk is held here; whether the chunks are generated
+        incrementally depends on their source (see generate_stream()). The
+        file is assembled under a temporary name and renamed on completion,
+        so an interrupted run never leaves a layer that looks complete.
+
+        Args:
+            chunks: Entity chunks (e.g. from generate_stream())
+            filename: Optional custom filename (default: {layer_name}.jsonl)
+
+        Returns:
+            Path to saved file
+        """
+        if filename is None:
+            filename = f"layer-{self.layer_number:02d}-{self.layer_name}.jsonl"
+
+        output_path = self.output_dir / filename
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = output_path.with_name(output_path.name + ".partial")
+
+        entity_count = 0
+        chunk_count = 0
+        try:
+            with open(partial_path, 'w', encoding='utf-8') as f:
+                for chunk in chunks:
+                    f.write("".join(
+                        json.dumps(entity, ensure_ascii=False, default=json_default) + "\n"
+                        for entity in chunk
+                    ))
+                    entity_count += len(chunk)
+                    chunk_count += 1
+
+                metadata = {
+                    "layer_name": self.layer_name,
+                    "layer_number": self.layer_number,
+                    "hash_algorithm": self.hash_algorithm,
+                    "generated_at": datetime.utcnow().isoformat(),
+                    "entity_count": entity_count,
+                    "chunk_count": chunk_count,
+                    "format": "jsonl"
+                }
+                f.write(json.dumps({"metadata": metadata}, ensure_ascii=False) + "\n")
+            os.replace(partial_path, output_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
 
         return output_path
+
+    def save_container(
+        self,
+        layer_data: Dict[str, Any],
+        coordinates: Callable[[Dict[str, Any]], Tuple[int, int]],
+        filename: Optional[str] = None,
+        compression: str = "zlib"
+    ) -> Path:
+        """
+        Save generated layer data as a binary layer container.
+
+        The container is columnar with one block per surah, so readers can
+        fetch a single surah or verse without decoding the whole layer (see
+        layer_container.LayerContainer).
+
+        Args:
+            layer_data: Generated data (entities in document order)
+            coordinates: Function returning (surah, verse) for an entity
+            filename: Optional custom filename (default: {layer_name}.qudl)
+            compression: "zlib" or "none"
+
+        Returns:
+            Path to saved file
+        """
+        from .layer_container import CONTAINER_SUFFIX, write_layer_container
+
+        if filename is None:
+            filename = f"layer-{self.layer_number:02d}-{self.layer_name}{CONTAINER_SUFFIX}"
+
+        entities = layer_data.get("entities", [])
+        metadata = {
+            "layer_name": self.layer_name,
+            "layer_number": self.layer_number,
+            "hash_algorithm": self.hash_algorithm,
+            "generated_at": datetime.utcnow().isoformat(),
+            "entity_count": len(entities),
+            "format": "container"
+        }
+        return write_layer_container(
+            self.output_dir / filename, entities, coordinates, metadata, compression
+        )
+
+    def save_sharded(
+        self,
+        layer_data: Dict[str, Any],
+        coordinates: Callable[[Dict[str, Any]], Tuple[int, int]],
+        narration: str,
+        shard_format: str = "jsonl",
+        max_workers: Optional[int] = None
+    ) -> Path:
+        """
+        Save generated layer data as shards partitioned by narration and surah.
+
+        Shards go under {output_dir}/layer-NN-{layer_name}/ with one
+        manifest per narration; readers merge them to load only the shards
+        a query touches (see layer_shards.ShardedLayer). Narrations can be
+        saved concurrently.
+
+        Args:
+            layer_data: Generated data (entities in document order)
+            coordinates: Function returning (surah, verse) for an entity
+            narration: Narration the data was generated for (e.g. "hafs")
+            shard_format: "jsonl" or "container"
+            max_workers: Writer threads (default: one per CPU)
+
+        Returns:
+            Path to the narration manifest
+        """
+        from .layer_shards import write_layer_shards
+
+        metadata = {
+            "layer_name": self.layer_name,
+            "layer_number": self.layer_number,
+            "hash_algorithm": self.hash_algorithm,
+        }
+        return write_layer_shards(
+            self.output_dir / f"layer-{self.layer_number:02d}-{self.layer_name}",
+            layer_data.get("entities", []), coordinates, narration, metadata,
+            shard_format=shard_format, max_workers=max_workers,
+        )
+
+
+def iter_layer_entities(
+    file_path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Read a streamed layer file back in chunks.
+
+    The trailing metadata line is checked before any entity is yielded, so
+    a truncated file fails up front rather than after most of its entities.
+
+    Args:
+        file_path: File written by LayerGenerator.save_stream()
+        chunk_size: Maximum entities per chunk
+
+    Yields:
+        Lists of entity dicts
+
+    Raises:
+        ValueError: If the file does not end with its metadata line (i.e. it
+                    is truncated or not a streamed layer), or holds another
+                    number of entities than its metadata records
+    """
+    expected = read_layer_metadata(file_path).get("entity_count")
+    chunk: List[Dict[str, Any]] = []
+    pending: Optional[str] = None
+    entity_count = 0
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            # Hold one line back: the last line is metadata, not an entity
+            if pending is not None:
+                chunk.append(json.loads(pending))
+                entity_count += 1
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            pending = line
+
+    if pending is None or parse_metadata_line(pending) is None:
+        raise ValueError(f"Layer stream has no metadata line (truncated?): {file_path}")
+    if expected is not None and entity_count != expected:
+        raise ValueError(
+            f"Layer stream has {entity_count} entities, metadata records {expected}: {file_path}"
+        )
+    if chunk:
+        yield chunk
+
+
+def read_layer_metadata(file_path: Path) -> Dict[str, Any]:
+    """
+    Read the metadata of a streamed layer without reading its entities.
+
+    Args:
+        file_path: File written by LayerGenerator.save_stream()
+
+    Returns:
+        Metadata dict (layer_name, layer_number, generated_at, entity_count, ...)
+
+    Raises:
+        ValueError: If the file does not end with a line holding only
+                    {"metadata": {...}}
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        block = 4096
+        tail = b""
+        # Read backwards until the last complete line is in the buffer
+        while end > 0 and tail.rstrip(b"\n").count(b"\n") == 0:
+            start = max(0, end - block)
+            f.seek(start)
+            tail = f.read(end - start) + tail
+            end = start
+
+    last_line = tail.rstrip(b"\n").rsplit(b"\n", 1)[-1]
+    try:
+        metadata = parse_metadata_line(last_line.decode('utf-8'))
+    except UnicodeDecodeError:
+        metadata = None
+    if metadata is None:
+        raise ValueError(f"Layer stream has no metadata line (truncated?): {file_path}")
+    return metadata
+
+
+def parse_metadata_line(line: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the trailing {"metadata": {...}} line of a streamed layer or shard.
+
+    The record must hold the "metadata" key only, so an entity that happens
+    to have a metadata field is not mistaken for the end of the layer.
+
+    Args:
+        line: One JSON Lines record
+
+    Returns:
+        Metadata dict, or None if the line is not a metadata record
+    """
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict) or record.keys() != {"metadata"}:
+        return None
+    metadata = record["metadata"]
+    return metadata if isinstance(metadata, dict) else None
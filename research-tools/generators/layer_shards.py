@@ -0,0 +1,414 @@
+"""
+Layer Shards
+
+Tier 2 (Reusable Research Tool)
+
+Partitioned layer output. Instead of one layer-NN-name.json per run, a
+layer is written as a directory of shards partitioned by narration and
+surah, plus one manifest per narration listing its shards with their
+entity counts and verse ranges:
+
+    layer-00-character-composition/
+        narration=hafs/manifest.json
+        narration=hafs/surah=001/part-0.5d41402a.jsonl
+        narration=hafs/surah=002/part-0.5d41402a.jsonl
+        narration=hafs/surah=002/part-1.5d41402a.jsonl
+        narration=warsh/manifest.json
+        narration=warsh/surah=001/part-0.9b2f6c1e.jsonl
+        ...
+
+Readers (ShardedLayer, orchestration.QueryRouter, validators) merge the
+narration manifests and use them to prune shards and load only what a
+query touches. Shards are written and read in parallel. Each narration is
+written by its own run (e.g. one LayerScheduler job per riwaya); runs for
+different narrations touch disjoint files, so they can run concurrently.
+Every write names its shards with a fresh build token, so rewriting a
+narration never touches the files its current manifest lists: the new
+shards are written first, the manifest is replaced atomically, and only
+then are the previous shards removed.
+
+Shard formats:
+    jsonl      streamed layer files (see LayerGenerator.save_stream), one
+               entity per line followed by a metadata line
+    container  binary layer containers (see layer_container)
+
+Example:
+    >>> write_layer_shards(
+    ...     "output/layer-00-character-composition", entities,
+    ...     coordinates=lambda e: (e["surah"], e["verse"]), narration="hafs",
+    ... )
+    >>> layer = ShardedLayer("output/layer-00-character-composition")
+    >>> layer.read(narration="hafs", surahs=[2])
+"""
+
+import hashlib
+import json
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .layer_container import CONTAINER_SUFFIX, LayerContainer, write_layer_container
+from .layer_generator import parse_metadata_line
+from .uuid_generator import json_default
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT_VERSION = 1
+SHARD_FORMATS = {"jsonl": ".jsonl", "container": CONTAINER_SUFFIX}
+
+# Entities per shard part; a surah with more entities is split into parts
+DEFAULT_PART_ROWS = 50000
+
+Coordinates = Callable[[Dict[str, Any]], Tuple[int, int]]
+
+
+@dataclass
+class ShardInfo:
+    """One shard as listed in the manifest."""
+
+    path: str  # Relative to the layer directory
+    narration: str
+    surah: int
+    part: int
+    entity_count: int
+    first_verse: int
+    last_verse: int
+    sha256: str
+
+    def contains_verse(self, verse: int) -> bool:
+        """Check whether the shard's verse range covers a verse."""
+        return self.first_verse <= verse <= self.last_verse
+
+
+def write_layer_shards(
+    layer_dir: Union[str, Path],
+    entities: Iterable[Dict[str, Any]],
+    coordinates: Coordinates,
+    narration: str,
+    metadata: Optional[Dict[str, Any]] = None,
+    shard_format: str = "jsonl",
+    part_rows: int = DEFAULT_PART_ROWS,
+    max_workers: Optional[int] = None
+) -> Path:
+    """
+    Write one narration's entities as surah shards and its manifest.
+
+    Args:
+        layer_dir: Layer directory (created if needed)
+        entities: Entity dicts in document order
+        coordinates: Function returning (surah, verse) for an entity
+        narration: Narration key of the partition (e.g. "hafs")
+        metadata: Layer metadata stored in the narration manifest (layer_name, ...)
+        shard_format: "jsonl" or "container"
+        part_rows: Maximum entities per shard part
+        max_workers: Writer threads (default: one per CPU)
+
+    Returns:
+        Path to the narration manifest
+
+    Raises:
+        ValueError: If shard_format is unknown or differs from the other narrations'
+    """
+    if shard_format not in SHARD_FORMATS:
+        raise ValueError(f"shard_format must be one of {list(SHARD_FORMATS)}, got {shard_format!r}")
+    layer_dir = Path(layer_dir)
+    for other in _read_narration_manifests(layer_dir):
+        if other["narration"] != narration and other["format"] != shard_format:
+            raise ValueError(
+                f"Layer {layer_dir.name} is sharded as {other['format']}, not {shard_format}"
+            )
+    previous = _read_json(_manifest_path(layer_dir, narration)) or {}
+
+    by_surah: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {}
+    for entity in entities:
+        surah, verse = coordinates(entity)
+        by_surah.setdefault(surah, []).append((verse, entity))
+
+    build = uuid.uuid4().hex[:8]  # New file names: readers may hold the old manifest
+    tasks = []
+    for surah in sorted(by_surah):
+        rows = by_surah[surah]
+        for part, start in enumerate(range(0, len(rows), part_rows)):
+            relative = shard_path(narration, surah, part, shard_format, build)
+            tasks.append((relative, narration, surah, part, rows[start:start + part_rows]))
+
+    def write(task) -> ShardInfo:
+        relative, narration, surah, part, rows = task
+        path = layer_dir / relative
+        _write_shard(path, rows, coordinates, shard_format)
+        return ShardInfo(
+            relative, narration, surah, part, len(rows),
+            min(v for v, _ in rows), max(v for v, _ in rows), _file_sha256(path),
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        written = list(pool.map(write, tasks))
+
+    shards = [asdict(info) for info in written]
+    manifest = {
+        "format_version": MANIFEST_FORMAT_VERSION,
+        "narration": narration,
+        "metadata": {**previous.get("metadata", {}), **(metadata or {})},
+        "generated_at": datetime.utcnow().isoformat(),
+        "partitioning": ["narration", "surah"],
+        "format": shard_format,
+        "entity_count": sum(s["entity_count"] for s in shards),
+        "shards": shards,
+    }
+    path = _write_manifest(layer_dir, narration, manifest)
+
+    # Only once the new manifest is in place: remove files it no longer lists
+    current = {info.path for info in written}
+    for stale in previous.get("shards", []):
+        if stale["path"] not in current:
+            stale_path = layer_dir / stale["path"]
+            stale_path.unlink(missing_ok=True)
+            if not any(stale_path.parent.iterdir()):
+                stale_path.parent.rmdir()
+    return path
+
+
+def shard_path(
+    narration: str,
+    surah: int,
+    part: int,
+    shard_format: str = "jsonl",
+    build: Optional[str] = None
+) -> str:
+    """
+    Get the relative path of a shard part.
+
+    Args:
+        narration: Narration key
+        surah: Surah number
+        part: Part number within the surah
+        shard_format: "jsonl" or "container"
+        build: Token of the write the shard belongs to (omitted if None)
+
+    Returns:
+        e.g. "narration=hafs/surah=002/part-0.5d41402a.jsonl"
+    """
+    name = f"part-{part}" if build is None else f"part-{part}.{build}"
+    return f"narration={narration}/surah={surah:03d}/{name}{SHARD_FORMATS[shard_format]}"
+
+
+class ShardedLayer:
+    """
+    Reader for a sharded layer directory.
+
+    Shards are selected from the manifest, so only the files a query
+    touches are opened.
+    """
+
+    def __init__(self, layer_dir: Union[str, Path], max_workers: Optional[int] = None):
+        """
+        Open a sharded layer.
+
+        Args:
+            layer_dir: Directory written by write_layer_shards()
+            max_workers: Reader threads (default: one per CPU)
+
+        Raises:
+            FileNotFoundError: If the directory has no narration manifest
+            ValueError: If narrations were sharded in different formats
+        """
+        self.layer_dir = Path(layer_dir)
+        self.max_workers = max_workers
+        manifests = _read_narration_manifests(self.layer_dir)
+        if not manifests:
+            raise FileNotFoundError(f"No narration=*/{MANIFEST_NAME} in {self.layer_dir}")
+        formats = {manifest["format"] for manifest in manifests}
+        if len(formats) > 1:
+            raise ValueError(f"Layer {self.layer_dir.name} mixes shard formats: {sorted(formats)}")
+
+        self.metadata: Dict[str, Any] = {}
+        for manifest in manifests:
+            self.metadata.update(manifest["metadata"])
+        self.format: str = formats.pop()
+        self.entity_count: int = sum(manifest["entity_count"] for manifest in manifests)
+        self._shards = [
+            ShardInfo(**shard) for manifest in manifests for shard in manifest["shards"]
+        ]
+
+    def __len__(self) -> int:
+        return self.entity_count
+
+    @property
+    def narrations(self) -> List[str]:
+        """Narrations present."""
+        return list(dict.fromkeys(shard.narration for shard in self._shards))
+
+    def surahs(self, narration: Optional[str] = None) -> List[int]:
+        """Surah numbers present (for one narration, or any)."""
+        return sorted({shard.surah for shard in self.shards(narration)})
+
+    def shards(
+        self,
+        narration: Union[str, Iterable[str], None] = None,
+        surahs: Union[int, Iterable[int], None] = None,
+        verse: Optional[int] = None
+    ) -> List[ShardInfo]:
+        """
+        Select shards from the manifest (None means no restriction).
+
+        Args:
+            narration: Narration key(s)
+            surahs: Surah number(s)
+            verse: Verse number; keeps only parts whose verse range covers it
+
+        Returns:
+            Matching shards in (narration, surah, part) order
+        """
+        narrations = _as_set(narration)
+        surah_set = _as_set(surahs)
+        return [
+            shard for shard in self._shards
+            if (narrations is None or shard.narration in narrations)
+            and (surah_set is None or shard.surah in surah_set)
+            and (verse is None or shard.contains_verse(verse))
+        ]
+
+    def read(
+        self,
+        narration: Union[str, Iterable[str], None] = None,
+        surahs: Union[int, Iterable[int], None] = None,
+        verse: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Load the entities of the selected shards (read in parallel).
+
+        Pruning is per shard part: with verse, whole parts covering the
+        verse are returned, so callers filter entities of other verses.
+
+        Returns:
+            Entity dicts in (narration, surah, part) order
+        """
+        entities: List[Dict[str, Any]] = []
+        for _, chunk in self.iter_shards(narration, surahs, verse):
+            entities.extend(chunk)
+        return entities
+
+    def iter_shards(
+        self,
+        narration: Union[str, Iterable[str], None] = None,
+        surahs: Union[int, Iterable[int], None] = None,
+        verse: Optional[int] = None
+    ) -> Iterator[Tuple[ShardInfo, List[Dict[str, Any]]]]:
+        """
+        Load the selected shards in parallel, yielding them in order.
+
+        Yields:
+            (shard, entities)
+        """
+        selected = self.shards(narration, surahs, verse)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            yield from zip(selected, pool.map(self._read_shard, selected))
+
+    def verify(self, shards: Optional[List[ShardInfo]] = None) -> List[str]:
+        """
+        Check shard files against the manifest (presence and sha256).
+
+        Args:
+            shards: Shards to check (default: all)
+
+        Returns:
+            Problems found (empty if all shards are intact)
+        """
+        def check(shard: ShardInfo) -> Optional[str]:
+            path = self.layer_dir / shard.path
+            if not path.exists():
+                return f"{shard.path}: missing"
+            if _file_sha256(path) != shard.sha256:
+                return f"{shard.path}: sha256 mismatch"
+            return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return [p for p in pool.map(check, self._shards if shards is None else shards) if p]
+
+    def _read_shard(self, shard: ShardInfo) -> List[Dict[str, Any]]:
+        path = self.layer_dir / shard.path
+        if self.format == "container":
+            with LayerContainer(path) as container:
+                return container.read_surah(shard.surah)
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        metadata = parse_metadata_line(lines[-1]) if lines else None
+        if metadata is None or metadata.get("entity_count") != len(lines) - 1:
+            raise ValueError(f"Shard has no matching metadata line (truncated?): {path}")
+        return [json.loads(line) for line in lines[:-1]]
+
+
+def _write_shard(
+    path: Path,
+    rows: List[Tuple[int, Dict[str, Any]]],
+    coordinates: Coordinates,
+    shard_format: str
+):
+    """Write one shard part atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entities = [entity for _, entity in rows]
+    if shard_format == "container":
+        write_layer_container(path, entities, coordinates, {"entity_count": len(entities)})
+        return
+
+    partial_path = path.with_name(path.name + ".partial")
+    with open(partial_path, 'w', encoding='utf-8') as f:
+        f.write("".join(
+            json.dumps(entity, ensure_ascii=False, default=json_default) + "\n"
+            for entity in entities
+        ))
+        f.write(json.dumps({"metadata": {"entity_count": len(entities)}}) + "\n")
+    os.replace(partial_path, path)
+
+
+def _manifest_path(layer_dir: Path, narration: str) -> Path:
+    return layer_dir / f"narration={narration}" / MANIFEST_NAME
+
+
+def _read_narration_manifests(layer_dir: Path) -> List[Dict[str, Any]]:
+    """Read every narration manifest of a layer, in narration order."""
+    manifests = []
+    for path in sorted(layer_dir.glob(f"narration=*/{MANIFEST_NAME}")):
+        manifest = _read_json(path)
+        if manifest is not None:
+            manifests.append(manifest)
+    return manifests
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_manifest(layer_dir: Path, narration: str, manifest: Dict[str, Any]) -> Path:
+    path = _manifest_path(layer_dir, narration)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = path.with_name(path.name + ".partial")
+    with open(partial_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(partial_path, path)
+    return path
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _as_set(value: Any) -> Optional[set]:
+    """None -> None, scalar -> {scalar}, iterable -> set."""
+    if value is None:
+        return None
+    if isinstance(value, (str, int)):
+        return {value}
+    return set(value)
@@ -0,0 +1,369 @@
+"""
+Merkle Tree
+
+Tier 2 (Reusable Research Tool)
+
+Merkle hash tree over the Quran hierarchy: mushaf -> surah -> verse ->
+word -> character. Each character (a base letter with its combining marks)
+is a leaf; each inner node hashes its children's keys and hashes, so two
+datasets with equal root hashes are equal, and a diff descends only into
+subtrees whose hashes differ. Comparing two versions costs a number of
+hash comparisons proportional to the changes (times the fan-out along
+their paths) instead of a full rescan.
+
+Node hashes (SHA-256 by default, or BLAKE2b-256) can be persisted in a
+compact binary file, down to any depth (e.g. verse level), so a stored
+dataset does not need rehashing to be compared. The file records the
+algorithm, and only trees of the same algorithm can be compared.
+
+Hashing (H = the tree's algorithm):
+    leaf   H(0x00 || UTF-8 content)
+    inner  H(0x01 || key_1 (uint32 BE) || hash_1 || ... ) over children
+           sorted by key
+
+Example:
+    >>> old = MerkleTree.load("hafs-v1.merkle")
+    >>> new = MerkleTree.from_ayat(zip(sura_no, aya_no, aya_text))
+    >>> for change in old.diff(new, max_depth=2).changes:
+    ...     print(change.level, change.path, change.kind)  # verse (2, 255) changed
+"""
+
+import functools
+import hashlib
+import struct
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+# Algorithm name -> hash constructor; all produce 256-bit (64 hex digit) hashes.
+# Shared with semantic_hasher, which re-exports it.
+HASH_ALGORITHMS: Dict[str, Callable[..., Any]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": functools.partial(hashlib.blake2b, digest_size=32),
+}
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+# Level names by depth (root at depth 0)
+LEVELS = ("mushaf", "surah", "verse", "word", "char")
+
+MAGIC_V1 = b"QUDMRKL1"  # SHA-256 only, no algorithm field
+MAGIC = b"QUDMRKL2"  # Followed by the algorithm name, NUL-padded to 16 bytes
+_ALGORITHM_FIELD = 16
+
+_RECORD = struct.Struct("<BI32s")  # depth, key, digest
+_KEY = struct.Struct(">I")
+
+NodePath = Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class MerkleChange:
+    """A subtree that differs between two trees."""
+
+    path: NodePath  # (surah, verse, word, char) prefix; () for the root
+    kind: str  # "added", "removed" (relative to the first tree) or "changed"
+
+    @property
+    def level(self) -> str:
+        """Level name of the changed node (e.g. "verse")."""
+        return LEVELS[len(self.path)]
+
+
+@dataclass
+class MerkleDiff:
+    """Result of comparing two Merkle trees."""
+
+    changes: List[MerkleChange]
+    comparisons: int  # Node hash comparisons performed
+
+
+class MerkleTree:
+    """
+    Merkle hash tree keyed by (surah, verse, word, char) paths.
+
+    Keys are 1-based positions, as in uuid_generator names.
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[NodePath, bytes],
+        children: Dict[NodePath, List[int]],
+        algorithm: str = DEFAULT_HASH_ALGORITHM
+    ):
+        """
+        Initialize from node hashes (use from_leaves(), from_ayat() or load()).
+
+        Args:
+            nodes: Node path -> 32-byte digest
+            children: Node path -> sorted child keys (inner nodes only)
+            algorithm: Algorithm of the digests (see HASH_ALGORITHMS)
+
+        Raises:
+            ValueError: If the algorithm is unknown
+        """
+        if algorithm not in HASH_ALGORITHMS:
+            raise ValueError(
+                f"algorithm must be one of {list(HASH_ALGORITHMS)}, got {algorithm!r}"
+            )
+        self.nodes = nodes
+        self.children = children
+        self.algorithm = algorithm
+
+    @classmethod
+    def from_leaves(
+        cls,
+        leaves: Iterable[Tuple[NodePath, str]],
+        algorithm: str = DEFAULT_HASH_ALGORITHM
+    ) -> "MerkleTree":
+        """
+        Build a tree from leaf contents.
+
+        Args:
+            leaves: (path, content) pairs; all paths have the same length
+                    (e.g. (surah, verse, word, char))
+            algorithm: "sha256" or "blake2b"
+
+        Returns:
+            MerkleTree
+
+        Raises:
+            ValueError: On an unknown algorithm, duplicate paths or paths of
+                        different lengths
+        """
+        if algorithm not in HASH_ALGORITHMS:
+            raise ValueError(
+                f"algorithm must be one of {list(HASH_ALGORITHMS)}, got {algorithm!r}"
+            )
+        new = HASH_ALGORITHMS[algorithm]
+        nodes: Dict[NodePath, bytes] = {}
+        level: List[NodePath] = []
+        depth = None
+        for path, content in leaves:
+            path = tuple(path)
+            if depth is None:
+                depth = len(path)
+            elif len(path) != depth:
+                raise ValueError(f"Leaf paths must all have length {depth}: {path}")
+            if path in nodes:
+                raise ValueError(f"Duplicate leaf path: {path}")
+            nodes[path] = new(b"\x00" + content.encode("utf-8")).digest()
+            level.append(path)
+
+        children: Dict[NodePath, List[int]] = {}
+        if depth is None:
+            nodes[()] = new(b"\x01").digest()  # Empty tree
+            return cls(nodes, children, algorithm)
+
+        for _ in range(depth):
+            for path in level:
+                children.setdefault(path[:-1], []).append(path[-1])
+            level = list(dict.fromkeys(path[:-1] for path in level))
+            for parent in level:
+                keys = children[parent]
+                keys.sort()
+                nodes[parent] = _inner_hash(new, parent, keys, nodes)
+        return cls(nodes, children, algorithm)
+
+    @classmethod
+    def from_ayat(
+        cls,
+        ayat: Iterable[Tuple[int, int, str]],
+        algorithm: str = DEFAULT_HASH_ALGORITHM
+    ) -> "MerkleTree":
+        """
+        Build a character-level tree from verse texts.
+
+        Words are split on whitespace; characters are base letters with
+        their combining marks (so a changed diacritic changes one leaf).
+
+        Args:
+            ayat: (surah, verse, text) triples
+            algorithm: "sha256" or "blake2b"
+
+        Returns:
+            MerkleTree with (surah, verse, word, char) leaves
+        """
+        def leaves():
+            for surah, verse, text in ayat:
+                for w, word in enumerate(text.split(), 1):
+                    for c, cluster in enumerate(_clusters(word), 1):
+                        yield (int(surah), int(verse), w, c), cluster
+
+        return cls.from_leaves(leaves(), algorithm)
+
+    @property
+    def root_hash(self) -> str:
+        """Hex-encoded root hash (equal for equal datasets)."""
+        return self.nodes[()].hex()
+
+    @property
+    def depth(self) -> int:
+        """Depth of the deepest stored nodes (4 for character leaves)."""
+        return max(map(len, self.nodes))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def hash(self, path: NodePath = ()) -> Optional[str]:
+        """
+        Get the hex-encoded hash of a subtree.
+
+        Args:
+            path: Node path, e.g. (2,) for surah 2 or (2, 255) for a verse
+
+        Returns:
+            Hex hash, or None if the node does not exist
+        """
+        digest = self.nodes.get(tuple(path))
+        return digest.hex() if digest is not None else None
+
+    def diff(self, other: "MerkleTree", max_depth: Optional[int] = None) -> MerkleDiff:
+        """
+        Find the subtrees that differ, descending only into changed nodes.
+
+        Args:
+            other: Tree to compare with
+            max_depth: Stop descending at this depth (e.g. 2 reports verses)
+
+        Returns:
+            MerkleDiff with the differing nodes in path order. A node is
+            reported "changed" at the deepest level both trees (and
+            max_depth) allow.
+
+        Raises:
+            ValueError: If the trees were hashed with different algorithms
+        """
+        if self.algorithm != other.algorithm:
+            raise ValueError(
+                f"Cannot compare a {self.algorithm} tree with a {other.algorithm} tree"
+            )
+        changes: List[MerkleChange] = []
+        comparisons = 1
+        if self.nodes[()] == other.nodes[()]:
+            return MerkleDiff(changes, comparisons)
+
+        def descend(path: NodePath):
+            nonlocal comparisons
+            mine = self.children.get(path)
+            theirs = other.children.get(path)
+            if not mine or not theirs or len(path) == max_depth:
+                changes.append(MerkleChange(path, "changed"))
+                return
+            their_keys = set(theirs)
+            my_keys = set(mine)
+            for key in sorted(my_keys | their_keys):
+                child = path + (key,)
+                if key not in their_keys:
+                    changes.append(MerkleChange(child, "removed"))
+                elif key not in my_keys:
+                    changes.append(MerkleChange(child, "added"))
+                else:
+                    comparisons += 1
+                    if self.nodes[child] != other.nodes[child]:
+                        descend(child)
+
+        descend(())
+        return MerkleDiff(changes, comparisons)
+
+    def truncate(self, depth: int) -> "MerkleTree":
+        """
+        Keep only nodes down to a depth (hashes are unchanged).
+
+        Returns:
+            New MerkleTree, e.g. depth=2 keeps mushaf, surah and verse nodes
+        """
+        nodes = {path: digest for path, digest in self.nodes.items() if len(path) <= depth}
+        children = {path: keys for path, keys in self.children.items() if len(path) < depth}
+        return MerkleTree(nodes, children, self.algorithm)
+
+    def save(self, path: Union[str, Path], depth: Optional[int] = None) -> Path:
+        """
+        Persist node hashes (preorder records of depth, key and digest).
+
+        Args:
+            path: Output file
+            depth: Deepest level to store (default: all; 2 stores verse hashes)
+
+        Returns:
+            Path to the file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        limit = self.depth if depth is None else depth
+        records = [_RECORD.pack(0, 0, self.nodes[()])]
+
+        def walk(node: NodePath):
+            if len(node) >= limit:
+                return
+            for key in self.children.get(node, ()):
+                child = node + (key,)
+                records.append(_RECORD.pack(len(child), key, self.nodes[child]))
+                walk(child)
+
+        walk(())
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(self.algorithm.encode("ascii").ljust(_ALGORITHM_FIELD, b"\0"))
+            f.write(b"".join(records))
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "MerkleTree":
+        """
+        Load node hashes written by save() (files without an algorithm
+        field are SHA-256).
+
+        Raises:
+            ValueError: If the file is not a Merkle tree file
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data.startswith(MAGIC):
+            header = len(MAGIC) + _ALGORITHM_FIELD
+            algorithm = data[len(MAGIC):header].rstrip(b"\0").decode("ascii", "replace")
+        elif data.startswith(MAGIC_V1):
+            header, algorithm = len(MAGIC_V1), "sha256"
+        else:
+            raise ValueError(f"Not a Merkle tree file: {path}")
+        if algorithm not in HASH_ALGORITHMS or (len(data) - header) % _RECORD.size:
+            raise ValueError(f"Not a Merkle tree file: {path}")
+
+        nodes: Dict[NodePath, bytes] = {}
+        children: Dict[NodePath, List[int]] = {}
+        stack: List[int] = []  # Keys of the current path
+        for depth, key, digest in _RECORD.iter_unpack(memoryview(data)[header:]):
+            if depth == 0:
+                nodes[()] = digest
+                continue
+            del stack[depth - 1:]
+            parent = tuple(stack)
+            stack.append(key)
+            nodes[parent + (key,)] = digest
+            children.setdefault(parent, []).append(key)
+        return cls(nodes, children, algorithm)
+
+
+def _inner_hash(
+    new: Callable[..., Any],
+    path: NodePath,
+    keys: List[int],
+    nodes: Dict[NodePath, bytes]
+) -> bytes:
+    """Hash an inner node from its sorted child keys and digests."""
+    digest = new(b"\x01")
+    for key in keys:
+        digest.update(_KEY.pack(key))
+        digest.update(nodes[path + (key,)])
+    return digest.digest()
+
+
+def _clusters(word: str) -> List[str]:
+    """Split a word into base letters with their combining marks."""
+    clusters: List[str] = []
+    for ch in word:
+        if clusters and unicodedata.combining(ch):
+            clusters[-1] += ch
+        else:
+            clusters.append(ch)
+    return clusters
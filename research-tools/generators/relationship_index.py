@@ -0,0 +1,764 @@
+"""
+Relationship Index
+
+Tier 2 (Reusable Research Tool)
+
+Indexed store for cross-layer mappings as defined by
+schemas/cross-layer-mappings/entity-mapping-schema.json. Each mapping links
+one source entity to one or more target entities; the index keeps the edges
+grouped by edge type (source layer, target layer, mapping type) with
+adjacency lists in both directions, so that 1:N (verse -> words), N:1
+(character -> word) and N:M traversals over several hops (verse -> words ->
+characters, page -> lines -> words) are a few dictionary lookups each.
+
+Mappings are deduplicated by their semantic hash: SemanticHasher's
+relationship hash of (source entity, target entities, mapping type and both
+layer references). Mappings without a mapping_id get a deterministic UUID v5
+derived from that hash, so rebuilding an index yields the same IDs.
+
+Entity IDs are interned to integers and the index persists in a compact
+binary file: 16-byte UUIDs, 32-byte digests and little-endian integer
+arrays, with a small JSON header for layer references and optional fields.
+
+Example:
+    >>> index = RelationshipIndex()
+    >>> index.add(verse_layer, verse_id, word_layer, word_ids, "composition")
+    >>> index.add(word_layer, word_id, char_layer, char_ids, "composition")
+    >>> index.traverse([verse_id], ["WRD", "CHR"])  # All characters of the verse
+    >>> index.sources(char_id, layer="WRD")  # The word containing a character
+    >>> index.save("hafs.qudrel")
+"""
+
+import json
+import os
+import re
+import struct
+import sys
+import uuid
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .canonical_json import canonical_dumps
+from .semantic_hasher import DEFAULT_HASH_ALGORITHM, HASH_ALGORITHMS, SemanticHasher
+from .uuid_generator import QUD_NAMESPACE, pack_ids, unpack_ids
+
+
+# Enumerations from entity-mapping-schema.json
+LAYER_CODES = (
+    "CHR", "SYM", "TJW", "WRD", "UTH", "QSY", "SNT", "AYA",
+    "SUR", "QIR", "MSH", "DIV", "PAG", "LIN", "EDN", "RDR",
+)
+MAPPING_TYPES = (
+    "expansion", "contraction", "identity", "derivation",
+    "aggregation", "composition", "cross_context",
+)
+CARDINALITIES = ("1:1", "1:N", "N:1", "N:M")
+
+DEFAULT_LAYER_VERSION = "1.0.0"
+DEFAULT_MAPPING_VERSION = "1.0.0"
+
+# Algorithms entity-mapping-schema.json's semantic_hash pattern accepts
+MAPPING_HASH_ALGORITHMS = ("sha256",)
+
+INDEX_SUFFIX = ".qudrel"
+INDEX_FORMAT_VERSION = 1
+
+MAGIC = b"QUDRELX1"
+
+# Optional schema fields kept per mapping (stored in the file header)
+_OPTIONAL_FIELDS = (
+    "position_metadata", "provenance", "bidirectional_ref",
+    "canonical_id", "validation_status",
+)
+
+_LENGTH = struct.Struct("<Q")
+_SWAP = sys.byteorder != "little"  # Integer arrays are stored little-endian
+
+# (source layer index, target layer index, mapping type)
+EdgeType = Tuple[int, int, str]
+
+# Entity and mapping IDs are stored as 16 bytes and read back in this form
+_UUID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+class RelationshipIndex:
+    """
+    Bidirectional adjacency index over cross-layer mappings.
+
+    Query methods take and return entity UUID strings (lowercase and
+    hyphenated, as checked when mappings are added); unknown entities have
+    no neighbours.
+    """
+
+    def __init__(self, algorithm: str = DEFAULT_HASH_ALGORITHM):
+        """
+        Initialize an empty index.
+
+        Args:
+            algorithm: Semantic hash algorithm; only those the schema's
+                       semantic_hash pattern accepts (MAPPING_HASH_ALGORITHMS)
+
+        Raises:
+            ValueError: If the algorithm is not allowed by the schema
+        """
+        if algorithm not in MAPPING_HASH_ALGORITHMS:
+            raise ValueError(
+                f"semantic_hash must use one of {list(MAPPING_HASH_ALGORITHMS)} "
+                f"(entity-mapping-schema.json), got {algorithm!r}"
+            )
+        self.hasher = SemanticHasher(algorithm)
+        self._hash_digits = 2 * HASH_ALGORITHMS[algorithm]().digest_size
+        self._hash_pattern = re.compile(
+            rf"{re.escape(algorithm)}:[0-9a-f]{{{self._hash_digits}}}"
+        )
+
+        # Interned entities
+        self._ids: List[str] = []
+        self._nodes: Dict[str, int] = {}
+
+        # Interned layer references (canonical JSON -> index) and edge types
+        self._layers: List[Dict[str, Any]] = []
+        self._layer_keys: Dict[str, int] = {}
+        self._types: List[EdgeType] = []
+        self._type_index: Dict[EdgeType, int] = {}
+        self._selections: Dict[Tuple[Optional[str], Optional[str], bool], List[int]] = {}
+
+        # Adjacency per edge type: node -> ordered neighbour nodes
+        self._forward: List[Dict[int, List[int]]] = []
+        self._reverse: List[Dict[int, List[int]]] = []
+
+        # Mappings, one entry per list/array position
+        self._mapping_ids: List[str] = []
+        self._mapping_rows: Dict[str, int] = {}
+        self._hashes: List[str] = []
+        self._hash_rows: Dict[str, int] = {}
+        self._mapping_types = array("I")
+        self._mapping_sources = array("I")
+        self._mapping_targets: List[Tuple[int, ...]] = []
+        self._cardinalities = array("B")
+        self._versions: List[str] = []
+        self._mapping_versions = array("H")
+
+        # Distinct optional-field dicts; per mapping 0 = none, else index + 1
+        self._extras: List[Dict[str, Any]] = []
+        self._extra_keys: Dict[str, int] = {}
+        self._mapping_extras = array("I")
+
+    @property
+    def algorithm(self) -> str:
+        """Semantic hash algorithm."""
+        return self.hasher.algorithm
+
+    def __len__(self) -> int:
+        return len(self._mapping_ids)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._nodes
+
+    @property
+    def entity_count(self) -> int:
+        """Number of distinct entities referenced by mappings."""
+        return len(self._ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of distinct source -> target edges across all types."""
+        return sum(len(targets) for forward in self._forward for targets in forward.values())
+
+    @property
+    def edge_types(self) -> List[Tuple[str, str, str]]:
+        """(source layer code, target layer code, mapping type) of each edge type."""
+        layers = self._layers
+        return [(layers[s]["code"], layers[t]["code"], kind) for s, t, kind in self._types]
+
+    # -------------------------------------------------------------------------
+    # Adding mappings
+    # -------------------------------------------------------------------------
+
+    def add(
+        self,
+        source_layer: Dict[str, Any],
+        source_id: str,
+        target_layer: Dict[str, Any],
+        target_ids: Sequence[str],
+        mapping_type: str,
+        cardinality: Optional[str] = None,
+        **fields: Any
+    ) -> str:
+        """
+        Add a mapping from its parts.
+
+        Args:
+            source_layer: Layer reference ({"code", "context", "version"})
+            source_id: Source entity UUID
+            target_layer: Layer reference of the targets
+            target_ids: Target entity UUIDs, in order
+            mapping_type: One of MAPPING_TYPES
+            cardinality: One of CARDINALITIES (default: "1:1" for one target,
+                         otherwise "1:N")
+            **fields: Other schema fields (mapping_id, mapping_version,
+                      position_metadata, provenance, ...)
+
+        Returns:
+            mapping_id of the added mapping, or of the existing duplicate
+
+        Example:
+            >>> hafs = {"qiraah": "hafs"}
+            >>> index.add({"code": "AYA", "context": hafs}, verse_id,
+            ...           {"code": "WRD", "context": hafs}, word_ids, "composition")
+        """
+        if cardinality is None:
+            cardinality = "1:1" if len(target_ids) == 1 else "1:N"
+        mapping = {
+            "source": {"layer": source_layer, "entity_id": source_id},
+            "target": {"layer": target_layer, "entity_ids": list(target_ids)},
+            "mapping_type": mapping_type,
+            "cardinality": cardinality,
+            "mapping_version": DEFAULT_MAPPING_VERSION,
+        }
+        mapping.update(fields)
+        row = self._add(mapping, None)
+        return self._mapping_ids[row]
+
+    def add_mapping(self, mapping: Dict[str, Any]) -> bool:
+        """
+        Add a mapping dictionary shaped like entity-mapping-schema.json.
+
+        mapping_id, mapping_version and semantic_hash are optional here and
+        filled in when missing.
+
+        Returns:
+            True if added, False if a mapping with the same semantic hash
+            is already indexed
+
+        Raises:
+            ValueError: On missing fields, unknown enumeration values, IDs
+                        that are not lowercase UUID strings, or a semantic
+                        hash that is not a full digest of the index algorithm
+        """
+        count = len(self._mapping_ids)
+        self._add(mapping, None)
+        return len(self._mapping_ids) > count
+
+    def add_mappings(
+        self,
+        mappings: Iterable[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        executor: str = "serial"
+    ) -> int:
+        """
+        Add many mapping dictionaries, hashing them in one batch.
+
+        Args:
+            mappings: Mapping dictionaries (as in add_mapping)
+            max_workers: Pool size for hashing (see SemanticHasher.hash_many)
+            executor: "serial", "thread" or "process"
+
+        Returns:
+            Number of mappings added (duplicates are skipped)
+        """
+        mappings = list(mappings)
+        missing = [i for i, mapping in enumerate(mappings) if not mapping.get("semantic_hash")]
+        digests = self.hasher.hash_relationships_many(
+            [_relationship(mappings[i]) for i in missing],
+            max_workers=max_workers, executor=executor,
+        )
+        hashes: List[Optional[str]] = [None] * len(mappings)
+        for i, digest in zip(missing, digests):
+            hashes[i] = f"{self.algorithm}:{digest}"
+
+        count = len(self._mapping_ids)
+        for mapping, semantic_hash in zip(mappings, hashes):
+            self._add(mapping, semantic_hash)
+        return len(self._mapping_ids) - count
+
+    def _add(self, mapping: Dict[str, Any], semantic_hash: Optional[str]) -> int:
+        """Index one mapping; return its row (the existing row for duplicates)."""
+        for field in ("source", "target", "mapping_type", "cardinality"):
+            if field not in mapping:
+                raise ValueError(f"Mapping is missing required field {field!r}")
+        source = mapping["source"]
+        target = mapping["target"]
+        mapping_type = mapping["mapping_type"]
+        cardinality = mapping["cardinality"]
+        if mapping_type not in MAPPING_TYPES:
+            raise ValueError(f"Unknown mapping_type {mapping_type!r}")
+        if cardinality not in CARDINALITIES:
+            raise ValueError(f"Unknown cardinality {cardinality!r}")
+        target_ids = target["entity_ids"]
+        if not target_ids:
+            raise ValueError("Mapping must have at least one target entity")
+        nodes = self._nodes
+        for entity_id in (source["entity_id"], *target_ids):
+            if entity_id not in nodes:
+                _check_uuid(entity_id, "entity_id")
+
+        if semantic_hash is None:
+            semantic_hash = mapping.get("semantic_hash") or (
+                f"{self.algorithm}:{self.hasher.hash_relationship(*_relationship(mapping))}"
+            )
+        if not isinstance(semantic_hash, str) or not self._hash_pattern.fullmatch(semantic_hash):
+            raise ValueError(
+                f"semantic_hash {semantic_hash!r} is not a {self.algorithm} hash "
+                f"({self.algorithm}: and {self._hash_digits} lowercase hex digits)"
+            )
+        row = self._hash_rows.get(semantic_hash)
+        if row is not None:
+            return row
+
+        mapping_id = mapping.get("mapping_id") or _mapping_uuid(semantic_hash)
+        _check_uuid(mapping_id, "mapping_id")
+        if mapping_id in self._mapping_rows:
+            raise ValueError(f"Duplicate mapping_id {mapping_id} with a different mapping")
+
+        type_index = self._edge_type(
+            self._layer(source["layer"]), self._layer(target["layer"]), mapping_type
+        )
+        src = self._node(source["entity_id"])
+        node = self._node
+        targets = tuple(dict.fromkeys(node(entity_id) for entity_id in target_ids))
+        self._link(type_index, src, _ordered(targets, mapping.get("position_metadata")))
+
+        row = len(self._mapping_ids)
+        self._mapping_ids.append(mapping_id)
+        self._mapping_rows[mapping_id] = row
+        self._hashes.append(semantic_hash)
+        self._hash_rows[semantic_hash] = row
+        self._mapping_types.append(type_index)
+        self._mapping_sources.append(src)
+        self._mapping_targets.append(targets)
+        self._cardinalities.append(CARDINALITIES.index(cardinality))
+        self._mapping_versions.append(
+            self._version(mapping.get("mapping_version", DEFAULT_MAPPING_VERSION))
+        )
+        extras = {field: mapping[field] for field in _OPTIONAL_FIELDS if field in mapping}
+        self._mapping_extras.append(self._extra(extras) + 1 if extras else 0)
+        return row
+
+    def _link(self, type_index: int, src: int, targets: Sequence[int]):
+        """Add edges to the forward and reverse adjacency of an edge type."""
+        forward = self._forward[type_index]
+        existing = forward.get(src)
+        if existing is None:
+            forward[src] = list(targets)
+        else:
+            existing.extend(t for t in targets if t not in existing)
+        reverse = self._reverse[type_index]
+        for t in targets:
+            sources = reverse.get(t)
+            if sources is None:
+                reverse[t] = [src]
+            elif src not in sources:
+                sources.append(src)
+
+    def _node(self, entity_id: str) -> int:
+        node = self._nodes.get(entity_id)
+        if node is None:
+            node = self._nodes[entity_id] = len(self._ids)
+            self._ids.append(entity_id)
+        return node
+
+    def _layer(self, layer: Dict[str, Any]) -> int:
+        layer = _normalize_layer(layer)
+        key = canonical_dumps(layer)
+        index = self._layer_keys.get(key)
+        if index is None:
+            index = self._layer_keys[key] = len(self._layers)
+            self._layers.append(layer)
+        return index
+
+    def _edge_type(self, source_layer: int, target_layer: int, mapping_type: str) -> int:
+        edge_type = (source_layer, target_layer, mapping_type)
+        index = self._type_index.get(edge_type)
+        if index is None:
+            index = self._type_index[edge_type] = len(self._types)
+            self._types.append(edge_type)
+            self._forward.append({})
+            self._reverse.append({})
+            self._selections.clear()
+        return index
+
+    def _extra(self, extras: Dict[str, Any]) -> int:
+        key = canonical_dumps(extras)
+        index = self._extra_keys.get(key)
+        if index is None:
+            index = self._extra_keys[key] = len(self._extras)
+            self._extras.append(extras)
+        return index
+
+    def _version(self, version: str) -> int:
+        try:
+            return self._versions.index(version)
+        except ValueError:
+            self._versions.append(version)
+            return len(self._versions) - 1
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def targets(
+        self,
+        entity_id: str,
+        mapping_type: Optional[str] = None,
+        layer: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get the targets of an entity (1:N direction).
+
+        Args:
+            entity_id: Source entity UUID
+            mapping_type: Only follow this mapping type
+            layer: Only return targets in this layer (code, e.g. "WRD")
+
+        Returns:
+            Target entity UUIDs in mapping order
+        """
+        return self._neighbours(entity_id, self._select(mapping_type, layer, False), False)
+
+    def sources(
+        self,
+        entity_id: str,
+        mapping_type: Optional[str] = None,
+        layer: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get the sources mapping to an entity (N:1 direction).
+
+        Args:
+            entity_id: Target entity UUID
+            mapping_type: Only follow this mapping type
+            layer: Only return sources in this layer (code, e.g. "AYA")
+
+        Returns:
+            Source entity UUIDs in insertion order
+        """
+        return self._neighbours(entity_id, self._select(mapping_type, layer, True), True)
+
+    def traverse(
+        self,
+        entity_ids: Iterable[str],
+        layers: Sequence[str],
+        mapping_type: Optional[str] = None,
+        reverse: bool = False
+    ) -> List[str]:
+        """
+        Follow mappings over several hops, one layer per hop.
+
+        Args:
+            entity_ids: Start entities
+            layers: Layer code reached by each hop, e.g. ["WRD", "CHR"]
+            mapping_type: Only follow this mapping type
+            reverse: Follow mappings from targets to sources
+                     (e.g. ["WRD", "AYA"] from characters)
+
+        Returns:
+            Distinct entity UUIDs reached by the last hop, in traversal order
+
+        Example:
+            >>> index.traverse([page_id], ["LIN", "WRD"])  # Words on a page
+        """
+        adjacency = self._reverse if reverse else self._forward
+        nodes = self._nodes
+        frontier = [nodes[e] for e in entity_ids if e in nodes]
+        for layer in layers:
+            lists = [adjacency[t] for t in self._select(mapping_type, layer, reverse)]
+            reached: Dict[int, None] = {}
+            for node in frontier:
+                for neighbours in lists:
+                    found = neighbours.get(node)
+                    if found:
+                        reached.update(dict.fromkeys(found))
+            frontier = list(reached)
+        ids = self._ids
+        return [ids[node] for node in frontier]
+
+    def _neighbours(self, entity_id: str, selected: List[int], reverse: bool) -> List[str]:
+        node = self._nodes.get(entity_id)
+        if node is None:
+            return []
+        adjacency = self._reverse if reverse else self._forward
+        ids = self._ids
+        if len(selected) == 1:
+            return [ids[n] for n in adjacency[selected[0]].get(node, ())]
+        found: Dict[int, None] = {}
+        for t in selected:
+            found.update(dict.fromkeys(adjacency[t].get(node, ())))
+        return [ids[n] for n in found]
+
+    def _select(
+        self,
+        mapping_type: Optional[str],
+        layer: Optional[str],
+        reverse: bool
+    ) -> List[int]:
+        """Edge types matching a mapping type and the layer reached (cached)."""
+        key = (mapping_type, layer, reverse)
+        selected = self._selections.get(key)
+        if selected is None:
+            side = 0 if reverse else 1
+            selected = [
+                i for i, edge_type in enumerate(self._types)
+                if (mapping_type is None or edge_type[2] == mapping_type)
+                and (layer is None or self._layers[edge_type[side]]["code"] == layer)
+            ]
+            self._selections[key] = selected
+        return selected
+
+    # -------------------------------------------------------------------------
+    # Mapping records
+    # -------------------------------------------------------------------------
+
+    def get(self, mapping_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a mapping dictionary by mapping_id.
+
+        Returns:
+            Mapping shaped like entity-mapping-schema.json, or None
+        """
+        row = self._mapping_rows.get(mapping_id)
+        return self._mapping(row) if row is not None else None
+
+    def find(self, semantic_hash: str) -> Optional[Dict[str, Any]]:
+        """Get a mapping dictionary by semantic hash ("<algorithm>:<hex>"), or None."""
+        row = self._hash_rows.get(semantic_hash)
+        return self._mapping(row) if row is not None else None
+
+    def mappings(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all mapping dictionaries in insertion order."""
+        for row in range(len(self._mapping_ids)):
+            yield self._mapping(row)
+
+    def _mapping(self, row: int) -> Dict[str, Any]:
+        source_layer, target_layer, mapping_type = self._types[self._mapping_types[row]]
+        ids = self._ids
+        mapping = {
+            "mapping_id": self._mapping_ids[row],
+            "source": {
+                "layer": dict(self._layers[source_layer]),
+                "entity_id": ids[self._mapping_sources[row]],
+            },
+            "target": {
+                "layer": dict(self._layers[target_layer]),
+                "entity_ids": [ids[n] for n in self._mapping_targets[row]],
+            },
+            "mapping_type": mapping_type,
+            "cardinality": CARDINALITIES[self._cardinalities[row]],
+            "mapping_version": self._versions[self._mapping_versions[row]],
+            "semantic_hash": self._hashes[row],
+        }
+        extras = self._mapping_extras[row]
+        if extras:
+            mapping.update(json.loads(canonical_dumps(self._extras[extras - 1])))  # Deep copy
+        return mapping
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Persist the index in a compact binary file.
+
+        Layout: MAGIC, JSON header length and header, then packed entity
+        UUIDs, mapping UUIDs, hash digests and little-endian arrays of edge
+        types, sources, cardinalities, versions, optional fields, target
+        offsets and targets.
+        Adjacency lists are rebuilt on load.
+
+        Args:
+            path: Output file (INDEX_SUFFIX by convention)
+
+        Returns:
+            Path to the file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        count = len(self._mapping_ids)
+
+        offsets = array("I", [0])
+        targets = array("I")
+        for mapping_targets in self._mapping_targets:
+            targets.extend(mapping_targets)
+            offsets.append(len(targets))
+
+        header = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "hash_algorithm": self.algorithm,
+            "entity_count": len(self._ids),
+            "mapping_count": count,
+            "layers": self._layers,
+            "edge_types": [list(edge_type) for edge_type in self._types],
+            "mapping_versions": self._versions,
+            "extras": self._extras,
+        }
+        prefix = len(self.algorithm) + 1
+        sections = [
+            pack_ids(self._ids),
+            pack_ids(self._mapping_ids),
+            b"".join(bytes.fromhex(semantic_hash[prefix:]) for semantic_hash in self._hashes),
+            _array_bytes(self._mapping_types),
+            _array_bytes(self._mapping_sources),
+            _array_bytes(self._cardinalities),
+            _array_bytes(self._mapping_versions),
+            _array_bytes(self._mapping_extras),
+            _array_bytes(offsets),
+            _array_bytes(targets),
+        ]
+
+        encoded = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        partial = path.with_name(path.name + ".partial")
+        with open(partial, "wb") as f:
+            f.write(MAGIC)
+            f.write(_LENGTH.pack(len(encoded)))
+            f.write(encoded)
+            for section in sections:
+                f.write(section)
+        os.replace(partial, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "RelationshipIndex":
+        """
+        Load an index written by save().
+
+        Raises:
+            ValueError: If the file is not a relationship index or is truncated
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"Not a relationship index file: {path}")
+        position = len(MAGIC)
+        (length,) = _LENGTH.unpack_from(data, position)
+        position += _LENGTH.size
+        header = json.loads(data[position:position + length].decode("utf-8"))
+        position += length
+        if header.get("format_version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported index format version: {header.get('format_version')}")
+
+        algorithm = header["hash_algorithm"]
+        if algorithm not in MAPPING_HASH_ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm in {path}: {algorithm}")
+        entities = header["entity_count"]
+        count = header["mapping_count"]
+        digest_size = HASH_ALGORITHMS[algorithm]().digest_size
+
+        def take(size: int) -> bytes:
+            nonlocal position
+            chunk = data[position:position + size]
+            if len(chunk) != size:
+                raise ValueError(f"Truncated relationship index file: {path}")
+            position += size
+            return chunk
+
+        index = cls(algorithm)
+        index._ids = unpack_ids(take(16 * entities))
+        index._nodes = {entity_id: node for node, entity_id in enumerate(index._ids)}
+        index._mapping_ids = unpack_ids(take(16 * count))
+        index._mapping_rows = {
+            mapping_id: row for row, mapping_id in enumerate(index._mapping_ids)
+        }
+        digests = take(digest_size * count)
+        index._hashes = [
+            f"{algorithm}:{digests[i:i + digest_size].hex()}"
+            for i in range(0, len(digests), digest_size)
+        ]
+        index._hash_rows = {semantic_hash: row for row, semantic_hash in enumerate(index._hashes)}
+        index._mapping_types = _read_array("I", take(4 * count))
+        index._mapping_sources = _read_array("I", take(4 * count))
+        index._cardinalities = _read_array("B", take(count))
+        index._mapping_versions = _read_array("H", take(2 * count))
+        index._mapping_extras = _read_array("I", take(4 * count))
+        offsets = _read_array("I", take(4 * (count + 1)))
+        targets = _read_array("I", take(4 * offsets[-1]))
+
+        index._layers = header["layers"]
+        index._layer_keys = {canonical_dumps(layer): i for i, layer in enumerate(index._layers)}
+        for source_layer, target_layer, mapping_type in header["edge_types"]:
+            index._edge_type(source_layer, target_layer, mapping_type)
+        index._versions = header["mapping_versions"]
+        index._extras = header["extras"]
+        index._extra_keys = {canonical_dumps(extras): i for i, extras in enumerate(index._extras)}
+
+        mapping_targets = index._mapping_targets
+        link = index._link
+        extras = index._extras
+        for row in range(count):
+            row_targets = tuple(targets[offsets[row]:offsets[row + 1]])
+            mapping_targets.append(row_targets)
+            extra = index._mapping_extras[row]
+            if extra:
+                position = extras[extra - 1].get("position_metadata")
+                row_targets = _ordered(row_targets, position)
+            link(index._mapping_types[row], index._mapping_sources[row], row_targets)
+        return index
+
+
+def _normalize_layer(layer: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate a layer reference and fill in the default version."""
+    code = layer.get("code")
+    if code not in LAYER_CODES:
+        raise ValueError(f"Unknown layer code {code!r}")
+    return {
+        "code": code,
+        "context": dict(layer.get("context") or {}),
+        "version": layer.get("version", DEFAULT_LAYER_VERSION),
+    }
+
+
+def _relationship(mapping: Dict[str, Any]) -> Tuple[str, str, str]:
+    """
+    Relationship triple hashed as a mapping's semantic hash.
+
+    The relationship type includes both layer references, so equal entity
+    IDs mapped between different layer contexts hash differently.
+    """
+    source = mapping["source"]
+    target = mapping["target"]
+    relationship_type = "{}:{}>{}".format(
+        mapping["mapping_type"],
+        canonical_dumps(_normalize_layer(source["layer"])),
+        canonical_dumps(_normalize_layer(target["layer"])),
+    )
+    return source["entity_id"], ",".join(target["entity_ids"]), relationship_type
+
+
+def _ordered(targets: Tuple[int, ...], position_metadata: Optional[Dict]) -> Tuple[int, ...]:
+    """Sort target nodes by position_metadata["order"] when it has one entry per target."""
+    order = (position_metadata or {}).get("order")
+    if not order or len(order) != len(targets):
+        return targets
+    return tuple(target for _, target in sorted(zip(order, targets)))
+
+
+def _check_uuid(value: Any, name: str):
+    """
+    Reject IDs that would not survive save() and load() unchanged.
+
+    Raises:
+        ValueError: If value is not a lowercase, hyphenated UUID string
+    """
+    if not isinstance(value, str) or not _UUID_PATTERN.fullmatch(value):
+        raise ValueError(f"{name} must be a lowercase UUID string, got {value!r}")
+
+
+def _mapping_uuid(semantic_hash: str) -> str:
+    """Deterministic mapping_id for a semantic hash."""
+    return str(uuid.uuid5(QUD_NAMESPACE, f"mapping:{semantic_hash}"))
+
+
+def _array_bytes(values: array) -> bytes:
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_array(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if _SWAP:
+        values.byteswap()
+    return values
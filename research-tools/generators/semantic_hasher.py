@@ -3,27 +3,65 @@ Semantic Hash Generator
 
 Tier 2 (Reusable Research Tool)
 
-Generates semantic hashes for relationship representation using SHA-256.
+Generates semantic hashes for relationship representation using SHA-256
+(default) or BLAKE2b. The algorithm used for a layer is recorded in its
+metadata (LayerGenerator.hash_algorithm), since hashes of different
+algorithms never match.
+
+Entity IDs may be UUID strings or 16-byte binary values; both hash the same.
+Large batches are hashed with hash_many() / hash_relationships_many(),
+serially by default; a thread or process pool is opt-in, since pickling
+short items to worker processes costs more than hashing them (0.6x on the
+benchmark). Whole datasets are hashed as Merkle trees (see merkle_tree),
+with the hasher's algorithm, so that comparisons descend only into changed
+surahs, verses and words.
 """
 
-import hashlib
-from typing import Any, Dict, List
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .canonical_json import update_canonical
+from .merkle_tree import DEFAULT_HASH_ALGORITHM, HASH_ALGORITHMS, MerkleTree
+from .uuid_generator import uuid_to_str
+
+EntityID = Union[str, bytes]
+Relationship = Tuple[EntityID, EntityID, str]  # (source_id, target_id, relationship_type)
+
+EXECUTORS = ("serial", "thread", "process")
+DEFAULT_EXECUTOR = "serial"
+
+# Items per task sent to a worker by hash_many()/hash_relationships_many()
+DEFAULT_BATCH_SIZE = 20000
 
 
 class SemanticHasher:
     """
     Generate semantic hashes for Quranic data relationships.
 
-    Uses SHA-256 for stable, reproducible hashes.
+    Uses SHA-256 by default for stable, reproducible hashes.
     """
 
-    def __init__(self):
-        """Initialize hasher."""
-        pass
+    def __init__(self, algorithm: str = DEFAULT_HASH_ALGORITHM):
+        """
+        Initialize hasher.
+
+        Args:
+            algorithm: "sha256" or "blake2b" (256-bit digest)
+
+        Raises:
+            ValueError: If the algorithm is unknown
+        """
+        if algorithm not in HASH_ALGORITHMS:
+            raise ValueError(
+                f"algorithm must be one of {list(HASH_ALGORITHMS)}, got {algorithm!r}"
+            )
+        self.algorithm = algorithm
+        self._new = HASH_ALGORITHMS[algorithm]
 
     def hash_string(self, data: str) -> str:
         """
-        Generate SHA-256 hash of string.
+        Generate hash of string.
 
         Args:
             data: Input string
@@ -31,11 +69,11 @@ class SemanticHasher:
         Returns:
             Hex-encoded hash
         """
-        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+        return self._new(data.encode('utf-8')).hexdigest()
 
     def hash_dict(self, data: Dict[str, Any]) -> str:
         """
-        Generate SHA-256 hash of dictionary.
+        Generate hash of dictionary.
 
         Args:
             data: Input dictionary
@@ -46,36 +84,96 @@ class SemanticHasher:
         Note:
             Dictionary is sorted by keys before hashing to ensure consistency
         """
-        import json
+        return self.hash_json(data)
+
+    def hash_json(self, data: Any) -> str:
+        """
+        Generate hash of any JSON-serializable value.
+
+        The hash covers json.dumps(data, sort_keys=True, ensure_ascii=False),
+        produced by the canonical encoder (see canonical_json) and fed to
+        the hash in chunks for large values. Binary IDs hash as UUID strings.
+
+        Args:
+            data: Input value (dict, list, string, number, ...)
+
+        Returns:
+            Hex-encoded hash
+        """
+        digest = self._new()
+        update_canonical(digest, data)
+        return digest.hexdigest()
 
-        # Sort keys for deterministic hashing
-        normalized = json.dumps(data, sort_keys=True, ensure_ascii=False)
-        return self.hash_string(normalized)
+    def hash_many(
+        self,
+        items: Sequence[Any],
+        max_workers: Optional[int] = None,
+        executor: str = DEFAULT_EXECUTOR,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[str]:
+        """
+        Hash a batch of strings (as hash_string) or other values (as hash_json).
+
+        Args:
+            items: Values to hash
+            max_workers: Pool size (default: CPU count)
+            executor: "serial" (default), "thread" or "process"
+            batch_size: Items per worker task
+
+        Returns:
+            Hex-encoded hashes, in input order
+        """
+        return self._map(_hash_items, items, max_workers, executor, batch_size)
+
+    def hash_relationships_many(
+        self,
+        relationships: Sequence[Relationship],
+        max_workers: Optional[int] = None,
+        executor: str = DEFAULT_EXECUTOR,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[str]:
+        """
+        Hash a batch of relationships (as hash_relationship).
+
+        Args:
+            relationships: (source_id, target_id, relationship_type) triples
+            max_workers: Pool size (default: CPU count)
+            executor: "serial" (default), "thread" or "process"
+            batch_size: Relationships per worker task
+
+        Returns:
+            Hex-encoded hashes, in input order
+
+        Example:
+            >>> hasher.hash_relationships_many(
+            ...     [(word_id, char_id, "contains") for word_id, char_id in pairs]
+            ... )
+        """
+        return self._map(_hash_relationships, relationships, max_workers, executor, batch_size)
 
     def hash_relationship(
         self,
-        source_id: str,
-        target_id: str,
+        source_id: EntityID,
+        target_id: EntityID,
         relationship_type: str
     ) -> str:
         """
         Generate hash for a relationship between entities.
 
         Args:
-            source_id: Source entity UUID
-            target_id: Target entity UUID
+            source_id: Source entity UUID (string or 16 bytes)
+            target_id: Target entity UUID (string or 16 bytes)
             relationship_type: Type of relationship (e.g., "contains", "follows")
 
         Returns:
             Hex-encoded hash
         """
-        relationship_str = f"{source_id}:{relationship_type}:{target_id}"
-        return self.hash_string(relationship_str)
+        return _hash_relationships(self.algorithm, [(source_id, target_id, relationship_type)])[0]
 
     def hash_layer_data(
         self,
         layer_name: str,
-        entity_id: str,
+        entity_id: EntityID,
         data: Dict[str, Any]
     ) -> str:
         """
@@ -83,7 +181,7 @@ class SemanticHasher:
 
         Args:
             layer_name: Layer name (e.g., "layer-00-character-composition")
-            entity_id: Entity UUID
+            entity_id: Entity UUID (string or 16 bytes)
             data: Layer-specific data
 
         Returns:
@@ -91,11 +189,24 @@ class SemanticHasher:
         """
         composite = {
             "layer": layer_name,
-            "entity_id": entity_id,
+            "entity_id": entity_id if isinstance(entity_id, str) else uuid_to_str(entity_id),
             "data": data
         }
         return self.hash_dict(composite)
 
+    def merkle_tree(self, ayat: Iterable[Tuple[int, int, str]]) -> MerkleTree:
+        """
+        Build a Merkle hash tree (mushaf -> surah -> verse -> word -> char).
+
+        Args:
+            ayat: (surah, verse, text) triples
+
+        Returns:
+            MerkleTree hashed with this hasher's algorithm; compare versions
+            with tree.diff(other) or root_hash
+        """
+        return MerkleTree.from_ayat(ayat, algorithm=self.algorithm)
+
     def verify_hash(self, data: str, expected_hash: str) -> bool:
         """
         Verify data against expected hash.
@@ -109,3 +220,53 @@ class SemanticHasher:
         """
         actual_hash = self.hash_string(data)
         return actual_hash == expected_hash
+
+    def _map(
+        self,
+        func: Callable[[str, Sequence[Any]], List[str]],
+        items: Sequence[Any],
+        max_workers: Optional[int],
+        executor: str,
+        batch_size: int
+    ) -> List[str]:
+        """Run func(algorithm, batch) over batches of items, in order."""
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+        items = list(items)
+        workers = max_workers or os.cpu_count() or 1
+        if executor == "serial" or workers == 1 or len(items) <= batch_size:
+            return func(self.algorithm, items)
+
+        batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_class(max_workers=min(workers, len(batches))) as pool:
+            results = pool.map(func, [self.algorithm] * len(batches), batches)
+            return [digest for batch in results for digest in batch]
+
+
+def _hash_items(algorithm: str, items: Sequence[Any]) -> List[str]:
+    """Worker task: hash strings as text and other values as canonical JSON."""
+    new = HASH_ALGORITHMS[algorithm]
+    digests = []
+    for item in items:
+        if type(item) is str:
+            digests.append(new(item.encode('utf-8')).hexdigest())
+        else:
+            digest = new()
+            update_canonical(digest, item)
+            digests.append(digest.hexdigest())
+    return digests
+
+
+def _hash_relationships(algorithm: str, relationships: Sequence[Relationship]) -> List[str]:
+    """Worker task: hash "{source}:{type}:{target}" for each relationship."""
+    new = HASH_ALGORITHMS[algorithm]
+    digests = []
+    for source_id, target_id, relationship_type in relationships:
+        if not isinstance(source_id, str):
+            source_id = uuid_to_str(source_id)
+        if not isinstance(target_id, str):
+            target_id = uuid_to_str(target_id)
+        relationship_str = f"{source_id}:{relationship_type}:{target_id}"
+        digests.append(new(relationship_str.encode('utf-8')).hexdigest())
+    return digests
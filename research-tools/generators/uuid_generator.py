@@ -29,10 +29,21 @@ Examples:
     edition_id("kfgqpc", "hafs_v2")          → King Fahd Hafs v2.0 edition
     reader_id("hafs")                        → Hafs biographical data
     mushaf_id("hafs", "kfgqpc_v2")           → Complete mushaf instance
+
+Bulk generation (one pass, validated once per batch):
+    verse_ids("hafs", [(2, 255), (2, 256)])
+    char_ids("hafs", [(2, 255, 4, 1), (2, 255, 4, 2)])
+    HierarchicalIDBuilder("hafs").char_id(2, 255, 4, 2)  → Reuses hashed prefixes
+
+Binary representation (16 bytes per ID instead of a 36-character string):
+    char_ids("hafs", refs, binary=True)      → List of 16-byte values
+    pack_ids(ids) / unpack_ids(packed)       → Contiguous 16*n byte array
+    uuid_to_str(value) / uuid_to_bytes(value) → Convert at the edges
 """
 
+import hashlib
 import uuid
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 
 # =============================================================================
@@ -86,9 +97,44 @@ KNOWN_NARRATIONS = {
 # INTERNAL HELPERS
 # =============================================================================
 
+# A generated ID: canonical string, or its 16 raw bytes when binary=True
+UUIDValue = Union[str, bytes]
+
+# Callbacks notified of minted IDs as hook(names, ids), e.g. a UUIDResolver.
+# ids are strings or 16-byte values, depending on how they were generated.
+MintHook = Callable[[Sequence[str], Sequence[UUIDValue]], None]
+_mint_hooks: List[MintHook] = []
+
+
+def add_mint_hook(hook: MintHook) -> None:
+    """
+    Register a callback that receives every ID generated from now on.
+
+    Args:
+        hook: Called as hook(names, ids) with equal-length sequences
+    """
+    if hook not in _mint_hooks:
+        _mint_hooks.append(hook)
+
+
+def remove_mint_hook(hook: MintHook) -> None:
+    """Unregister a callback added with add_mint_hook (no-op if absent)."""
+    if hook in _mint_hooks:
+        _mint_hooks.remove(hook)
+
+
+def _notify_minted(names: Sequence[str], ids: Sequence[UUIDValue]) -> None:
+    """Pass minted IDs to every registered hook."""
+    for hook in list(_mint_hooks):
+        hook(names, ids)
+
+
 def _generate(name: str) -> str:
     """Generate UUID v5 from name string."""
-    return str(uuid.uuid5(QUD_NAMESPACE, name))
+    value = str(uuid.uuid5(QUD_NAMESPACE, name))
+    if _mint_hooks:
+        _notify_minted((name,), (value,))
+    return value
 
 
 def _validate_positive(value: int, name: str) -> None:
@@ -103,6 +149,86 @@ def _validate_range(value: int, min_val: int, max_val: int, name: str) -> None:
         raise ValueError(f"{name} must be {min_val}-{max_val}, got {value}")
 
 
+# UUID variant nibble (RFC 4122: 10xx) for each possible SHA-1 hex digit
+_VARIANT_NIBBLE = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+# Same fix-ups on the first 16 digest bytes read as a 128-bit integer:
+# version 5 in the high nibble of byte 6, variant 10 in the top bits of byte 8
+_VERSION_VARIANT_MASK = ~((0xF0 << 72) | (0xC0 << 56)) & ((1 << 128) - 1)
+_VERSION_VARIANT_BITS = (0x50 << 72) | (0x80 << 56)
+
+
+def _generate_many(names: Iterable[str], binary: bool = False) -> List[UUIDValue]:
+    """
+    Generate UUID v5 values for many names.
+
+    Equivalent to [_generate(n) for n in names], but hashes with hashlib
+    directly and formats the digest instead of building UUID objects. With
+    binary=True the 16 raw UUID bytes are returned instead of strings.
+    """
+    if _mint_hooks:
+        names = list(names)
+
+    namespace = QUD_NAMESPACE.bytes
+    sha1 = hashlib.sha1
+    result = _format_digests([sha1(namespace + name.encode("utf-8")).digest() for name in names],
+                             binary)
+
+    if _mint_hooks:
+        _notify_minted(names, result)
+    return result
+
+
+def _format_digests(digests: List[bytes], binary: bool) -> List[UUIDValue]:
+    """Turn SHA-1 digests of namespace + name into UUID v5 strings or bytes."""
+    if binary:
+        from_bytes = int.from_bytes
+        mask, bits = _VERSION_VARIANT_MASK, _VERSION_VARIANT_BITS
+        return [((from_bytes(d[:16], "big") & mask) | bits).to_bytes(16, "big") for d in digests]
+
+    variant = _VARIANT_NIBBLE
+    result = []
+    append = result.append
+    for d in digests:
+        h = d.hex()
+        append(f"{h[:8]}-{h[8:12]}-5{h[13:16]}-{variant[h[16]]}{h[17:20]}-{h[20:32]}")
+    return result
+
+
+def _validate_batch(refs: Iterable[Sequence[int]], fields: Tuple[str, ...]) -> List[Tuple]:
+    """
+    Validate a batch of coordinate tuples once, column by column.
+
+    The first field must be the surah (1-114); every other field must be a
+    positive integer. NumPy arrays of shape (n, len(fields)) are accepted.
+
+    Returns:
+        The refs as a list of tuples
+    """
+    if hasattr(refs, "tolist"):  # NumPy array: convert to Python ints
+        refs = refs.tolist()
+    rows = [tuple(ref) for ref in refs]
+    if not rows:
+        return rows
+
+    width = len(fields)
+    if any(len(row) != width for row in rows):
+        raise ValueError(f"Each ref must have {width} values ({', '.join(fields)})")
+
+    for name, column in zip(fields, zip(*rows)):
+        if not set(map(type, column)) <= {int}:
+            bad = next(v for v in column if type(v) is not int)
+            raise ValueError(f"{name} must be a positive integer, got {bad!r}")
+        low, high = min(column), max(column)
+        if name == "surah":
+            if low < 1 or high > 114:
+                raise ValueError(f"surah must be 1-114, got {low if low < 1 else high}")
+        elif low < 1:
+            raise ValueError(f"{name} must be a positive integer, got {low}")
+
+    return rows
+
+
 # =============================================================================
 # UNIVERSAL (same across all narrations)
 # =============================================================================
@@ -384,6 +510,348 @@ def mushaf_id(narration: str, edition: Optional[str] = None) -> str:
     return _generate(f"msh:{narration}")
 
 
+# =============================================================================
+# HIERARCHICAL BUILDER (structural hierarchy)
+# =============================================================================
+
+# Name tag before each coordinate of a structural prefix (after "{narration}:s")
+_LEVEL_TAGS = ("", ":v", ":w", ":c")
+
+
+class HierarchicalIDBuilder:
+    """
+    Generate structural IDs for one narration, hashing shared prefixes once.
+
+    A UUID v5 is SHA-1 over namespace + name, and every word, char, symbol
+    and sentence name extends its verse (and word, char) name. The builder
+    keeps SHA-1 contexts already fed with the current surah/verse/word/char
+    prefix and finishes each child ID from a .copy() of that context. IDs
+    are bit-identical to the per-entity functions (and uuid.uuid5).
+
+    Reuse is greatest when refs are grouped by verse/word, as they are when
+    a layer is generated in document order.
+
+    Example:
+        >>> builder = HierarchicalIDBuilder("hafs")
+        >>> builder.char_id(2, 255, 4, 2) == char_id("hafs", 2, 255, 4, 2)
+        True
+        >>> ids = builder.char_ids([(2, 255, 4, 1), (2, 255, 4, 2)])
+    """
+
+    def __init__(self, narration: str, binary: bool = False):
+        """
+        Initialize builder.
+
+        Args:
+            narration: Qiraah narration ("hafs", "warsh", etc.)
+            binary: Return 16-byte values instead of strings
+        """
+        self.narration = narration
+        self.binary = binary
+        self._root = hashlib.sha1(QUD_NAMESPACE.bytes + f"{narration}:s".encode("utf-8"))
+        # (prefix coordinates, fed context) for each depth of the current path
+        self._path: List[Tuple[Tuple[int, ...], Any]] = []
+
+    def verse_id(self, surah: int, verse: int) -> UUIDValue:
+        """Generate a verse UUID (same as verse_id())."""
+        _validate_range(surah, 1, 114, "surah")
+        _validate_positive(verse, "verse")
+        return self._many([(surah, verse)], ":v")[0]
+
+    def word_id(self, surah: int, verse: int, word: int) -> UUIDValue:
+        """Generate a word UUID (same as word_id())."""
+        _validate_range(surah, 1, 114, "surah")
+        _validate_positive(verse, "verse")
+        _validate_positive(word, "word")
+        return self._many([(surah, verse, word)], ":w")[0]
+
+    def char_id(self, surah: int, verse: int, word: int, char: int) -> UUIDValue:
+        """Generate a character UUID (same as char_id())."""
+        _validate_range(surah, 1, 114, "surah")
+        _validate_positive(verse, "verse")
+        _validate_positive(word, "word")
+        _validate_positive(char, "char")
+        return self._many([(surah, verse, word, char)], ":c")[0]
+
+    def symbol_id(self, surah: int, verse: int, word: int, char: int, symbol: int) -> UUIDValue:
+        """Generate a symbol UUID (same as symbol_id())."""
+        _validate_range(surah, 1, 114, "surah")
+        _validate_positive(verse, "verse")
+        _validate_positive(word, "word")
+        _validate_positive(char, "char")
+        _validate_positive(symbol, "symbol")
+        return self._many([(surah, verse, word, char, symbol)], ":sym")[0]
+
+    def sentence_id(self, surah: int, verse: int, sentence: int) -> UUIDValue:
+        """Generate a sentence UUID (same as sentence_id())."""
+        _validate_range(surah, 1, 114, "surah")
+        _validate_positive(verse, "verse")
+        _validate_positive(sentence, "sentence")
+        return self._many([(surah, verse, sentence)], ":snt")[0]
+
+    def verse_ids(self, refs: Iterable[Tuple[int, int]]) -> List[UUIDValue]:
+        """Generate verse UUIDs for (surah, verse) refs (see verse_ids())."""
+        return self._many(_validate_batch(refs, ("surah", "verse")), ":v")
+
+    def word_ids(self, refs: Iterable[Tuple[int, int, int]]) -> List[UUIDValue]:
+        """Generate word UUIDs for (surah, verse, word) refs (see word_ids())."""
+        return self._many(_validate_batch(refs, ("surah", "verse", "word")), ":w")
+
+    def char_ids(self, refs: Iterable[Tuple[int, int, int, int]]) -> List[UUIDValue]:
+        """Generate character UUIDs for (surah, verse, word, char) refs (see char_ids())."""
+        return self._many(_validate_batch(refs, ("surah", "verse", "word", "char")), ":c")
+
+    def symbol_ids(self, refs: Iterable[Tuple[int, int, int, int, int]]) -> List[UUIDValue]:
+        """Generate symbol UUIDs for (surah, verse, word, char, symbol) refs (see symbol_ids())."""
+        fields = ("surah", "verse", "word", "char", "symbol")
+        return self._many(_validate_batch(refs, fields), ":sym")
+
+    def sentence_ids(self, refs: Iterable[Tuple[int, int, int]]) -> List[UUIDValue]:
+        """Generate sentence UUIDs for (surah, verse, sentence) refs."""
+        return self._many(_validate_batch(refs, ("surah", "verse", "sentence")), ":snt")
+
+    def _prefix(self, key: Tuple[int, ...]) -> Any:
+        """Get the SHA-1 context fed with the name prefix for key, reusing the path."""
+        depth = len(key)
+        path = self._path
+        if len(path) >= depth and path[depth - 1][0] == key:
+            return path[depth - 1][1]
+
+        parent = self._prefix(key[:-1]) if depth > 1 else self._root
+        context = parent.copy()
+        context.update(f"{_LEVEL_TAGS[depth - 1]}{key[-1]}".encode("ascii"))
+        del path[depth - 1:]
+        path.append((key, context))
+        return context
+
+    def _many(self, rows: List[Tuple[int, ...]], leaf_tag: str) -> List[UUIDValue]:
+        """Generate IDs for validated rows: row[:-1] is the prefix, row[-1] the leaf."""
+        if _mint_hooks:  # Hooks receive names, so build them
+            root = f"{self.narration}:s"
+            names = (
+                root + "".join(f"{tag}{n}" for tag, n in zip(_LEVEL_TAGS, row[:-1]))
+                + f"{leaf_tag}{row[-1]}"
+                for row in rows
+            )
+            return _generate_many(names, self.binary)
+
+        tag = leaf_tag.encode("ascii")
+        leaves: Dict[int, bytes] = {}
+        digests = []
+        append = digests.append
+        last_key = None
+        copy = None
+
+        for row in rows:
+            key = row[:-1]
+            if key != last_key:
+                context = self._prefix(key).copy()
+                context.update(tag)
+                copy = context.copy
+                last_key = key
+            leaf = leaves.get(row[-1])
+            if leaf is None:
+                leaf = leaves[row[-1]] = str(row[-1]).encode("ascii")
+            h = copy()
+            h.update(leaf)
+            append(h.digest())
+
+        return _format_digests(digests, self.binary)
+
+
+# =============================================================================
+# BULK GENERATION (structural hierarchy)
+# =============================================================================
+
+def verse_ids(
+    narration: str, refs: Iterable[Tuple[int, int]], binary: bool = False
+) -> List[UUIDValue]:
+    """
+    Generate verse UUIDs for many (surah, verse) refs in one pass.
+
+    Args:
+        narration: Qiraah narration ("hafs", "warsh", etc.)
+        refs: Iterable of (surah, verse) tuples, or an (n, 2) int array
+        binary: Return 16-byte values instead of strings
+
+    Returns:
+        UUIDs in ref order, identical to verse_id() per ref
+
+    Raises:
+        ValueError: If any ref is invalid (the whole batch is rejected)
+    """
+    return HierarchicalIDBuilder(narration, binary).verse_ids(refs)
+
+
+def word_ids(
+    narration: str, refs: Iterable[Tuple[int, int, int]], binary: bool = False
+) -> List[UUIDValue]:
+    """
+    Generate word UUIDs for many (surah, verse, word) refs in one pass.
+
+    Args:
+        narration: Qiraah narration ("hafs", "warsh", etc.)
+        refs: Iterable of (surah, verse, word) tuples, or an (n, 3) int array
+        binary: Return 16-byte values instead of strings
+
+    Returns:
+        UUIDs in ref order, identical to word_id() per ref
+
+    Raises:
+        ValueError: If any ref is invalid (the whole batch is rejected)
+    """
+    return HierarchicalIDBuilder(narration, binary).word_ids(refs)
+
+
+def char_ids(
+    narration: str, refs: Iterable[Tuple[int, int, int, int]], binary: bool = False
+) -> List[UUIDValue]:
+    """
+    Generate character UUIDs for many (surah, verse, word, char) refs in one pass.
+
+    Args:
+        narration: Qiraah narration ("hafs", "warsh", etc.)
+        refs: Iterable of (surah, verse, word, char) tuples, or an (n, 4) int array
+        binary: Return 16-byte values instead of strings
+
+    Returns:
+        UUIDs in ref order, identical to char_id() per ref
+
+    Raises:
+        ValueError: If any ref is invalid (the whole batch is rejected)
+
+    Example:
+        >>> char_ids("hafs", [(1, 1, 1, 1), (1, 1, 1, 2)])[0] == char_id("hafs", 1, 1, 1, 1)
+        True
+    """
+    return HierarchicalIDBuilder(narration, binary).char_ids(refs)
+
+
+def symbol_ids(
+    narration: str, refs: Iterable[Tuple[int, int, int, int, int]], binary: bool = False
+) -> List[UUIDValue]:
+    """
+    Generate symbol UUIDs for many (surah, verse, word, char, symbol) refs in one pass.
+
+    Args:
+        narration: Qiraah narration ("hafs", "warsh", etc.)
+        refs: Iterable of (surah, verse, word, char, symbol) tuples, or an
+              (n, 5) int array
+        binary: Return 16-byte values instead of strings
+
+    Returns:
+        UUIDs in ref order, identical to symbol_id() per ref
+
+    Raises:
+        ValueError: If any ref is invalid (the whole batch is rejected)
+    """
+    return HierarchicalIDBuilder(narration, binary).symbol_ids(refs)
+
+
+# =============================================================================
+# BINARY REPRESENTATION
+# =============================================================================
+
+def uuid_to_bytes(value: Union[str, bytes, uuid.UUID]) -> bytes:
+    """
+    Normalize a UUID string, 16-byte value or uuid.UUID to 16 bytes.
+
+    Raises:
+        ValueError: If value is not a valid UUID
+    """
+    if isinstance(value, uuid.UUID):
+        return value.bytes
+    if isinstance(value, (bytes, bytearray)):
+        if len(value) != 16:
+            raise ValueError(f"UUID bytes must be 16 long, got {len(value)}")
+        return bytes(value)
+    raw = _canonical_bytes(value)
+    if raw is not None:
+        return raw
+    return uuid.UUID(value).bytes
+
+
+def uuid_to_str(value: Union[str, bytes, uuid.UUID]) -> str:
+    """
+    Format a UUID string, 16-byte value or uuid.UUID as the canonical string.
+
+    Raises:
+        ValueError: If value is not a valid UUID
+    """
+    if isinstance(value, str) and _canonical_bytes(value) is not None:
+        return value.lower()
+    h = uuid_to_bytes(value).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _canonical_bytes(value: str) -> Optional[bytes]:
+    """16 bytes of a canonical 8-4-4-4-12 UUID string, or None for any other form."""
+    if len(value) != 36 or value[8:24:5] != "----":  # Dashes at 8, 13, 18, 23
+        return None
+    try:
+        raw = bytes.fromhex(value.replace("-", ""))
+    except ValueError:
+        return None
+    # fromhex skips whitespace, so a string with spaces can decode short
+    return raw if len(raw) == 16 else None
+
+
+def pack_ids(ids: Iterable[Union[str, bytes, uuid.UUID]]) -> bytes:
+    """
+    Pack IDs into one contiguous array of 16-byte values.
+
+    The result can be viewed without copying as a NumPy "S16" array or
+    sliced per ID with packed[16 * i:16 * (i + 1)].
+    """
+    return b"".join(
+        value if type(value) is bytes and len(value) == 16 else uuid_to_bytes(value)
+        for value in ids
+    )
+
+
+def unpack_ids(packed: bytes, binary: bool = False) -> List[UUIDValue]:
+    """
+    Split a packed ID array back into individual IDs.
+
+    Args:
+        packed: Output of pack_ids (length a multiple of 16)
+        binary: Return 16-byte values instead of strings
+
+    Raises:
+        ValueError: If the length is not a multiple of 16
+    """
+    if len(packed) % 16:
+        raise ValueError(f"Packed IDs length must be a multiple of 16, got {len(packed)}")
+    packed = bytes(packed)
+    if binary:
+        return [packed[i:i + 16] for i in range(0, len(packed), 16)]
+    h = packed.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, len(h), 32)
+    ]
+
+
+def json_default(value: Any) -> Any:
+    """
+    json.dump(default=...) hook that writes binary IDs as UUID strings.
+
+    Handles 16-byte values, uuid.UUID and NumPy "S16" arrays, so layer data
+    can carry binary IDs in memory and stay string-typed on disk.
+
+    Raises:
+        TypeError: For any other non-JSON type (as json.dump would)
+    """
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (bytes, bytearray)) and len(value) == 16:
+        return uuid_to_str(value)
+    dtype = getattr(value, "dtype", None)
+    if dtype is not None and dtype.kind == "S" and dtype.itemsize == 16:
+        return unpack_ids(value.tobytes())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 # =============================================================================
 # NAME INSPECTION (for debugging/logging)
 # =============================================================================
@@ -0,0 +1,269 @@
+"""
+UUID Resolver
+
+Tier 2 (Reusable Research Tool)
+
+Reverse index from generated UUIDs to the entity they identify. The
+resolver records every (UUID, name) pair minted by uuid_generator while it
+is attached, persists them in a compact append-only log, and answers
+"what is this UUID?" with an O(1) dict lookup. Names are parsed back into
+entity type and coordinates using uuid_generator.VALID_PATTERNS.
+
+Log format (little-endian):
+    header  b"QUDUUIDR" + format version (1 byte)
+    record  16-byte UUID, name length (uint16), UTF-8 name
+
+Example:
+    >>> with UUIDResolver(".cache/uuid-resolver.log") as resolver:
+    ...     ids = uuid_generator.char_ids("hafs", refs)
+    >>> resolver.resolve(ids[0])
+    ResolvedID(entity='char', fields={'narration': 'hafs', 'surah': 1, ...})
+"""
+
+import re
+import struct
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Pattern, Sequence, Tuple, Union
+
+from . import uuid_generator
+from .uuid_generator import uuid_to_bytes, uuid_to_str
+
+
+LOG_MAGIC = b"QUDUUIDR"
+LOG_FORMAT_VERSION = 1
+_HEADER = LOG_MAGIC + bytes([LOG_FORMAT_VERSION])
+_NAME_LENGTH = struct.Struct("<H")
+
+# Pattern fields holding integers (all others are free-form names)
+INT_FIELDS = {
+    "surah", "verse", "word", "char", "symbol", "sentence",
+    "page", "line", "juz", "hizb", "rub",
+}
+
+# Match order: fixed metadata prefixes first, so e.g. "msh:hafs" is never
+# read as a narration-scoped name
+_MATCH_ORDER = (
+    "narration", "edition", "reader", "mushaf", "mushaf_simple",
+    "symbol", "char", "word", "sentence", "verse",
+    "line", "page", "juz", "hizb", "rub", "surah",
+)
+
+
+def _compile_pattern(pattern: str) -> Pattern:
+    """Turn a VALID_PATTERNS format string into a regex with named groups."""
+    parts = re.split(r"\{(\w+)\}", pattern)
+    regex = []
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            regex.append(re.escape(part))
+        elif part in INT_FIELDS:
+            regex.append(rf"(?P<{part}>[1-9][0-9]*)")
+        else:
+            regex.append(rf"(?P<{part}>[^:]+)")
+    return re.compile("".join(regex))
+
+
+_PATTERNS: List[Tuple[str, Pattern]] = [
+    (entity, _compile_pattern(uuid_generator.VALID_PATTERNS[entity]))
+    for entity in _MATCH_ORDER
+]
+
+
+@dataclass(frozen=True)
+class ResolvedID:
+    """Entity identified by a UUID."""
+
+    uuid: str
+    name: str
+    entity: Optional[str]  # None if the name matches no known pattern
+    fields: Dict[str, Union[int, str]]
+
+    @property
+    def coordinates(self) -> Tuple[int, ...]:
+        """Integer fields in name order (e.g. (surah, verse, word, char))."""
+        return tuple(v for v in self.fields.values() if isinstance(v, int))
+
+
+def parse_name(name: str) -> Tuple[Optional[str], Dict[str, Union[int, str]]]:
+    """
+    Parse a uuid_generator name string into entity type and fields.
+
+    Args:
+        name: Name string (e.g. "hafs:s2:v255:w4")
+
+    Returns:
+        (entity, fields); (None, {}) if no pattern matches
+    """
+    for entity, pattern in _PATTERNS:
+        match = pattern.fullmatch(name)
+        if match:
+            fields = {
+                key: int(value) if key in INT_FIELDS else value
+                for key, value in match.groupdict().items()
+            }
+            return (entity, fields)
+    return (None, {})
+
+
+class UUIDResolver:
+    """
+    Persistent reverse index of minted UUIDs.
+
+    While attached (attach() or a with-block), every ID generated through
+    uuid_generator is recorded. IDs minted earlier can be added with
+    register().
+    """
+
+    def __init__(self, log_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize resolver, loading an existing log if present.
+
+        Args:
+            log_path: Append-only log file. If None, the index is in-memory only.
+        """
+        self.log_path = Path(log_path) if log_path else None
+        self._names: Dict[bytes, str] = {}
+        self._log: Optional[BinaryIO] = None
+        self._valid_size = 0  # Bytes of complete records in the log
+
+        if self.log_path and self.log_path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, uuid_value: Union[str, bytes, uuid.UUID]) -> bool:
+        return uuid_to_bytes(uuid_value) in self._names
+
+    def __enter__(self) -> "UUIDResolver":
+        self.attach()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.detach()
+        self.close()
+
+    def attach(self):
+        """Start recording IDs minted by uuid_generator."""
+        uuid_generator.add_mint_hook(self.record)
+
+    def detach(self):
+        """Stop recording minted IDs."""
+        uuid_generator.remove_mint_hook(self.record)
+
+    def record(self, names: Sequence[str], ids: Sequence[uuid_generator.UUIDValue]):
+        """
+        Add minted (name, UUID) pairs; already known UUIDs are skipped.
+
+        Args:
+            names: Name strings
+            ids: UUIDs (strings or 16-byte values) generated from the names
+        """
+        new = []
+        known = self._names
+        for name, value in zip(names, ids):
+            key = uuid_to_bytes(value)
+            if key not in known:
+                known[key] = name
+                new.append((key, name))
+
+        if new and self.log_path:
+            self._append(new)
+
+    def register(self, names: Iterable[str]):
+        """
+        Add names whose IDs were minted before the resolver was attached.
+
+        Args:
+            names: uuid_generator name strings (e.g. from get_verse_name)
+        """
+        names = list(names)
+        hooks_attached = self.record in uuid_generator._mint_hooks
+        ids = uuid_generator._generate_many(names)
+        if not hooks_attached:
+            self.record(names, ids)
+
+    def name(self, uuid_value: Union[str, bytes, uuid.UUID]) -> Optional[str]:
+        """
+        Get the name string a UUID was generated from.
+
+        Args:
+            uuid_value: UUID string, 16 bytes or uuid.UUID
+
+        Returns:
+            Name string, or None if the UUID is unknown
+        """
+        return self._names.get(uuid_to_bytes(uuid_value))
+
+    def resolve(self, uuid_value: Union[str, bytes, uuid.UUID]) -> Optional[ResolvedID]:
+        """
+        Identify the entity behind a UUID.
+
+        Args:
+            uuid_value: UUID string, 16 bytes or uuid.UUID
+
+        Returns:
+            ResolvedID, or None if the UUID is unknown
+        """
+        key = uuid_to_bytes(uuid_value)
+        name = self._names.get(key)
+        if name is None:
+            return None
+        entity, fields = parse_name(name)
+        return ResolvedID(uuid_to_str(key), name, entity, fields)
+
+    def flush(self):
+        """Flush buffered log records to disk."""
+        if self._log:
+            self._log.flush()
+
+    def close(self):
+        """Flush and close the log file (it is reopened on the next record)."""
+        if self._log:
+            self._log.close()
+            self._log = None
+
+    def _load(self):
+        """Read all complete records from the log."""
+        data = self.log_path.read_bytes()
+        if not data:
+            return
+        if not data.startswith(_HEADER):
+            raise ValueError(f"Not a UUID resolver log (or unsupported version): {self.log_path}")
+
+        view = memoryview(data)
+        pos = len(_HEADER)
+        names = self._names
+        while pos + 18 <= len(data):
+            (length,) = _NAME_LENGTH.unpack_from(view, pos + 16)
+            end = pos + 18 + length
+            if end > len(data):
+                break  # Partial record from an interrupted write
+            names.setdefault(bytes(view[pos:pos + 16]), str(view[pos + 18:end], "utf-8"))
+            pos = end
+
+        self._valid_size = pos
+
+    def _append(self, records: List[Tuple[bytes, str]]):
+        """Append records to the log, creating it with a header if needed."""
+        if self._log is None:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(self.log_path, "r+b" if self.log_path.exists() else "w+b")
+            # Drop any partial trailing record before appending
+            self._log.truncate(self._valid_size)
+            self._log.seek(self._valid_size)
+            if self._valid_size == 0:
+                self._log.write(_HEADER)
+                self._valid_size = len(_HEADER)
+
+        chunk = bytearray()
+        for key, name in records:
+            encoded = name.encode("utf-8")
+            chunk += key
+            chunk += _NAME_LENGTH.pack(len(encoded))
+            chunk += encoded
+        self._log.write(chunk)
+        self._valid_size += len(chunk)
+
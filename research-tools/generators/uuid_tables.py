@@ -0,0 +1,479 @@
+"""
+UUID Lookup Tables
+
+Tier 2 (Reusable Research Tool)
+
+Precomputed, memory-mapped UUID tables for structural entities. For each
+narration, a build step enumerates every valid coordinate of the verse,
+word, juz, hizb, rub, page and line entities, generates its UUID once, and
+stores the 16-byte UUIDs in dense coordinate order. Resolving an ID then
+becomes an array index, and a sorted copy of each table supports the
+reverse lookup (UUID -> coordinate) by binary search.
+
+Coordinates are mapped to dense indexes through per-level offset arrays:
+level i holds, for every entity of level i-1, the start of its children.
+For verses, level 0 is the 114 surahs and level 1 the verse offsets per
+surah; words add a third level of word offsets per verse. Lines likewise
+use per-page offsets, since pages of an edition hold different numbers of
+lines (the opening pages of a mushaf are shorter).
+
+Layout on disk (one directory per narration):
+    manifest.json           Entities, counts, edition, format version, data_dir
+    data-{token}/           Table files of one build:
+        {entity}.uuid           n x 16 raw UUID bytes in coordinate order
+        {entity}.levels.npz     Offset arrays, one per coordinate level
+        {entity}.sorted.uuid    The same UUIDs sorted (reverse lookup)
+        {entity}.order.npy      Table index of each sorted UUID
+
+A rebuild writes a new data directory and then atomically replaces the
+manifest, so tables already opened (memory-mapped) keep reading unchanged
+files; older data directories are removed afterwards.
+
+IDs are identical to those of uuid_generator (names from VALID_PATTERNS).
+"""
+
+import json
+import os
+import shutil
+import uuid
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .uuid_generator import (
+    KNOWN_NARRATIONS, VALID_PATTERNS, _generate_many, pack_ids, unpack_ids, uuid_to_bytes,
+    uuid_to_str,
+)
+
+
+UUID_TABLE_FORMAT_VERSION = 3
+MANIFEST_NAME = "manifest.json"
+
+UUID_DTYPE = np.dtype("S16")
+OFFSET_DTYPE = np.int64
+
+# Entity -> coordinate level names (outermost first)
+ENTITY_LEVELS: Dict[str, Tuple[str, ...]] = {
+    "verse": ("surah", "verse"),
+    "word": ("surah", "verse", "word"),
+    "juz": ("juz",),
+    "hizb": ("hizb",),
+    "rub": ("rub",),
+    "page": ("page",),
+    "line": ("page", "line"),
+}
+
+# Fixed division counts (global numbering within a narration)
+JUZ_COUNT = 30
+HIZB_COUNT = 60
+RUB_COUNT = 240
+SURAH_COUNT = 114
+
+
+def uniform_offsets(parents: int, children: int) -> np.ndarray:
+    """
+    Offsets for a level where every parent has the same number of children.
+
+    Args:
+        parents: Number of parent entities
+        children: Children per parent
+
+    Returns:
+        Offset array of length parents + 1
+    """
+    return np.arange(parents + 1, dtype=OFFSET_DTYPE) * children
+
+
+def counts_to_offsets(counts: Sequence[int]) -> np.ndarray:
+    """
+    Offsets for a level from per-parent child counts.
+
+    Args:
+        counts: Children per parent, in parent order
+
+    Returns:
+        Offset array of length len(counts) + 1
+    """
+    offsets = np.zeros(len(counts) + 1, dtype=OFFSET_DTYPE)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def expand_coordinates(levels: Sequence[np.ndarray]) -> List[np.ndarray]:
+    """
+    Enumerate every coordinate of a table in dense index order.
+
+    Args:
+        levels: Offset arrays, outermost first (level 0 has length 2)
+
+    Returns:
+        One 1-based coordinate column per level, each of the table length
+    """
+    columns: List[np.ndarray] = []
+
+    for offsets in levels:
+        sizes = np.diff(offsets)
+        parent_of = np.repeat(np.arange(len(sizes), dtype=OFFSET_DTYPE), sizes)
+        position = np.arange(offsets[-1], dtype=OFFSET_DTYPE) - offsets[parent_of] + 1
+
+        columns = [column[parent_of] for column in columns] + [position]
+
+    return columns
+
+
+class UUIDTable:
+    """
+    Memory-mapped UUID table for one entity type of one narration.
+
+    Example:
+        >>> verses = UUIDTables.open(".cache/uuid-tables", "hafs")["verse"]
+        >>> verses.id(2, 255) == verse_id("hafs", 2, 255)
+        True
+        >>> verses.coordinate(verses.id(2, 255))
+        (2, 255)
+    """
+
+    def __init__(
+        self,
+        entity: str,
+        uuids: np.ndarray,
+        levels: List[np.ndarray],
+        sorted_uuids: np.ndarray,
+        order: np.ndarray
+    ):
+        """
+        Initialize table.
+
+        Args:
+            entity: Entity type (key of ENTITY_LEVELS)
+            uuids: S16 array of UUID bytes in coordinate order
+            levels: Offset arrays, outermost first
+            sorted_uuids: uuids in sorted order
+            order: Table index of each sorted UUID
+        """
+        self.entity = entity
+        self.level_names = ENTITY_LEVELS[entity]
+        self.uuids = uuids
+        self.levels = levels
+        self.sorted_uuids = sorted_uuids
+        self.order = order
+        # Python-int copies for scalar lookups (NumPy scalar access is slower)
+        self._offsets = [offsets.tolist() for offsets in levels]
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def index(self, *coordinate: int) -> int:
+        """
+        Map a 1-based coordinate to its dense table index.
+
+        Args:
+            *coordinate: One value per level (e.g. surah, verse)
+
+        Returns:
+            Table index
+
+        Raises:
+            ValueError: If the coordinate is out of range
+        """
+        if len(coordinate) != len(self.levels):
+            raise ValueError(
+                f"{self.entity} coordinate needs {len(self.levels)} values "
+                f"({', '.join(self.level_names)}), got {len(coordinate)}"
+            )
+
+        parent = 0
+        for name, offsets, value in zip(self.level_names, self._offsets, coordinate):
+            start, end = offsets[parent], offsets[parent + 1]
+            if not 1 <= value <= end - start:
+                raise ValueError(f"{name} must be 1-{end - start}, got {value}")
+            parent = start + value - 1
+        return parent
+
+    def id_bytes(self, *coordinate: int) -> bytes:
+        """Get the 16-byte UUID of a coordinate."""
+        return self._row(self.index(*coordinate))
+
+    def id(self, *coordinate: int) -> str:
+        """Get the UUID string of a coordinate."""
+        return uuid_to_str(self.id_bytes(*coordinate))
+
+    def ids(self, indices: Union[Sequence[int], np.ndarray]) -> List[str]:
+        """
+        Get UUID strings for many table indexes.
+
+        Args:
+            indices: Table indexes (e.g. from index())
+
+        Returns:
+            UUID strings in input order
+        """
+        rows = self.uuids[np.asarray(indices, dtype=OFFSET_DTYPE)]
+        return unpack_ids(rows.tobytes())
+
+    def lookup(self, uuid_value: Union[str, bytes, uuid.UUID]) -> Optional[int]:
+        """
+        Find the table index of a UUID.
+
+        Args:
+            uuid_value: UUID string, 16 bytes or uuid.UUID
+
+        Returns:
+            Table index, or None if the UUID is not in this table
+        """
+        key = np.array(uuid_to_bytes(uuid_value), dtype=UUID_DTYPE)
+        pos = int(np.searchsorted(self.sorted_uuids, key))
+        if pos < len(self.sorted_uuids) and self.sorted_uuids[pos] == key:
+            return int(self.order[pos])
+        return None
+
+    def coordinate_of(self, index: int) -> Tuple[int, ...]:
+        """
+        Map a dense table index back to its 1-based coordinate.
+
+        Args:
+            index: Table index
+
+        Returns:
+            Coordinate tuple, outermost level first
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"{self.entity} index {index} out of range")
+
+        coordinate = []
+        for offsets in reversed(self._offsets):
+            parent = bisect_right(offsets, index) - 1
+            coordinate.append(index - offsets[parent] + 1)
+            index = parent
+        return tuple(reversed(coordinate))
+
+    def coordinate(self, uuid_value: Union[str, bytes, uuid.UUID]) -> Optional[Tuple[int, ...]]:
+        """
+        Reverse lookup: UUID to coordinate.
+
+        Args:
+            uuid_value: UUID string, 16 bytes or uuid.UUID
+
+        Returns:
+            Coordinate tuple, or None if the UUID is not in this table
+        """
+        index = self.lookup(uuid_value)
+        return None if index is None else self.coordinate_of(index)
+
+    def iter_coordinates(self) -> Iterator[Tuple[int, ...]]:
+        """Iterate all coordinates in table order."""
+        return zip(*(column.tolist() for column in expand_coordinates(self.levels)))
+
+    def _row(self, index: int) -> bytes:
+        """UUID bytes at an index (S16 items drop trailing NUL bytes)."""
+        return self.uuids[index].ljust(16, b"\0")
+
+
+class UUIDTables:
+    """
+    Set of UUID tables for one narration.
+
+    Example:
+        >>> UUIDTables.build(".cache/uuid-tables", "hafs", verse_counts,
+        ...                  word_counts, line_counts, edition="kfgqpc_v2")
+        >>> tables = UUIDTables.open(".cache/uuid-tables", "hafs")
+        >>> tables["word"].id(1, 1, 1)
+    """
+
+    def __init__(self, narration: str, tables: Dict[str, UUIDTable], manifest: Dict):
+        """
+        Initialize table set.
+
+        Args:
+            narration: Narration the tables belong to
+            tables: Entity -> UUIDTable
+            manifest: Build manifest
+        """
+        self.narration = narration
+        self.tables = tables
+        self.manifest = manifest
+
+    def __getitem__(self, entity: str) -> UUIDTable:
+        return self.tables[entity]
+
+    def __contains__(self, entity: str) -> bool:
+        return entity in self.tables
+
+    @property
+    def edition(self) -> Optional[str]:
+        """Edition used for page and line IDs."""
+        return self.manifest.get("edition")
+
+    def resolve(self, uuid_value: Union[str, bytes, uuid.UUID]) -> Optional[Tuple[str, Tuple]]:
+        """
+        Find which entity a UUID belongs to and its coordinate.
+
+        Args:
+            uuid_value: UUID string, 16 bytes or uuid.UUID
+
+        Returns:
+            (entity, coordinate), or None if not in any table
+        """
+        for entity, table in self.tables.items():
+            coordinate = table.coordinate(uuid_value)
+            if coordinate is not None:
+                return (entity, coordinate)
+        return None
+
+    @classmethod
+    def build(
+        cls,
+        output_dir: Union[str, Path],
+        narration: str,
+        verse_counts: Sequence[int],
+        word_counts: Sequence[int],
+        line_counts: Sequence[int],
+        edition: str
+    ) -> Path:
+        """
+        Generate and write all tables for a narration.
+
+        Args:
+            output_dir: Root directory (tables go to output_dir/narration)
+            narration: Narration name used in UUID names, from
+                       KNOWN_NARRATIONS (e.g. "hafs", "qalun")
+            verse_counts: Verses per surah, surahs 1-114 in order
+            word_counts: Words per verse, verses in (surah, verse) order
+            line_counts: Lines per page, pages 1-n of the edition in order
+            edition: Edition name used in page and line UUID names
+
+        Returns:
+            Narration table directory
+
+        Raises:
+            ValueError: If the narration is unknown or the counts are inconsistent
+        """
+        if narration not in KNOWN_NARRATIONS:
+            raise ValueError(f"Unknown narration {narration!r}")
+        if len(verse_counts) != SURAH_COUNT:
+            raise ValueError(f"verse_counts must have {SURAH_COUNT} entries")
+        if len(word_counts) != sum(verse_counts):
+            raise ValueError(
+                f"word_counts has {len(word_counts)} entries, expected {sum(verse_counts)}"
+            )
+
+        surahs = uniform_offsets(1, SURAH_COUNT)
+        verses = counts_to_offsets(verse_counts)
+        if min(line_counts, default=0) < 1:
+            raise ValueError("line_counts must list at least one line for every page")
+
+        pages = uniform_offsets(1, len(line_counts))
+        levels = {
+            "verse": [surahs, verses],
+            "word": [surahs, verses, counts_to_offsets(word_counts)],
+            "juz": [uniform_offsets(1, JUZ_COUNT)],
+            "hizb": [uniform_offsets(1, HIZB_COUNT)],
+            "rub": [uniform_offsets(1, RUB_COUNT)],
+            "page": [pages],
+            "line": [pages, counts_to_offsets(line_counts)],
+        }
+
+        directory = Path(output_dir) / narration
+        # Fresh files only: open tables may still map the previous build's files
+        data_name = f"data-{uuid.uuid4().hex[:16]}"
+        data = directory / data_name
+        data.mkdir(parents=True)
+
+        counts = {}
+        for entity, entity_levels in levels.items():
+            columns = expand_coordinates(entity_levels)
+            names = _entity_names(entity, narration, edition, columns)
+            uuids = np.frombuffer(pack_ids(_generate_many(names, binary=True)), UUID_DTYPE)
+            order = np.argsort(uuids, kind="stable")
+
+            uuids.tofile(data / f"{entity}.uuid")
+            uuids[order].tofile(data / f"{entity}.sorted.uuid")
+            np.save(data / f"{entity}.order.npy", order.astype(OFFSET_DTYPE))
+            np.savez(
+                data / f"{entity}.levels.npz",
+                **{f"level{i}": offsets for i, offsets in enumerate(entity_levels)}
+            )
+            counts[entity] = len(uuids)
+
+        manifest = {
+            "format_version": UUID_TABLE_FORMAT_VERSION,
+            "narration": narration,
+            "edition": edition,
+            "counts": counts,
+            "data_dir": data_name,
+        }
+        tmp_path = directory / f"{MANIFEST_NAME}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, directory / MANIFEST_NAME)
+
+        for path in directory.glob("data-*"):
+            if path.name != data_name:
+                shutil.rmtree(path, ignore_errors=True)
+
+        return directory
+
+    @classmethod
+    def open(cls, output_dir: Union[str, Path], narration: str) -> "UUIDTables":
+        """
+        Memory-map the tables of a narration.
+
+        Args:
+            output_dir: Root directory passed to build()
+            narration: Narration name
+
+        Returns:
+            UUIDTables
+
+        Raises:
+            FileNotFoundError: If the tables have not been built
+            ValueError: If the tables use another format version
+        """
+        directory = Path(output_dir) / narration
+        manifest_path = directory / MANIFEST_NAME
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"UUID tables not built: {directory}")
+
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format_version") != UUID_TABLE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported UUID table format in {directory}")
+
+        data = directory / manifest["data_dir"]
+        tables = {}
+        for entity in manifest["counts"]:
+            with np.load(data / f"{entity}.levels.npz") as npz:
+                levels = [npz[f"level{i}"] for i in range(len(npz.files))]
+            tables[entity] = UUIDTable(
+                entity,
+                _map_uuids(data / f"{entity}.uuid"),
+                levels,
+                _map_uuids(data / f"{entity}.sorted.uuid"),
+                np.load(data / f"{entity}.order.npy", mmap_mode="r"),
+            )
+
+        return cls(narration, tables, manifest)
+
+
+def _entity_names(
+    entity: str,
+    narration: str,
+    edition: str,
+    columns: List[np.ndarray]
+) -> List[str]:
+    """Build uuid_generator name strings for every coordinate of an entity."""
+    pattern = VALID_PATTERNS[entity]
+    level_names = ENTITY_LEVELS[entity]
+    return [
+        pattern.format(narration=narration, edition=edition, **dict(zip(level_names, values)))
+        for values in zip(*(column.tolist() for column in columns))
+    ]
+
+
+def _map_uuids(path: Path) -> np.ndarray:
+    """Memory-map a UUID file (np.memmap rejects empty files)."""
+    if path.stat().st_size == 0:
+        return np.zeros(0, dtype=UUID_DTYPE)
+    return np.memmap(path, dtype=UUID_DTYPE, mode="r")
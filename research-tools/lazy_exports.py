@@ -0,0 +1,61 @@
+"""
+Lazy Exports
+
+Tier 2 (Reusable Research Tool)
+
+Module-level __getattr__ and __dir__ for subpackages that export names
+from their submodules without importing them. A subpackage lists each
+public name with its defining submodule; the submodule is imported on the
+first access to one of its names, so importing the subpackage stays cheap.
+
+Type checkers cannot see names resolved by __getattr__, so each
+subpackage also imports its exports under "if TYPE_CHECKING:", using the
+TYPE_CHECKING defined here. It is False at runtime and, like
+typing.TYPE_CHECKING, treated as true by type checkers (they match the
+name); importing it from typing instead would make every subpackage
+import pay for typing.
+
+Example (in a subpackage __init__.py):
+    >>> from lazy_exports import TYPE_CHECKING, attach
+    >>> _LAZY_ATTRS = {"DataComparator": "data_comparator"}
+    >>> __getattr__, __dir__, __all__ = attach(__name__, _LAZY_ATTRS)
+    >>> if TYPE_CHECKING:
+    ...     from .data_comparator import DataComparator
+"""
+
+import importlib
+import sys
+
+# typing is not imported at runtime: this module is imported by every
+# subpackage __init__.py, whose import must stay cheap
+TYPE_CHECKING = False
+
+
+def attach(package: str, lazy_attrs: dict[str, str]) -> tuple:
+    """
+    Build the lazy attribute hooks of a package.
+
+    Args:
+        package: Package name (__name__ of its __init__.py)
+        lazy_attrs: Public name -> defining submodule. A name equal to its
+                    submodule exports the submodule itself.
+
+    Returns:
+        (__getattr__, __dir__, __all__) for the package namespace
+    """
+    __all__ = sorted(lazy_attrs)
+
+    def __getattr__(name: str):
+        module_name = lazy_attrs.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        module = importlib.import_module(f".{module_name}", package)
+        value = module if name == module_name else getattr(module, name)
+        setattr(sys.modules[package], name, value)  # Cache so __getattr__ runs once per name
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(__all__))
+
+    return __getattr__, __dir__, __all__
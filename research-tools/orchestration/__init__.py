@@ -3,3 +3,23 @@ Orchestration
 
 Workflow orchestration for multi-layer data generation.
 """
+
+from lazy_exports import TYPE_CHECKING, attach
+
+# Public name -> defining submodule; imported on first attribute access
+_LAZY_ATTRS = {
+    "ContextResolver": "context_resolver",
+    "LayerRun": "layer_scheduler",
+    "LayerScheduler": "layer_scheduler",
+    "ResolvedContext": "context_resolver",
+    "QueryRouter": "query_router",
+    "VersionSelector": "version_selector",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from .context_resolver import ContextResolver, ResolvedContext
+    from .layer_scheduler import LayerRun, LayerScheduler
+    from .query_router import QueryRouter
+    from .version_selector import VersionSelector
@@ -0,0 +1,307 @@
+"""
+Layer Scheduler
+
+Tier 2 (Reusable Research Tool)
+
+Builds registered LayerGenerators in dependency order. Layers form a DAG
+through get_dependencies(); the scheduler orders it topologically and runs
+every layer whose dependencies are done concurrently in a process pool,
+across all requested jobs (e.g. one job per riwaya). Upstream outputs are
+handed to dependents in memory via generate_with_dependencies(). With a
+generators.build_cache.BuildCache, only partitions whose inputs changed
+are regenerated.
+
+Example:
+    >>> scheduler = LayerScheduler(max_workers=8)
+    >>> scheduler.register_all([CharacterLayer(), SymbolLayer(), WordLayer()])
+    >>> results = scheduler.run({
+    ...     key: (key, {"qiraat": q, "narration": key, "edition": None})
+    ...     for key, q in riwayat.items()
+    ... })
+    >>> results["hafs"]["word-structure"]
+"""
+
+import os
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait,
+)
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:  # Only the interfaces are used
+    from generators.build_cache import BuildCache
+    from generators.layer_generator import LayerGenerator
+
+
+EXECUTORS = ("process", "thread", "serial")
+
+
+@dataclass
+class LayerRun:
+    """Timing of one layer build within a job."""
+
+    job: str
+    layer_name: str
+    started: float  # Seconds since the run started (wall clock)
+    duration_seconds: float
+    rebuilt: int = 1  # Partitions generated (all of them without a cache)
+    reused: int = 0  # Partitions loaded from the build cache
+
+
+class LayerScheduler:
+    """
+    Dependency-aware parallel builder for LayerGenerators.
+
+    Generators are registered by layer_name; get_dependencies() must return
+    layer names of other registered generators. Generators, source data,
+    contexts and layer outputs are pickled to worker processes, so source
+    data should be light (e.g. a riwaya key or file path that generate()
+    loads from). With a build cache, a layer given a key rather than a file
+    path must override partitions() to return the content it loads; run()
+    rejects it otherwise (see BuildCache.check_source).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        executor: str = "process",
+        cache: Optional["BuildCache"] = None
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_workers: Pool size (default: CPU count)
+            executor: "process", "thread", or "serial" (in-process, for debugging)
+            cache: Build cache for incremental rebuilds (default: always regenerate)
+
+        Raises:
+            ValueError: If executor is unknown
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = executor
+        self.cache = cache
+        self.generators: Dict[str, "LayerGenerator"] = {}
+        self.runs: List[LayerRun] = []  # Timings of the last run()
+
+    def register(self, generator: "LayerGenerator"):
+        """
+        Register a layer generator.
+
+        Raises:
+            ValueError: If a generator with the same layer_name is registered
+        """
+        if generator.layer_name in self.generators:
+            raise ValueError(f"Layer already registered: {generator.layer_name}")
+        self.generators[generator.layer_name] = generator
+
+    def register_all(self, generators: Iterable["LayerGenerator"]):
+        """Register several layer generators."""
+        for generator in generators:
+            self.register(generator)
+
+    def dependencies(self) -> Dict[str, List[str]]:
+        """
+        Get the dependency graph.
+
+        Returns:
+            Layer name -> names of layers it depends on
+
+        Raises:
+            ValueError: If a layer depends on an unregistered layer
+        """
+        graph = {}
+        for name, generator in self.generators.items():
+            deps = list(dict.fromkeys(generator.get_dependencies()))
+            missing = [dep for dep in deps if dep not in self.generators]
+            if missing:
+                raise ValueError(f"Layer {name} depends on unregistered layers: {missing}")
+            graph[name] = deps
+        return graph
+
+    def order(self) -> List[str]:
+        """
+        Topologically order registered layers (ties broken by layer_number).
+
+        Returns:
+            Layer names, each after all of its dependencies
+
+        Raises:
+            ValueError: On unregistered dependencies or a dependency cycle
+        """
+        graph = self.dependencies()
+        remaining = {name: len(deps) for name, deps in graph.items()}
+        dependents = _dependents(graph)
+        key = self._sort_key
+
+        ready = sorted((name for name, n in remaining.items() if n == 0), key=key)
+        ordered = []
+        while ready:
+            name = ready.pop(0)
+            ordered.append(name)
+            for child in dependents[name]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+            ready.sort(key=key)
+
+        if len(ordered) != len(graph):
+            cycle = sorted(name for name in graph if name not in ordered)
+            raise ValueError(f"Dependency cycle among layers: {cycle}")
+        return ordered
+
+    def run(
+        self,
+        jobs: Mapping[str, Tuple[Any, Dict[str, str]]],
+        layers: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Build layers for every job, running independent layers concurrently.
+
+        Each layer is generated with generate_with_dependencies() (or
+        incrementally through the build cache) and checked with validate()
+        in the worker. Saving is left to the caller.
+
+        Args:
+            jobs: Job name -> (source_data, context), e.g. one per riwaya
+            layers: Layer names to build, plus their dependencies (default: all)
+
+        Returns:
+            Job name -> layer name -> generated layer data
+
+        Raises:
+            ValueError: On unknown layers, an invalid dependency graph, or
+                        (with a cache) a source the cache key cannot cover
+            RuntimeError: If a layer fails (pending layers are cancelled)
+        """
+        order = self.order()
+        graph = self.dependencies()
+        wanted = self._with_dependencies(layers, graph) if layers is not None else set(order)
+        order = [name for name in order if name in wanted]
+        if self.cache is not None:
+            for name in order:
+                for source_data, _ in jobs.values():
+                    self.cache.check_source(self.generators[name], source_data)
+        dependents = _dependents({name: graph[name] for name in order})
+
+        results: Dict[str, Dict[str, Dict[str, Any]]] = {job: {} for job in jobs}
+        waiting = {(job, name): len(graph[name]) for job in jobs for name in order}
+        self.runs = []
+        start = time.time()
+
+        pool = self._make_pool()
+        running: Dict[Future, Tuple[str, str]] = {}
+
+        def submit(job: str, name: str):
+            source_data, context = jobs[job]
+            upstream = {dep: results[job][dep] for dep in graph[name]}
+            future = pool.submit(
+                _build_layer, self.generators[name], source_data, context, upstream, self.cache
+            )
+            running[future] = (job, name)
+
+        try:
+            # Seed with every layer that has no dependencies, in order
+            for name in order:
+                for job in jobs:
+                    if waiting[(job, name)] == 0:
+                        submit(job, name)
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, name = running.pop(future)
+                    try:
+                        layer_data, started, duration, counts = future.result()
+                    except Exception as e:
+                        raise RuntimeError(f"Layer {name} failed for job {job}: {e}") from e
+
+                    results[job][name] = layer_data
+                    self.runs.append(LayerRun(job, name, started - start, duration, *counts))
+                    for child in dependents[name]:
+                        waiting[(job, child)] -= 1
+                        if waiting[(job, child)] == 0:
+                            submit(job, child)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        # Report layers in dependency order rather than completion order
+        return {job: {name: layers_built[name] for name in order}
+                for job, layers_built in results.items()}
+
+    def run_one(
+        self,
+        source_data: Any,
+        context: Dict[str, str],
+        layers: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Build layers for a single source/context.
+
+        Returns:
+            Layer name -> generated layer data
+        """
+        return self.run({"default": (source_data, context)}, layers)["default"]
+
+    def _sort_key(self, name: str) -> Tuple[int, str]:
+        return (self.generators[name].layer_number, name)
+
+    def _with_dependencies(self, layers: Iterable[str], graph: Dict[str, List[str]]) -> set:
+        """Expand requested layer names with all transitive dependencies."""
+        wanted = set()
+        stack = list(layers)
+        while stack:
+            name = stack.pop()
+            if name not in graph:
+                raise ValueError(f"Unknown layer: {name}")
+            if name not in wanted:
+                wanted.add(name)
+                stack.extend(graph[name])
+        return wanted
+
+    def _make_pool(self) -> Executor:
+        if self.executor == "process":
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        if self.executor == "thread":
+            return ThreadPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=1)
+
+
+def _dependents(graph: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Invert a dependency graph: layer name -> layers that depend on it."""
+    dependents: Dict[str, List[str]] = {name: [] for name in graph}
+    for name, deps in graph.items():
+        for dep in deps:
+            dependents[dep].append(name)
+    return dependents
+
+
+def _build_layer(
+    generator: "LayerGenerator",
+    source_data: Any,
+    context: Dict[str, str],
+    upstream: Dict[str, Dict[str, Any]],
+    cache: Optional["BuildCache"] = None
+) -> Tuple[Dict[str, Any], float, float, Tuple[int, int]]:
+    """
+    Worker task: generate and validate one layer.
+
+    Returns:
+        (layer data, wall-clock start time, duration in seconds,
+         (partitions rebuilt, partitions reused))
+    """
+    started = time.time()
+    timer = time.perf_counter()
+    if cache is not None:
+        result = cache.build(generator, source_data, context, upstream)
+        layer_data = result.layer_data
+        counts = (len(result.rebuilt), len(result.reused))
+    else:
+        layer_data = generator.generate_with_dependencies(source_data, context, upstream)
+        counts = (1, 0)
+    if not generator.validate(layer_data):
+        raise ValueError(f"Layer {generator.layer_name} failed validation")
+    return layer_data, started, time.perf_counter() - timer, counts
@@ -5,9 +5,15 @@ Tier 2 (Reusable Research Tool)
 
 Routes queries to appropriate layer data.
 This is a stub for RR-014-016 research.
+
+Sharded layers (generators.layer_shards) are routed to the shards a query
+touches: narration, surah and verse parameters prune the layer's manifest.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:  # Only the interface is used
+    from generators.layer_shards import ShardedLayer, ShardInfo
 
 
 class QueryRouter:
@@ -20,6 +26,7 @@ class QueryRouter:
     def __init__(self):
         """Initialize router."""
         self.layer_registry: Dict[str, str] = {}
+        self.sharded_layers: Dict[str, "ShardedLayer"] = {}
 
     def register_layer(self, layer_name: str, data_path: str):
         """
@@ -31,6 +38,17 @@ class QueryRouter:
         """
         self.layer_registry[layer_name] = data_path
 
+    def register_sharded_layer(self, layer_name: str, layer: "ShardedLayer"):
+        """
+        Register a sharded layer.
+
+        Args:
+            layer_name: Layer name (e.g., "layer-00-character-composition")
+            layer: Opened sharded layer (its manifest drives pruning)
+        """
+        self.sharded_layers[layer_name] = layer
+        self.layer_registry[layer_name] = str(layer.layer_dir)
+
     def route_query(
         self,
         query_type: str,
@@ -53,6 +71,33 @@ class QueryRouter:
         """
         return self.layer_registry.get(layer_name)
 
+    def route_shards(
+        self,
+        layer_name: str,
+        query_params: Dict[str, Any]
+    ) -> List["ShardInfo"]:
+        """
+        Route a query to the shards of a sharded layer it touches.
+
+        Args:
+            layer_name: Target layer name
+            query_params: Optional "narration" (str or list), "surah"
+                          (int or list) and "verse" (int) restrictions
+
+        Returns:
+            Shards to load (all shards if no parameter restricts them)
+
+        Raises:
+            KeyError: If the layer is not registered as sharded
+        """
+        if layer_name not in self.sharded_layers:
+            raise KeyError(f"Layer is not registered as sharded: {layer_name}")
+        return self.sharded_layers[layer_name].shards(
+            narration=query_params.get("narration"),
+            surahs=query_params.get("surah"),
+            verse=query_params.get("verse"),
+        )
+
     def list_layers(self) -> List[str]:
         """
         List all registered layers.
@@ -5,3 +5,20 @@ Tier 2 (Reusable Research Tool)
 
 Tracks source tags and transformation audit logs for Quranic data.
 """
+
+from lazy_exports import TYPE_CHECKING, attach
+
+# Public name -> defining submodule; imported on first attribute access
+_LAZY_ATTRS = {
+    "ProvenanceTracker": "provenance_tracker",
+    "SourceTag": "provenance_tracker",
+    "TransformationRecord": "provenance_tracker",
+    "TransformationType": "provenance_tracker",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from .provenance_tracker import (
+        ProvenanceTracker, SourceTag, TransformationRecord, TransformationType
+    )
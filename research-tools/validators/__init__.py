@@ -3,3 +3,22 @@ Validators
 
 Schema validation utilities for Quranic data layers.
 """
+
+from lazy_exports import TYPE_CHECKING, attach
+
+# Public name -> defining submodule; imported on first attribute access
+_LAZY_ATTRS = {
+    "CharacterCountValidator": "char_count_validator",
+    "ContextValidator": "context_validator",
+    "ValidationResult": "context_validator",
+    "SchemaValidator": "schema_validator",
+    "VerseCountValidator": "verse_validator",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from .char_count_validator import CharacterCountValidator
+    from .context_validator import ContextValidator, ValidationResult
+    from .schema_validator import SchemaValidator
+    from .verse_validator import VerseCountValidator
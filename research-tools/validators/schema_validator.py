@@ -4,14 +4,17 @@ Schema Validator
 Tier 2 (Reusable Research Tool)
 
 Validates Quranic layer data against JSON Schema and Pydantic models.
+
+jsonschema and pydantic are imported on first use, so importing this
+module stays cheap for callers that never validate.
 """
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-import jsonschema
-from pydantic import BaseModel, ValidationError
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 
 class SchemaValidator:
@@ -81,6 +84,8 @@ class SchemaValidator:
         Raises:
             jsonschema.ValidationError: If strict=True and validation fails
         """
+        import jsonschema
+
         # Load schema if path provided
         if isinstance(schema, (str, Path)):
             schema = self.load_schema(schema)
@@ -104,9 +109,9 @@ class SchemaValidator:
     def validate_pydantic(
         self,
         data: Dict,
-        model_class: type[BaseModel],
+        model_class: type["BaseModel"],
         strict: bool = True
-    ) -> tuple[bool, Optional[BaseModel], Optional[List[str]]]:
+    ) -> tuple[bool, Optional["BaseModel"], Optional[List[str]]]:
         """
         Validate data against Pydantic model.
 
@@ -121,6 +126,8 @@ class SchemaValidator:
         Raises:
             ValidationError: If strict=True and validation fails
         """
+        from pydantic import ValidationError
+
         try:
             instance = model_class(**data)
             return (True, instance, None)
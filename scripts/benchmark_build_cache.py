@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark incremental layer rebuilds with the layer build cache.
+
+Two per-surah partitioned layers are built for a riwaya through
+LayerScheduler with a BuildCache:
+- characters: one entity per base letter, with its UUID (from aya_text)
+- word-lengths: letters per word, built from the character layer output
+Three builds are timed: cold (empty cache), warm (nothing changed) and
+after editing one ayah of --edit-surah, where only that surah's partition
+should be regenerated in each layer. Outputs are checked against a build
+without the cache.
+
+Usage:
+    python scripts/benchmark_build_cache.py
+    python scripts/benchmark_build_cache.py --riwaya warsh --edit-surah 18
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from generators.build_cache import BuildCache, surah_partitions
+from generators.layer_generator import LayerGenerator
+from generators.uuid_generator import HierarchicalIDBuilder
+from orchestration.layer_scheduler import LayerScheduler
+from riwaya_corpus import strip_aya_marker
+
+from generate_mushafs_metadata import RIWAYAT, load_riwaya_ayat
+
+
+class CharacterLayer(LayerGenerator):
+    """Base letters with IDs, partitioned by surah."""
+
+    code_version = "1"
+
+    def __init__(self):
+        super().__init__("characters", 0)
+
+    def generate(self, source_data: List[Dict], context: Dict[str, str]) -> Dict[str, Any]:
+        parts = {key: self.generate_partition(part, context)
+                 for key, part in self.partitions(source_data, context, {}).items()}
+        return self.merge_partitions(parts)
+
+    def partitions(self, source_data, context, dependencies) -> Dict[str, Any]:
+        return surah_partitions(source_data)
+
+    def generate_partition(self, partition: List[Dict], context: Dict[str, str]) -> Dict:
+        rows, letters = [], []
+        for ayah in partition:
+            surah, verse = ayah["sura_no"], ayah["aya_no"]
+            for w, word in enumerate(strip_aya_marker(ayah["aya_text"]).split(), 1):
+                base = [ch for ch in word if not unicodedata.combining(ch)]
+                rows.extend((surah, verse, w, c) for c in range(1, len(base) + 1))
+                letters.extend(base)
+        ids = HierarchicalIDBuilder(context["narration"]).char_ids(rows)
+        return {"entities": [
+            {"character_id": char_id, "ref": list(row), "base_letter": letter}
+            for char_id, row, letter in zip(ids, rows, letters)
+        ]}
+
+    def validate(self, layer_data: Dict[str, Any]) -> bool:
+        return bool(layer_data["entities"])
+
+    def get_dependencies(self) -> List[str]:
+        return []
+
+
+class WordLengthLayer(LayerGenerator):
+    """Letters per word, derived from the character layer."""
+
+    code_version = "1"
+
+    def __init__(self):
+        super().__init__("word-lengths", 1)
+
+    def generate(self, source_data: Any, context: Dict[str, str]) -> Dict[str, Any]:
+        raise ValueError("word-lengths is built from the characters layer")
+
+    def generate_with_dependencies(self, source_data, context, dependencies) -> Dict:
+        parts = {key: self.generate_partition(part, context)
+                 for key, part in self.partitions(source_data, context, dependencies).items()}
+        return self.merge_partitions(parts)
+
+    def partitions(self, source_data, context, dependencies) -> Dict[str, Any]:
+        by_surah: Dict[str, List] = {}
+        for entity in dependencies["characters"]["entities"]:
+            by_surah.setdefault(f"s{entity['ref'][0]:03d}", []).append(entity["ref"])
+        return by_surah
+
+    def generate_partition(self, partition: List[List[int]], context: Dict[str, str]) -> Dict:
+        lengths: Dict[tuple, int] = {}
+        for surah, verse, word, _ in partition:
+            lengths[(surah, verse, word)] = lengths.get((surah, verse, word), 0) + 1
+        return {"entities": [{"ref": list(ref), "letters": n} for ref, n in lengths.items()]}
+
+    def validate(self, layer_data: Dict[str, Any]) -> bool:
+        return bool(layer_data["entities"])
+
+    def get_dependencies(self) -> List[str]:
+        return ["characters"]
+
+
+def make_scheduler(cache=None) -> LayerScheduler:
+    scheduler = LayerScheduler(executor="serial", cache=cache)
+    scheduler.register_all([CharacterLayer(), WordLengthLayer()])
+    return scheduler
+
+
+def timed_build(scheduler: LayerScheduler, ayat: List[Dict], context: Dict[str, str]):
+    start = time.perf_counter()
+    layers = scheduler.run_one(ayat, context)
+    return layers, time.perf_counter() - start
+
+
+def main(riwaya_key: str, edit_surah: int, cache_dir: Path) -> int:
+    corpus = load_riwaya_ayat(riwaya_key)
+    ayat = [
+        {"sura_no": int(s), "aya_no": int(a), "aya_text": text}
+        for s, a, text in zip(corpus["sura_no"], corpus["aya_no"], corpus["aya_text"])
+    ]
+    context = {"narration": riwaya_key}
+    scheduler = make_scheduler(BuildCache(cache_dir))
+
+    print(f"{riwaya_key}: {len(ayat):,} ayat, cache at {cache_dir}")
+    print(f"{'build':<22}{'time':>9}  partitions rebuilt/reused per layer")
+    edited = None
+    for label in ("cold", "warm", f"edit surah {edit_surah}"):
+        if label.startswith("edit"):
+            index = next(i for i, a in enumerate(ayat) if a["sura_no"] == edit_surah)
+            ayat[index] = dict(ayat[index], aya_text=ayat[index]["aya_text"] + " ب")
+            edited = f"s{edit_surah:03d}"
+
+        layers, seconds = timed_build(scheduler, ayat, context)
+        counts = ", ".join(f"{run.layer_name} {run.rebuilt}/{run.reused}"
+                           for run in scheduler.runs)
+        print(f"{label:<22}{seconds:>8.2f}s  {counts}")
+
+        if edited and any(run.rebuilt != 1 for run in scheduler.runs):
+            print(f"ERROR: expected only {edited} to be rebuilt")
+            return 1
+
+    expected, seconds = timed_build(make_scheduler(), ayat, context)
+    print(f"{'no cache':<22}{seconds:>8.2f}s")
+    if layers != expected:
+        print("ERROR: cached build differs from a full build")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", default="hafs", choices=sorted(RIWAYAT),
+        help="Riwaya to build (default: hafs)",
+    )
+    parser.add_argument(
+        "--edit-surah", type=int, default=2,
+        help="Surah whose first ayah is edited before the last build (default: 2)",
+    )
+    parser.add_argument(
+        "--cache", type=Path, default=None,
+        help="Cache directory (default: a temporary directory)",
+    )
+    args = parser.parse_args()
+    if args.cache:
+        sys.exit(main(args.riwaya, args.edit_surah, args.cache))
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.exit(main(args.riwaya, args.edit_surah, Path(tmp)))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark SemanticHasher.hash_dict with the canonical JSON encoder.
+
+A full CHR (character composition) layer is built for a riwaya (see
+check_layer_container.py) and hashed two ways:
+- per entity with SemanticHasher.hash_layer_data (entity hashes)
+- whole, as {"entities": [...]} with SemanticHasher.hash_dict
+each with the previous implementation (json.dumps(sort_keys=True) then
+SHA-256) and with the canonical encoder. Every hash must be identical;
+throughput and the peak memory of hashing the whole layer are reported.
+
+Usage:
+    python scripts/benchmark_canonical_hash.py
+    python scripts/benchmark_canonical_hash.py --riwaya warsh
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from generators.semantic_hasher import SemanticHasher
+from generators.uuid_generator import json_default
+
+from check_layer_container import build_entities
+from generate_mushafs_metadata import RIWAYAT
+
+LAYER = "layer-00-character-composition"
+
+
+class JSONDumpsHasher(SemanticHasher):
+    """The previous hash_dict: one json.dumps string per call."""
+
+    def hash_dict(self, data: Dict[str, Any]) -> str:
+        normalized = json.dumps(data, sort_keys=True, ensure_ascii=False, default=json_default)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def measure(func: Callable[[], Any]):
+    """Run func twice: (result, seconds, peak traced memory in MB of a traced run)."""
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main(riwaya_key: str) -> int:
+    characters, _, _ = build_entities(riwaya_key)
+    hashers = {"json.dumps": JSONDumpsHasher(), "canonical": SemanticHasher()}
+    print(f"{riwaya_key}: {len(characters):,} CHR entities")
+
+    results = {}
+    for label, hasher in hashers.items():
+        start = time.perf_counter()
+        per_entity = [
+            hasher.hash_layer_data(LAYER, entity["character_id"], entity)
+            for entity in characters
+        ]
+        entity_seconds = time.perf_counter() - start
+        whole, whole_seconds, peak = measure(lambda: hasher.hash_dict({"entities": characters}))
+        results[label] = (per_entity, whole)
+        print(f"  {label:<11} per entity {entity_seconds:>6.2f}s "
+              f"({len(characters) / entity_seconds:>9,.0f}/s)   "
+              f"whole layer {whole_seconds:>5.2f}s, peak {peak:>6.1f} MB")
+
+    if results["json.dumps"] != results["canonical"]:
+        print("ERROR: canonical hashes differ from json.dumps hashes")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", default="hafs", choices=sorted(RIWAYAT),
+        help="Riwaya to build (default: hafs)",
+    )
+    args = parser.parse_args()
+    sys.exit(main(args.riwaya))
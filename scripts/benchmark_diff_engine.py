@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark DataComparator diff backends on Hafs vs Warsh.
+
+Every verse present in both riwayat (matched by surah and verse number) is
+compared with DataComparator.compare_narrations, once per backend:
+- "difflib": the previous implementation, which ran SequenceMatcher twice
+  per verse (for the character differences and for the ratio)
+- "bitparallel": the default, one minimal diff per verse
+Reported: time per backend, and the characters each alignment matches.
+Bit-parallel diffs must be valid (their opcodes rebuild the Warsh text),
+never match fewer characters than difflib, and match exactly a longest
+common subsequence on a sample of verses. Whole surahs are then diffed as
+one text each to exercise the linear-space split of large inputs.
+
+Usage:
+    python scripts/benchmark_diff_engine.py
+    python scripts/benchmark_diff_engine.py --second qaloun --surahs 2 3
+"""
+
+import argparse
+import difflib
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from analyzers.data_comparator import DataComparator
+from analyzers.diff_engine import DiffResult, get_diff_backend
+from riwaya_corpus import strip_aya_marker
+
+from generate_mushafs_metadata import RIWAYAT, load_riwaya_ayat
+
+LCS_SAMPLE_STEP = 50
+
+
+class TwoPassDifflib:
+    """The previous DataComparator: one SequenceMatcher for opcodes, another for the ratio."""
+
+    def diff(self, a: str, b: str) -> DiffResult:
+        matcher = difflib.SequenceMatcher(None, a, b)
+        matches = sum(block.size for block in matcher.get_matching_blocks())
+        difflib.SequenceMatcher(None, a, b).ratio()
+        return DiffResult(matcher.get_opcodes(), matches, len(a) + len(b))
+
+    def ratio(self, a: str, b: str) -> float:
+        return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+def load_verses(riwaya_key: str) -> List[Dict]:
+    corpus = load_riwaya_ayat(riwaya_key)
+    return [
+        {"surah": int(s), "verse": int(a), "text": strip_aya_marker(text)}
+        for s, a, text in zip(corpus["sura_no"], corpus["aya_no"], corpus["aya_text"])
+    ]
+
+
+def lcs_length(a: Sequence, b: Sequence) -> int:
+    """Reference dynamic-programming LCS length."""
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def rebuilds(a: str, b: str, result: DiffResult) -> bool:
+    """Check that opcodes cover both texts in order and rebuild b from a."""
+    i = j = 0
+    parts = []
+    for tag, i1, i2, j1, j2 in result.opcodes:
+        if (i1, j1) != (i, j) or (tag == "equal" and a[i1:i2] != b[j1:j2]):
+            return False
+        parts.append(b[j1:j2])
+        i, j = i2, j2
+    return (i, j) == (len(a), len(b)) and "".join(parts) == b
+
+
+def main(first: str, second: str, surahs: List[int]) -> int:
+    verses1 = load_verses(first)
+    verses2 = load_verses(second)
+    texts1 = {(v["surah"], v["verse"]): v["text"] for v in verses1}
+    texts2 = {(v["surah"], v["verse"]): v["text"] for v in verses2}
+    refs = sorted(set(texts1) & set(texts2))
+    pairs = [(texts1[ref], texts2[ref]) for ref in refs]
+    print(f"{first} vs {second}: {len(refs):,} verse pairs, "
+          f"{sum(len(a) + len(b) for a, b in pairs):,} characters")
+
+    backends = {"difflib x2 (previous)": TwoPassDifflib(), "bitparallel": "bitparallel"}
+    results = {}
+    for label, backend in backends.items():
+        comparator = DataComparator(backend=backend)
+        start = time.perf_counter()
+        comparator.compare_narrations(verses1, verses2)
+        seconds = time.perf_counter() - start
+        results[label] = [comparator.backend.diff(a, b) for a, b in pairs]
+        matches = sum(result.matches for result in results[label])
+        print(f"  {label:<22}{seconds:>7.2f}s  {matches:>9,} matched characters")
+
+    ok = True
+    heuristic, minimal = results.values()
+    if not all(rebuilds(a, b, result) for (a, b), result in zip(pairs, minimal)):
+        print("ERROR: bitparallel opcodes do not rebuild the second text")
+        ok = False
+    if any(m.matches < h.matches for m, h in zip(minimal, heuristic)):
+        print("ERROR: bitparallel matched fewer characters than difflib")
+        ok = False
+    sample = range(0, len(pairs), LCS_SAMPLE_STEP)
+    if any(minimal[i].matches != lcs_length(*pairs[i]) for i in sample):
+        print("ERROR: bitparallel diff is not a longest common subsequence")
+        ok = False
+
+    for surah in surahs:
+        a = " ".join(texts1[ref] for ref in refs if ref[0] == surah)
+        b = " ".join(texts2[ref] for ref in refs if ref[0] == surah)
+        print(f"  surah {surah} as one text ({len(a):,} vs {len(b):,} characters)")
+        for name in ("difflib", "bitparallel"):
+            start = time.perf_counter()
+            result = get_diff_backend(name).diff(a, b)
+            seconds = time.perf_counter() - start
+            print(f"    {name:<20}{seconds:>7.2f}s  ratio {result.ratio:.4f}")
+            if name == "bitparallel" and not rebuilds(a, b, result):
+                print(f"ERROR: surah {surah}: bitparallel opcodes do not rebuild the text")
+                ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--first", default="hafs", choices=sorted(RIWAYAT),
+        help="First riwaya (default: hafs)",
+    )
+    parser.add_argument(
+        "--second", default="warsh", choices=sorted(RIWAYAT),
+        help="Second riwaya (default: warsh)",
+    )
+    parser.add_argument(
+        "--surahs", type=int, nargs="*", default=[2],
+        help="Surahs also diffed as one text each (default: 2)",
+    )
+    args = parser.parse_args()
+    sys.exit(main(args.first, args.second, args.surahs))
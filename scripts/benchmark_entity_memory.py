@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Compare memory of dict and slotted entity records over a full riwaya.
+
+Ayah dicts come straight from the QS-QIRAAT JSON. Word, character and
+symbol dicts are derived from aya_text in the WRD/CHR/SYM schema shapes
+(words split on spaces, base letters as characters, combining marks as
+symbols) with deterministic UUIDs from uuid_generator.
+
+For each entity type the script reports, via tracemalloc:
+- dicts:   memory of the dict containers and their lists
+- slotted: memory of the equivalent entity_records instances and tuples
+Scalar field values (ids, text, numbers) are shared by both forms and
+excluded from both columns.
+
+Usage:
+    python scripts/benchmark_entity_memory.py
+    python scripts/benchmark_entity_memory.py --riwaya warsh
+"""
+
+import argparse
+import sys
+import tracemalloc
+import unicodedata
+from pathlib import Path
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from analyzers.performance_metrics import PerformanceAnalyzer
+from generators import uuid_generator
+from entity_records import AyahRecord, CharRecord, SymbolRecord, WordRecord
+from quran_loader import QuranLoader
+from riwaya_corpus import strip_aya_marker
+
+from generate_mushafs_metadata import RIWAYAT, find_json_file
+
+
+def build_layer_dicts(narration: str, ayat: list) -> dict:
+    """Derive WRD/CHR/SYM entity dicts from ayah records."""
+    words, chars, symbols = [], [], []
+
+    for ayah in ayat:
+        surah, verse = ayah["sura_no"], ayah["aya_no"]
+        verse_ref = uuid_generator.verse_id(narration, surah, verse)
+        position = 0
+
+        for w, word_text in enumerate(strip_aya_marker(ayah["aya_text"]).split(), 1):
+            word_ref = uuid_generator.word_id(narration, surah, verse, w)
+            char_refs = []
+            c = s = 0
+
+            for ch in word_text:
+                if unicodedata.combining(ch) and char_refs:
+                    s += 1
+                    symbols.append({
+                        "symbol_id": uuid_generator.symbol_id(narration, surah, verse, w, c, s),
+                        "character_ref": char_refs[-1],
+                        "symbol_type": "tashkeel",
+                        "symbol_codepoint": f"U+{ord(ch):04X}",
+                    })
+                    continue
+
+                c, s = c + 1, 0
+                char_ref = uuid_generator.char_id(narration, surah, verse, w, c)
+                char_refs.append(char_ref)
+                chars.append({
+                    "character_id": char_ref,
+                    "narration_ref": narration,
+                    "verse_ref": verse_ref,
+                    "position": position,
+                    "base_letter": ch,
+                    "phonetic_class": "other",
+                    "orthography_type": "uthmani",
+                    "word_ref": word_ref,
+                })
+                position += 1
+
+            words.append({
+                "word_id": word_ref,
+                "verse_ref": verse_ref,
+                "word_position": w - 1,
+                "character_refs": char_refs,
+                "character_range": [position - len(char_refs), position - 1],
+            })
+
+    return {"word": words, "char": chars, "symbol": symbols}
+
+
+def copy_dicts(dicts: list) -> list:
+    """Copy dict containers (and their lists) without copying scalar values."""
+    return [
+        {k: list(v) if isinstance(v, list) else v for k, v in d.items()}
+        for d in dicts
+    ]
+
+
+def traced(func, *args):
+    """Run func and return (result, bytes allocated and still held)."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func(*args)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def main(riwaya_key: str):
+    analyzer = PerformanceAnalyzer()
+    json_file = find_json_file(RIWAYAT[riwaya_key])
+
+    ayat = QuranLoader().load_json(json_file)
+    with analyzer.measure(f"derive {riwaya_key} word/char/symbol dicts"):
+        layers = build_layer_dicts(riwaya_key, ayat)
+
+    entities = {
+        "ayah": (ayat, AyahRecord),
+        "word": (layers["word"], WordRecord),
+        "char": (layers["char"], CharRecord),
+        "symbol": (layers["symbol"], SymbolRecord),
+    }
+
+    print(f"\n{'entity':<8}{'count':>10}{'dicts':>12}{'slotted':>12}{'saved':>8}")
+    print("-" * 50)
+
+    dict_total = record_total = 0
+    for name, (dicts, record_type) in entities.items():
+        with analyzer.measure(f"{name} dicts -> {record_type.__name__}", entity_count=len(dicts)):
+            records = record_type.from_dicts(dicts)
+
+        # Check the slotted form round-trips to the original dicts
+        if any(r.to_dict() != d for r, d in zip(records, dicts)):
+            raise SystemExit(f"{record_type.__name__} round-trip mismatch")
+        del records
+
+        _, dict_bytes = traced(copy_dicts, dicts)
+        _, record_bytes = traced(record_type.from_dicts, dicts)
+        dict_total += dict_bytes
+        record_total += record_bytes
+
+        print(
+            f"{name:<8}{len(dicts):>10,}{dict_bytes / 2**20:>10.1f}MB"
+            f"{record_bytes / 2**20:>10.1f}MB{1 - record_bytes / dict_bytes:>8.0%}"
+        )
+
+    print("-" * 50)
+    print(
+        f"{'total':<18}{dict_total / 2**20:>10.1f}MB"
+        f"{record_total / 2**20:>10.1f}MB{1 - record_total / dict_total:>8.0%}"
+    )
+    analyzer.print_summary()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", default="hafs", choices=sorted(RIWAYAT),
+        help="Riwaya to measure (default: hafs)",
+    )
+    args = parser.parse_args()
+    main(args.riwaya)
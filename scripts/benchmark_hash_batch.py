@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch hashing with SemanticHasher.hash_many / hash_relationships_many.
+
+Containment relationships (verse contains word, word contains character)
+are derived from the CHR and WRD entities of a riwaya (see
+check_layer_container.py) and hashed:
+- one call per relationship with hash_relationship (the previous way)
+- in one batch, serially and across a thread and a process pool
+for SHA-256 and BLAKE2b. The CHR entities themselves are hashed with
+hash_many the same ways. Batch results must equal the per-call hashes.
+
+Batches are serial by default. Threads only help for large buffers
+(hashlib releases the GIL above about 2 KB), and a process pool only pays
+off with enough cores to cover pickling the items (0.6x of serial on
+small machines), so both are opt-in.
+
+Usage:
+    python scripts/benchmark_hash_batch.py
+    python scripts/benchmark_hash_batch.py --riwaya warsh --workers 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from generators.semantic_hasher import HASH_ALGORITHMS, SemanticHasher
+
+from check_layer_container import build_entities
+from generate_mushafs_metadata import RIWAYAT
+
+
+def timed(func: Callable[[], List[str]]):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def report(label: str, count: int, seconds: float, baseline: float):
+    print(f"    {label:<22}{seconds:>7.2f}s  {count / seconds:>11,.0f}/s  "
+          f"({baseline / seconds:.1f}x)")
+
+
+def run_batches(title: str, items: List[Any], single: Callable, many: str, workers: int) -> bool:
+    """Time per-call hashing against batch hashing for every algorithm and executor."""
+    ok = True
+    print(f"  {title}: {len(items):,}")
+    for algorithm in HASH_ALGORITHMS:
+        hasher = SemanticHasher(algorithm)
+        expected, baseline = timed(lambda: [single(hasher, item) for item in items])
+        print(f"   {algorithm}")
+        report("per call", len(items), baseline, baseline)
+        for executor in ("serial", "thread", "process"):
+            batch = getattr(hasher, many)
+            result, seconds = timed(lambda: batch(items, max_workers=workers, executor=executor))
+            report(f"batch, {executor}", len(items), seconds, baseline)
+            if result != expected:
+                print(f"ERROR: {algorithm} {executor} batch differs from per-call hashes")
+                ok = False
+    return ok
+
+
+def main(riwaya_key: str, workers: int) -> int:
+    characters, words, _ = build_entities(riwaya_key)
+    relationships = []
+    for word in words:
+        relationships.append((word["verse_ref"], word["word_id"], "contains"))
+        relationships.extend((word["word_id"], ref, "contains") for ref in word["character_refs"])
+
+    print(f"{riwaya_key}, {workers} workers ({os.cpu_count()} CPUs)")
+    ok = run_batches(
+        "relationships", relationships,
+        lambda hasher, rel: hasher.hash_relationship(*rel), "hash_relationships_many", workers,
+    )
+    ok = run_batches(
+        "CHR entities", characters,
+        lambda hasher, entity: hasher.hash_json(entity), "hash_many", workers,
+    ) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", default="hafs", choices=sorted(RIWAYAT),
+        help="Riwaya to build (default: hafs)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Pool size (default: CPU count)",
+    )
+    args = parser.parse_args()
+    sys.exit(main(args.riwaya, max(args.workers, 1)))
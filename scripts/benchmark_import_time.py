@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Check import time of research-tools modules against a budget.
+
+Each target is imported in a fresh interpreter under `python -X importtime`
+and its cumulative import time (excluding interpreter startup) is compared
+with a budget. Targets also list heavy dependencies they must not pull in
+at import time (jsonschema, pydantic, numpy), which catches regressions
+independently of machine speed.
+
+Exits non-zero if any target is over budget or imports a forbidden module,
+so it can gate CI; tests/test_import_time.py runs the same checks under
+pytest.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --repeat 10 --scale 2.0
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+IMPORT_PATHS = [RESEARCH_TOOLS, RESEARCH_TOOLS / "data-loaders"]
+
+HEAVY = ("jsonschema", "pydantic", "numpy")
+
+# Subpackage __init__ files only hold lazy exports, so not even typing
+PACKAGE = HEAVY + ("typing",)
+
+# Target module -> (budget in ms, modules it must not import)
+BUDGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "lazy_exports": (5, PACKAGE),
+    "generators": (10, PACKAGE),
+    "generators.uuid_generator": (60, HEAVY),
+    "validators": (10, PACKAGE),
+    "validators.schema_validator": (60, HEAVY),
+    "analyzers": (10, PACKAGE),
+    "orchestration": (10, PACKAGE),
+    "provenance": (10, PACKAGE),
+    "narration_parser": (60, HEAVY),
+    "csv_loader": (80, HEAVY),
+    "quran_loader": (80, HEAVY),
+}
+
+
+def run_importtime(statement: str) -> List[Tuple[int, str, int]]:
+    """
+    Run a statement under -X importtime in a fresh interpreter.
+
+    Returns:
+        (cumulative_us, module_name, depth) for every import entry
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(p) for p in IMPORT_PATHS] + [env.get("PYTHONPATH", "")]
+    ).rstrip(os.pathsep)
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{result.stderr.strip()}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((int(cumulative), name.strip(), depth))
+    return entries
+
+
+def measure(target: str, startup: Set[str]) -> Tuple[float, Set[str]]:
+    """
+    Measure one import of target.
+
+    Returns:
+        (milliseconds, names of all modules imported beyond startup)
+    """
+    entries = run_importtime(f"import {target}")
+    top_level = sum(us for us, name, depth in entries if depth == 0 and name not in startup)
+    imported = {name for _, name, _ in entries} - startup
+    return top_level / 1000, imported
+
+
+def startup_modules() -> Set[str]:
+    """Modules an empty interpreter run imports."""
+    return {name for _, name, _ in run_importtime("pass")}
+
+
+def check(target: str, startup: Set[str], repeat: int, scale: float) -> Tuple[float, List[str]]:
+    """
+    Check one target against its budget and forbidden modules.
+
+    Returns:
+        (best milliseconds over repeat runs, problems; empty if ok)
+    """
+    budget_ms, forbidden = BUDGETS[target]
+    best = None
+    imported: Set[str] = set()
+    for _ in range(repeat):
+        ms, modules = measure(target, startup)
+        best = ms if best is None else min(best, ms)
+        imported |= modules
+
+    heavy = sorted({name.split(".")[0] for name in imported} & set(forbidden))
+    problems = []
+    if best > budget_ms * scale:
+        problems.append("over budget")
+    if heavy:
+        problems.append(f"imports {', '.join(heavy)}")
+    return best, problems
+
+
+def main(repeat: int, scale: float) -> int:
+    startup = startup_modules()
+
+    print(f"{'module':<30}{'best':>10}{'budget':>10}  status")
+    print("-" * 62)
+
+    failures = 0
+    for target, (budget_ms, _) in BUDGETS.items():
+        best, problems = check(target, startup, repeat, scale)
+        failures += bool(problems)
+
+        status = "; ".join(problems) or "ok"
+        print(f"{target:<30}{best:>8.1f}ms{budget_ms * scale:>8.1f}ms  {status}")
+
+    if failures:
+        print(f"\n{failures} module(s) failed the import budget")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=5,
+        help="Fresh-interpreter runs per module; the best time is compared",
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0,
+        help="Multiply every budget (e.g. 2.0 on slow CI machines)",
+    )
+    args = parser.parse_args()
+    sys.exit(main(max(args.repeat, 1), args.scale))
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark the dependency-aware layer scheduler on the schema layer DAG.
+
+One synthetic generator is registered per layer in
+schemas/base_layers/base_layers_v1.json, with the dependencies in
+LAYER_DEPENDENCIES. Each generator loads its riwaya (whole ayat, cached)
+and does CPU-bound work per ayah: hashing the ayah text together with the
+digests of the upstream layers it receives in memory. All layers are built
+for the selected riwayat once in-process ("serial") and once in a process
+pool, and the outputs are checked to be identical.
+
+The speedup is bounded by the number of cores and by the critical path of
+the DAG, which is reported alongside.
+
+Usage:
+    python scripts/benchmark_layer_scheduler.py
+    python scripts/benchmark_layer_scheduler.py --riwaya hafs --riwaya warsh --workers 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+BASE_LAYERS = SCRIPT_DIR.parent / "schemas" / "base_layers" / "base_layers_v1.json"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from generators.layer_generator import LayerGenerator
+from orchestration.layer_scheduler import LayerScheduler
+
+from generate_mushafs_metadata import RIWAYAT, load_riwaya_ayat
+
+# Layer code -> codes of layers it is built from
+LAYER_DEPENDENCIES = {
+    "RDR": [], "EDN": [], "SUR": [],
+    "QIR": ["RDR"],
+    "AYA": ["SUR", "QIR"],
+    "MSH": ["QIR", "EDN"],
+    "CHR": ["AYA"],
+    "SYM": ["CHR"],
+    "TJW": ["CHR", "SYM"],
+    "WRD": ["AYA", "CHR"],
+    "UTH": ["WRD"],
+    "QSY": ["WRD"],
+    "SNT": ["AYA", "WRD"],
+    "DIV": ["AYA"],
+    "PAG": ["MSH", "AYA"],
+    "LIN": ["PAG", "WRD"],
+}
+
+ROUNDS = 20  # Hash rounds per ayah (work per layer)
+
+
+class SyntheticLayer(LayerGenerator):
+    """CPU-bound stand-in for a schema layer generator."""
+
+    def __init__(self, code: str, number: int):
+        super().__init__(code, number)
+        self.code = code
+
+    def generate(self, source_data: str, context: Dict[str, str]) -> Dict[str, Any]:
+        return self.generate_with_dependencies(source_data, context, {})
+
+    def generate_with_dependencies(
+        self, source_data: str, context: Dict[str, str], dependencies: Dict[str, Dict]
+    ) -> Dict[str, Any]:
+        seed = "".join(dependencies[dep]["digest"] for dep in sorted(dependencies))
+        layer_hash = hashlib.sha256(f"{self.code}:{seed}".encode("utf-8"))
+        ayat = load_riwaya_ayat(source_data)
+        for text in ayat["aya_text"]:
+            digest = text.encode("utf-8")
+            for _ in range(ROUNDS):
+                digest = hashlib.sha256(digest).digest()
+            layer_hash.update(digest)
+        return {"entity_count": len(ayat), "digest": layer_hash.hexdigest()}
+
+    def validate(self, layer_data: Dict[str, Any]) -> bool:
+        return layer_data["entity_count"] > 0
+
+    def get_dependencies(self) -> List[str]:
+        return LAYER_DEPENDENCIES[self.code]
+
+
+def build_scheduler(executor: str, workers: int) -> LayerScheduler:
+    with open(BASE_LAYERS, encoding="utf-8") as f:
+        codes = [layer["code"] for layer in json.load(f)["layers"]]
+    scheduler = LayerScheduler(max_workers=workers, executor=executor)
+    scheduler.register_all(SyntheticLayer(code, n) for n, code in enumerate(codes))
+    return scheduler
+
+
+def critical_path(scheduler: LayerScheduler, durations: Dict[str, float]) -> float:
+    """Longest dependency chain by mean per-layer duration."""
+    finish: Dict[str, float] = {}
+    graph = scheduler.dependencies()
+    for name in scheduler.order():
+        finish[name] = durations[name] + max((finish[d] for d in graph[name]), default=0.0)
+    return max(finish.values())
+
+
+def main(riwayat: List[str], workers: int) -> int:
+    jobs = {key: (key, {"narration": key}) for key in riwayat}
+    for key in riwayat:
+        load_riwaya_ayat(key)  # Warm the whole-ayah cache outside the timings
+
+    timings = {}
+    results = {}
+    for executor in ("serial", "process"):
+        scheduler = build_scheduler(executor, workers)
+        start = time.perf_counter()
+        results[executor] = scheduler.run(jobs)
+        timings[executor] = time.perf_counter() - start
+
+    if results["serial"] != results["process"]:
+        print("ERROR: process pool results differ from serial results")
+        return 1
+
+    per_layer: Dict[str, List[float]] = {}
+    for run in scheduler.runs:
+        per_layer.setdefault(run.layer_name, []).append(run.duration_seconds)
+    mean = {name: sum(d) / len(d) for name, d in per_layer.items()}
+
+    layers = len(scheduler.generators)
+    print(f"{layers} layers x {len(riwayat)} riwayat = {layers * len(riwayat)} builds, "
+          f"{workers} workers ({os.cpu_count()} CPUs)")
+    print(f"  serial   {timings['serial']:>8.2f}s")
+    print(f"  process  {timings['process']:>8.2f}s  "
+          f"({timings['serial'] / timings['process']:.1f}x)")
+    print(f"  critical path per riwaya {critical_path(scheduler, mean):.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", action="append", choices=sorted(RIWAYAT),
+        help="Riwaya to build (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Process pool size (default: CPU count)",
+    )
+    args = parser.parse_args()
+    sys.exit(main(args.riwaya or list(RIWAYAT), max(args.workers, 1)))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark sharded layer output against a single layer file.
+
+CHR (character composition) entities are built for the selected riwayat
+(see check_layer_container.py) and saved once as one JSON file per riwaya
+(LayerGenerator.save) and once as shards partitioned by narration and surah
+(LayerGenerator.save_sharded). Reported:
+- write time of both forms (shards with 1 thread and with --workers)
+- time to answer "all characters of surah --surah in riwaya X" by loading
+  the whole JSON file vs loading only the shards QueryRouter routes to
+The sharded answer is checked against the JSON one.
+
+Usage:
+    python scripts/benchmark_layer_shards.py
+    python scripts/benchmark_layer_shards.py --riwaya hafs --riwaya warsh --surah 18
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from generators.layer_shards import ShardedLayer
+from orchestration.query_router import QueryRouter
+
+from check_layer_container import SavedLayer, build_entities
+from generate_mushafs_metadata import RIWAYAT
+
+LAYER = "layer-00-character-composition"
+
+
+def main(riwayat: List[str], surah: int, workers: int, output_dir: Path) -> int:
+    thread_counts = sorted({1, workers})
+    timings = dict.fromkeys(["json"] + [f"shards ({n} threads)" for n in thread_counts], 0.0)
+    verses = {}
+    for key in riwayat:
+        characters, _, riwaya_verses = build_entities(key)
+        verses.update(riwaya_verses)
+        coordinates = lambda entity: verses[entity["verse_ref"]]  # noqa: E731
+        layer_data = {"entities": characters}
+
+        generator = SavedLayer("character-composition", 0, output_dir / "json" / key)
+        start = time.perf_counter()
+        generator.save(layer_data)
+        timings["json"] += time.perf_counter() - start
+
+        for threads in thread_counts:
+            generator = SavedLayer("character-composition", 0, output_dir / f"shards-{threads}")
+            start = time.perf_counter()
+            generator.save_sharded(layer_data, coordinates, key, max_workers=threads)
+            timings[f"shards ({threads} threads)"] += time.perf_counter() - start
+
+    print(f"{len(riwayat)} riwayat, {workers} workers ({os.cpu_count()} CPUs)")
+    for label, seconds in timings.items():
+        print(f"  write {label:<20}{seconds:>8.2f}s")
+
+    layer = ShardedLayer(output_dir / f"shards-{workers}" / LAYER, max_workers=workers)
+    router = QueryRouter()
+    router.register_sharded_layer(LAYER, layer)
+    print(f"  {len(layer.shards()):,} shards, {len(layer):,} entities")
+
+    ok = True
+    for key in riwayat:
+        start = time.perf_counter()
+        with open(output_dir / "json" / key / f"{LAYER}.json", encoding="utf-8") as f:
+            entities = json.load(f)["data"]["entities"]
+        expected = [e for e in entities if verses[e["verse_ref"]][0] == surah]
+        json_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        shards = router.route_shards(LAYER, {"narration": key, "surah": surah})
+        found = layer.read(narration=key, surahs=surah)
+        shard_seconds = time.perf_counter() - start
+
+        print(f"  {key} surah {surah}: whole file {json_seconds:.2f}s, "
+              f"{len(shards)} shard(s) {shard_seconds * 1000:.1f} ms ({len(found):,} entities)")
+        if found != expected:
+            print(f"ERROR: {key}: sharded read differs from the JSON layer")
+            ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", action="append", choices=sorted(RIWAYAT),
+        help="Riwaya to build (repeatable; default: hafs and warsh)",
+    )
+    parser.add_argument(
+        "--surah", type=int, default=2,
+        help="Surah queried (default: 2)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Writer/reader threads (default: CPU count)",
+    )
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.exit(main(args.riwaya or ["hafs", "warsh"], args.surah, max(args.workers, 1),
+                      Path(tmp)))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Compare peak memory of whole-layer and streamed layer output.
+
+A character layer (one entity per base letter, derived from aya_text as in
+benchmark_entity_memory.py) is written twice for a riwaya:
+- whole:    generate() builds every entity, save() dumps one JSON document
+- streamed: generate_stream() builds one surah per chunk, save_stream()
+            writes JSON Lines as chunks arrive
+Peak traced memory, duration and file size are reported for both, and the
+streamed file is read back with iter_layer_entities() and checked against
+the whole layer.
+
+Usage:
+    python scripts/benchmark_layer_stream.py
+    python scripts/benchmark_layer_stream.py --riwaya warsh --output /tmp/layers
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from generators.layer_generator import (
+    LayerGenerator, iter_layer_entities, read_layer_metadata,
+)
+from generators.uuid_generator import HierarchicalIDBuilder
+from quran_loader import QuranLoader
+from riwaya_corpus import strip_aya_marker
+
+from generate_mushafs_metadata import RIWAYAT, find_json_file
+
+
+class CharacterLayer(LayerGenerator):
+    """Minimal character layer: ID, coordinates and base letter per character."""
+
+    def __init__(self, output_dir: Path):
+        super().__init__("character-composition", 0, output_dir)
+
+    def generate(self, source_data: List[Dict], context: Dict[str, str]) -> Dict[str, Any]:
+        entities = []
+        for chunk in self.generate_stream(source_data, context):
+            entities.extend(chunk)
+        return {"entities": entities}
+
+    def generate_stream(
+        self, source_data: List[Dict], context: Dict[str, str], chunk_size: int = 0
+    ) -> Iterator[List[Dict[str, Any]]]:
+        # One chunk per surah; chunk_size is not used
+        builder = HierarchicalIDBuilder(context["narration"])
+        surah, rows, letters = None, [], []
+        for ayah in source_data + [{"sura_no": None}]:
+            if ayah["sura_no"] != surah:
+                if rows:
+                    yield [
+                        {"character_id": char_id, "surah": s, "verse": v, "word": w,
+                         "char": c, "base_letter": letter}
+                        for char_id, (s, v, w, c), letter
+                        in zip(builder.char_ids(rows), rows, letters)
+                    ]
+                surah, rows, letters = ayah["sura_no"], [], []
+            if surah is None:
+                break
+
+            verse = ayah["aya_no"]
+            for w, word in enumerate(strip_aya_marker(ayah["aya_text"]).split(), 1):
+                base = [ch for ch in word if not unicodedata.combining(ch)]
+                rows.extend((surah, verse, w, c) for c in range(1, len(base) + 1))
+                letters.extend(base)
+
+    def validate(self, layer_data: Dict[str, Any]) -> bool:
+        return True
+
+    def get_dependencies(self) -> List[str]:
+        return []
+
+
+def traced_peak(func, *args):
+    """Run func and return (result, peak traced bytes, seconds)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, peak, time.perf_counter() - start
+
+
+def main(riwaya_key: str, output_dir: Path) -> int:
+    ayat = QuranLoader().load_json(find_json_file(RIWAYAT[riwaya_key]))
+    layer = CharacterLayer(output_dir)
+    context = {"narration": riwaya_key}
+
+    whole_path, whole_peak, whole_s = traced_peak(
+        lambda: layer.save(layer.generate(ayat, context))
+    )
+    stream_path, stream_peak, stream_s = traced_peak(
+        lambda: layer.save_stream(layer.generate_stream(ayat, context))
+    )
+
+    with open(whole_path, encoding="utf-8") as f:
+        expected = json.load(f)["data"]["entities"]
+    streamed = [entity for chunk in iter_layer_entities(stream_path) for entity in chunk]
+    metadata = read_layer_metadata(stream_path)
+    if streamed != expected or metadata["entity_count"] != len(expected):
+        print("ERROR: streamed layer differs from whole layer")
+        return 1
+
+    print(f"{riwaya_key}: {len(expected):,} characters in {metadata['chunk_count']} chunks")
+    print(f"{'output':<10}{'peak':>12}{'time':>10}{'file':>12}")
+    for name, path, peak, seconds in [
+        ("whole", whole_path, whole_peak, whole_s),
+        ("streamed", stream_path, stream_peak, stream_s),
+    ]:
+        print(f"{name:<10}{peak / 2**20:>10.1f}MB{seconds:>9.2f}s"
+              f"{path.stat().st_size / 2**20:>10.1f}MB")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", default="hafs", choices=sorted(RIWAYAT),
+        help="Riwaya to generate (default: hafs)",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=None,
+        help="Directory for the layer files (default: a temporary directory)",
+    )
+    args = parser.parse_args()
+    if args.output:
+        sys.exit(main(args.riwaya, args.output))
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.exit(main(args.riwaya, Path(tmp)))
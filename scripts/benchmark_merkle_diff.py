@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark Merkle-tree diffs between two versions of a riwaya.
+
+A Merkle tree (mushaf -> surah -> verse -> word -> char) is built for a
+riwaya and persisted, once with all node hashes and once down to verse
+level. A second version is made by editing one character in --edits ayat
+spread over the mushaf; the stored tree is loaded and diffed against the
+new one. Reported: build and load times, and the hash comparisons made by
+the diff vs the previous approach of locating changes by rehashing every
+verse of both versions with SemanticHasher. The diff must report exactly
+the edited verses.
+
+Usage:
+    python scripts/benchmark_merkle_diff.py
+    python scripts/benchmark_merkle_diff.py --riwaya warsh --edits 50
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from generators.merkle_tree import MerkleTree
+from generators.semantic_hasher import SemanticHasher
+from riwaya_corpus import strip_aya_marker
+
+from generate_mushafs_metadata import RIWAYAT, load_riwaya_ayat
+
+
+def edit_ayat(ayat: List[Tuple[int, int, str]], edits: int) -> List[Tuple[int, int]]:
+    """Append a fatha to the first letter of evenly spaced ayat (in place)."""
+    step = max(len(ayat) // edits, 1)
+    edited = []
+    for i in range(0, step * edits, step):
+        surah, verse, text = ayat[i]
+        ayat[i] = (surah, verse, text[0] + "َ" + text[1:])
+        edited.append((surah, verse))
+    return edited
+
+
+def main(riwaya_key: str, edits: int, output_dir: Path) -> int:
+    corpus = load_riwaya_ayat(riwaya_key)
+    ayat = [
+        (int(s), int(a), strip_aya_marker(text))
+        for s, a, text in zip(corpus["sura_no"], corpus["aya_no"], corpus["aya_text"])
+    ]
+    hasher = SemanticHasher()
+
+    start = time.perf_counter()
+    tree = hasher.merkle_tree(ayat)
+    build_seconds = time.perf_counter() - start
+    full_path = tree.save(output_dir / f"{riwaya_key}.merkle")
+    verse_path = tree.save(output_dir / f"{riwaya_key}-verses.merkle", depth=2)
+
+    old_ayat = list(ayat)
+    edited = edit_ayat(ayat, edits)
+    new_tree = hasher.merkle_tree(ayat)
+
+    print(f"{riwaya_key}: {len(ayat):,} ayat, {len(tree):,} nodes, build {build_seconds:.2f}s")
+    ok = True
+    for label, path in (("full", full_path), ("verse-level", verse_path)):
+        start = time.perf_counter()
+        stored = MerkleTree.load(path)
+        load_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        diff = stored.diff(new_tree, max_depth=2)
+        diff_seconds = time.perf_counter() - start
+
+        print(f"  {label:<12} {path.stat().st_size / 1024:>8.0f} KB  load {load_seconds:.3f}s  "
+              f"diff {diff_seconds * 1000:.2f} ms, {diff.comparisons:,} comparisons "
+              f"for {len(diff.changes)} changed verses")
+        if sorted(change.path for change in diff.changes) != sorted(edited):
+            print(f"ERROR: {label}: diff does not match the edited verses")
+            ok = False
+
+    start = time.perf_counter()
+    rescanned = [
+        (old[0], old[1]) for old, new in zip(old_ayat, ayat)
+        if hasher.hash_string(old[2]) != hasher.hash_string(new[2])
+    ]
+    print(f"  full rescan  {time.perf_counter() - start:.3f}s, {len(ayat):,} comparisons "
+          f"for {len(rescanned)} changed verses")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", default="hafs", choices=sorted(RIWAYAT),
+        help="Riwaya to hash (default: hafs)",
+    )
+    parser.add_argument(
+        "--edits", type=int, default=10,
+        help="Number of ayat edited in the second version (default: 10)",
+    )
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.exit(main(args.riwaya, max(args.edits, 1), Path(tmp)))
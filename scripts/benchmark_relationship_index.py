@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Benchmark RelationshipIndex traversals and persistence.
+
+Cross-layer mappings are derived for a riwaya from its CHR and WRD entities
+(see check_layer_container.py) and the mushaf layout of its ayat:
+- PAG -> LIN (composition, 1:N)
+- LIN -> AYA (composition, N:M: a line holds several ayat, an aya spans lines)
+- AYA -> WRD and WRD -> CHR (composition, 1:N)
+They are indexed (adding them twice must add nothing the second time) and
+traversed: verse -> words -> characters, page -> lines -> ayat -> words and
+character -> word -> verse. Every traversal must match the source entities.
+Reported: build time, mean traversal latency, and the size and load time
+of the saved index against the same mappings as JSON.
+
+Usage:
+    python scripts/benchmark_relationship_index.py
+    python scripts/benchmark_relationship_index.py --riwaya warsh
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from generators.relationship_index import RelationshipIndex
+from generators.uuid_generator import line_id, page_id, verse_id
+
+from check_layer_container import build_entities
+from generate_mushafs_metadata import RIWAYAT, load_riwaya_ayat
+
+EDITION = "kfgqpc"
+LINES_PER_PAGE = 15
+
+
+def layout_mappings(riwaya_key: str, layers: Dict[str, Dict]) -> List[Dict]:
+    """PAG -> LIN and LIN -> AYA mappings from the page and line span of each aya."""
+    corpus = load_riwaya_ayat(riwaya_key)
+    line_verses: Dict[tuple, List[str]] = {}
+    for s, a, page, line_start, page_end, line_end in zip(
+        corpus["sura_no"], corpus["aya_no"], corpus["page"],
+        corpus["line_start"], corpus["page_end"], corpus["line_end"],
+    ):
+        verse_ref = verse_id(riwaya_key, int(s), int(a))
+        page, page_end = int(page), int(page_end)
+        for p in range(page, page_end + 1):
+            first = int(line_start) if p == page else 1
+            last = int(line_end) if p == page_end else LINES_PER_PAGE
+            for line in range(first, last + 1):
+                line_verses.setdefault((p, line), []).append(verse_ref)
+
+    page_lines: Dict[int, List[str]] = {}
+    mappings = []
+    for (page, line), verse_refs in sorted(line_verses.items()):
+        line_ref = line_id(riwaya_key, EDITION, page, line)
+        page_lines.setdefault(page, []).append(line_ref)
+        mappings.append(mapping(layers["LIN"], line_ref, layers["AYA"], verse_refs, "N:M"))
+    for page, line_refs in page_lines.items():
+        mappings.append(
+            mapping(layers["PAG"], page_id(riwaya_key, EDITION, page), layers["LIN"], line_refs)
+        )
+    return mappings
+
+
+def mapping(source_layer: Dict, source_id: str, target_layer: Dict,
+            target_ids: Sequence[str], cardinality: str = "1:N") -> Dict:
+    return {
+        "source": {"layer": source_layer, "entity_id": source_id},
+        "target": {"layer": target_layer, "entity_ids": list(target_ids)},
+        "mapping_type": "composition",
+        "cardinality": cardinality,
+        "mapping_version": "1.0.0",
+        "provenance": {"source_dataset": "QS-QIRAAT-v2.0", "generation_method": "extracted"},
+    }
+
+
+def mean_microseconds(func: Callable, args: List) -> float:
+    start = time.perf_counter()
+    for arg in args:
+        func(arg)
+    return (time.perf_counter() - start) / len(args) * 1e6
+
+
+def check_traversals(index: RelationshipIndex, words: List[Dict], label: str) -> bool:
+    """Compare traversals against the WRD entities."""
+    verse_chars: Dict[str, List[str]] = {}
+    for word in words:
+        verse_chars.setdefault(word["verse_ref"], []).extend(word["character_refs"])
+    ok = all(index.traverse([v], ["WRD", "CHR"]) == chars for v, chars in verse_chars.items())
+    ok = ok and all(
+        index.traverse([ref], ["WRD", "AYA"], reverse=True) == [word["verse_ref"]]
+        for word in words[::97] for ref in word["character_refs"]
+    )
+    if not ok:
+        print(f"ERROR: {label} traversals do not match the WRD entities")
+    return ok
+
+
+def main(riwaya_key: str, output_dir: Path) -> int:
+    _, words, verses = build_entities(riwaya_key)
+    context = {"qiraah": riwaya_key, "orthography": "uthmani"}
+    layers = {code: {"code": code, "context": context} for code in ("AYA", "WRD", "CHR")}
+    for code in ("PAG", "LIN"):
+        layers[code] = {"code": code, "context": {**context, "edition": EDITION}}
+
+    verse_words: Dict[str, List[str]] = {}
+    for word in words:
+        verse_words.setdefault(word["verse_ref"], []).append(word["word_id"])
+    mappings = layout_mappings(riwaya_key, layers)
+    mappings += [
+        mapping(layers["AYA"], verse_ref, layers["WRD"], word_refs)
+        for verse_ref, word_refs in verse_words.items()
+    ]
+    mappings += [
+        mapping(layers["WRD"], word["word_id"], layers["CHR"], word["character_refs"])
+        for word in words
+    ]
+
+    index = RelationshipIndex()
+    start = time.perf_counter()
+    added = index.add_mappings(mappings)
+    build_seconds = time.perf_counter() - start
+    readded = index.add_mappings(mappings)
+    print(f"{riwaya_key}: {added:,} mappings, {index.edge_count:,} edges, "
+          f"{index.entity_count:,} entities, build {build_seconds:.2f}s")
+    ok = added == len(mappings) and readded == 0
+    if not ok:
+        print(f"ERROR: expected {len(mappings)} new mappings then 0, got {added} and {readded}")
+
+    verse_refs = list(verses)
+    pages = [
+        m["source"]["entity_id"] for m in mappings if m["source"]["layer"]["code"] == "PAG"
+    ]
+    char_refs = [ref for word in words[::11] for ref in word["character_refs"]]
+    queries = [
+        ("verse -> words", lambda v: index.targets(v, layer="WRD"), verse_refs),
+        ("verse -> words -> chars", lambda v: index.traverse([v], ["WRD", "CHR"]), verse_refs),
+        ("page -> lines -> ayat -> words",
+         lambda p: index.traverse([p], ["LIN", "AYA", "WRD"]), pages),
+        ("char -> word", lambda c: index.sources(c, layer="WRD"), char_refs),
+        ("char -> word -> verse",
+         lambda c: index.traverse([c], ["WRD", "AYA"], reverse=True), char_refs),
+    ]
+    for label, func, args in queries:
+        print(f"  {label:<31}{mean_microseconds(func, args):>8.1f} us  ({len(args):,} queries)")
+    ok = check_traversals(index, words, "built") and ok
+
+    json_path = output_dir / "mappings.json"
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(list(index.mappings()), f, ensure_ascii=False)
+    start = time.perf_counter()
+    with open(json_path, encoding="utf-8") as f:
+        json.load(f)
+    json_seconds = time.perf_counter() - start
+
+    index_path = index.save(output_dir / f"{riwaya_key}.qudrel")
+    start = time.perf_counter()
+    loaded = RelationshipIndex.load(index_path)
+    load_seconds = time.perf_counter() - start
+    print(f"  JSON mappings   {json_path.stat().st_size / 1024 ** 2:>7.1f} MB, "
+          f"parse {json_seconds:.2f}s")
+    print(f"  saved index     {index_path.stat().st_size / 1024 ** 2:>7.1f} MB, "
+          f"load {load_seconds:.2f}s (adjacency rebuilt)")
+
+    ok = check_traversals(loaded, words, "loaded") and ok
+    sample = [m["mapping_id"] for m in index.mappings()][::101]
+    if any(loaded.get(mapping_id) != index.get(mapping_id) for mapping_id in sample):
+        print("ERROR: loaded mappings differ from the built index")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", default="hafs", choices=sorted(RIWAYAT),
+        help="Riwaya to index (default: hafs)",
+    )
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.exit(main(args.riwaya, Path(tmp)))
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading each QS-QIRAAT source format into typed records.
+
+For every riwaya, each shipped format (json, csv, txt, sql, xml) is parsed
+with format_loader and the best-of-N wall time is reported, along with the
+fastest format. With --check, every format is also cross-checked against
+the JSON records and the script exits non-zero on any problem. Each source
+is reported once: a format that fails to parse is not cross-checked again.
+Upstream files known to be unreadable (KNOWN_UNREADABLE) are listed
+separately and do not fail the check.
+
+Usage:
+    python scripts/benchmark_source_formats.py
+    python scripts/benchmark_source_formats.py --repeat 5 --check
+    python scripts/benchmark_source_formats.py --riwaya hafs --riwaya warsh
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from analyzers.performance_metrics import PerformanceAnalyzer
+from format_loader import SOURCE_FORMATS, cross_check, find_sources, load_typed_records
+
+from generate_mushafs_metadata import RIWAYAT, find_json_file
+
+# (riwaya, format) -> why the shipped upstream file cannot be parsed
+KNOWN_UNREADABLE = {
+    ("qaloun", "sql"): "INSERT lines 43-53 of the upstream dump are not valid UTF-8",
+}
+
+
+def benchmark_riwaya(analyzer: PerformanceAnalyzer, riwaya_key: str, repeat: int) -> dict:
+    """
+    Time every available format of one riwaya.
+
+    Returns:
+        {format: (best_seconds, record_count)}, or {format: (None, error)} for
+        formats that fail to parse
+    """
+    sources = find_sources(find_json_file(RIWAYAT[riwaya_key]))
+    results = {}
+
+    for fmt, path in sources.items():
+        best = None
+        try:
+            for _ in range(repeat):
+                records, metrics = analyzer.measure_function(
+                    load_typed_records, path, fmt, task_name=f"{riwaya_key}:{fmt}"
+                )
+                metrics.entity_count = len(records)
+                if best is None or metrics.duration_seconds < best:
+                    best = metrics.duration_seconds
+        except ValueError as e:
+            results[fmt] = (None, str(e))
+            continue
+        results[fmt] = (best, len(records))
+
+    return results
+
+
+def main(riwayat: list, repeat: int, check: bool) -> int:
+    analyzer = PerformanceAnalyzer()
+    header = f"{'riwaya':<8}" + "".join(f"{fmt:>10}" for fmt in SOURCE_FORMATS) + "   fastest"
+    print(header)
+    print("-" * len(header))
+
+    problems: Dict[str, str] = {}  # "riwaya:format" -> first problem found
+    known: List[str] = []
+    readable: Dict[str, List[str]] = {}
+    for key in riwayat:
+        results = benchmark_riwaya(analyzer, key, repeat)
+
+        cells = []
+        for fmt in SOURCE_FORMATS:
+            seconds, detail = results.get(fmt, (None, "missing"))
+            if seconds is not None:
+                cells.append(f"{seconds * 1000:>8.1f}ms")
+            elif (key, fmt) in KNOWN_UNREADABLE:
+                cells.append(f"{'known':>10}")
+                known.append(f"{key}:{fmt}: {KNOWN_UNREADABLE[(key, fmt)]}")
+            else:
+                cells.append(f"{'error':>10}")
+                problems[f"{key}:{fmt}"] = detail
+        readable[key] = [fmt for fmt, (seconds, _) in results.items() if seconds is not None]
+
+        timed = {fmt: r[0] for fmt, r in results.items() if r[0] is not None}
+        fastest = min(timed, key=timed.get) if timed else "-"
+        print(f"{key:<8}" + "".join(cells) + f"   {fastest}")
+
+    if check:
+        print("\nCross-format check (reference: json)")
+        for key in riwayat:
+            sources = find_sources(find_json_file(RIWAYAT[key]))
+            report = cross_check({fmt: sources[fmt] for fmt in readable[key]})
+            for fmt, differences in report.items():
+                status = "OK" if not differences else f"{len(differences)} difference(s)"
+                print(f"  {key + ':' + fmt:<14}{status}")
+                for line in differences:
+                    print(f"      {line}")
+                if differences:
+                    problems[f"{key}:{fmt}"] = differences[0]
+
+    if known:
+        print("\nKnown unreadable upstream sources (not counted):")
+        for line in known:
+            print(f"  {line}")
+    if problems:
+        print(f"\n{len(problems)} source(s) with problems:")
+        for source, detail in problems.items():
+            print(f"  {source}: {detail}")
+    return 1 if problems and check else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", action="append", choices=sorted(RIWAYAT),
+        help="Riwaya to benchmark (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="Runs per format; the best time is reported",
+    )
+    parser.add_argument(
+        "--check", action="store_true",
+        help="Cross-check every format against JSON and exit non-zero on differences",
+    )
+    args = parser.parse_args()
+    sys.exit(main(args.riwaya or list(RIWAYAT), max(args.repeat, 1), args.check))
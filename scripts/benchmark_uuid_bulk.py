@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark bulk vs per-call UUID generation for a full riwaya char layer.
+
+Character coordinates (surah, verse, word, char) are derived from aya_text:
+words split on spaces, base letters (non-combining code points) counted per
+word. IDs are generated once with char_id() per coordinate, once by
+hashing every full name string ("flat", the bulk path before
+HierarchicalIDBuilder), once with char_ids() for the whole batch and once
+with char_ids(binary=True), and the results are checked to be identical.
+The memory held by the string IDs and by the packed 16-byte array is
+reported.
+
+Usage:
+    python scripts/benchmark_uuid_bulk.py
+    python scripts/benchmark_uuid_bulk.py --riwaya warsh --repeat 5
+"""
+
+import argparse
+import sys
+import unicodedata
+from pathlib import Path
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from analyzers.performance_metrics import PerformanceAnalyzer
+from generators import uuid_generator
+from quran_loader import QuranLoader
+from riwaya_corpus import strip_aya_marker
+
+from generate_mushafs_metadata import RIWAYAT, find_json_file
+
+CHAR_FIELDS = ("surah", "verse", "word", "char")
+
+
+def char_coordinates(ayat: list) -> list:
+    """Derive (surah, verse, word, char) for every base letter."""
+    coordinates = []
+    for ayah in ayat:
+        surah, verse = ayah["sura_no"], ayah["aya_no"]
+        for w, word in enumerate(strip_aya_marker(ayah["aya_text"]).split(), 1):
+            letters = sum(1 for ch in word if not unicodedata.combining(ch))
+            coordinates.extend((surah, verse, w, c) for c in range(1, letters + 1))
+    return coordinates
+
+
+def main(riwaya_key: str, repeat: int) -> int:
+    analyzer = PerformanceAnalyzer()
+    ayat = QuranLoader().load_json(find_json_file(RIWAYAT[riwaya_key]))
+    coordinates = char_coordinates(ayat)
+    count = len(coordinates)
+
+    best = {}
+    results = {}
+    for _ in range(repeat):
+        results["per-call"], metrics = analyzer.measure_function(
+            lambda: [uuid_generator.char_id(riwaya_key, *ref) for ref in coordinates],
+            task_name=f"{riwaya_key} char_id x{count:,}"
+        )
+        best["per-call"] = min(best.get("per-call", metrics.duration_seconds),
+                               metrics.duration_seconds)
+
+        results["flat"], metrics = analyzer.measure_function(
+            lambda: uuid_generator._generate_many(
+                f"{riwaya_key}:s{s}:v{v}:w{w}:c{c}"
+                for s, v, w, c in uuid_generator._validate_batch(coordinates, CHAR_FIELDS)
+            ),
+            task_name=f"{riwaya_key} full-name hashing x{count:,}"
+        )
+        best["flat"] = min(best.get("flat", metrics.duration_seconds), metrics.duration_seconds)
+
+        results["bulk"], metrics = analyzer.measure_function(
+            uuid_generator.char_ids, riwaya_key, coordinates,
+            task_name=f"{riwaya_key} char_ids({count:,})"
+        )
+        best["bulk"] = min(best.get("bulk", metrics.duration_seconds), metrics.duration_seconds)
+
+        results["binary"], metrics = analyzer.measure_function(
+            uuid_generator.char_ids, riwaya_key, coordinates, binary=True,
+            task_name=f"{riwaya_key} char_ids({count:,}, binary=True)"
+        )
+        best["binary"] = min(best.get("binary", metrics.duration_seconds),
+                             metrics.duration_seconds)
+
+    if not results["per-call"] == results["flat"] == results["bulk"]:
+        print("ERROR: bulk IDs differ from per-call IDs")
+        return 1
+    packed = uuid_generator.pack_ids(results["binary"])
+    if uuid_generator.unpack_ids(packed) != results["bulk"]:
+        print("ERROR: binary IDs differ from string IDs")
+        return 1
+
+    print(f"{riwaya_key}: {count:,} characters (best of {repeat})")
+    for path, seconds in best.items():
+        print(f"  {path:<9}{seconds:>8.3f}s  {count / seconds:>12,.0f} ids/s")
+    print(f"  speedup  {best['per-call'] / best['bulk']:>8.1f}x vs per-call, "
+          f"{best['flat'] / best['bulk']:.2f}x vs flat")
+
+    string_bytes = sum(sys.getsizeof(value) for value in results["bulk"])
+    print(f"  ID memory: strings {string_bytes / 1e6:.1f} MB, "
+          f"packed {len(packed) / 1e6:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", default="hafs", choices=sorted(RIWAYAT),
+        help="Riwaya to benchmark (default: hafs)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="Runs per path; the best time is reported",
+    )
+    args = parser.parse_args()
+    sys.exit(main(args.riwaya, max(args.repeat, 1)))
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Build memory-mapped UUID lookup tables for every QS-QIRAAT riwaya.
+
+For each riwaya, verse counts, word counts (per whole ayah, aya marker
+excluded) and line counts per page are read from the merged whole-ayah
+corpus, and generators.uuid_tables writes verse/word/juz/hizb/rub/page/line
+tables to OUTPUT_DIR/<narration>. IDs are minted with the canonical
+narration name of each riwaya (uuid_generator.KNOWN_NARRATIONS, e.g.
+"qalun" for the "qaloun" riwaya). A sample of IDs is checked against
+uuid_generator.
+
+Usage:
+    python scripts/build_uuid_tables.py
+    python scripts/build_uuid_tables.py --riwaya hafs --output /tmp/uuid-tables
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+OUTPUT_DIR = SCRIPT_DIR.parent / ".cache" / "uuid-tables"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from generators import uuid_generator
+from generators.uuid_tables import SURAH_COUNT, UUIDTables
+
+from generate_mushafs_metadata import RIWAYAT, count_words, load_riwaya_ayat
+
+DEFAULT_EDITION = "kfgqpc_v2"
+
+# Riwaya keys whose canonical narration name is spelled differently
+NARRATION_NAMES = {"qaloun": "qalun"}
+
+
+def narration_name(riwaya_key: str) -> str:
+    """
+    Canonical narration name of a riwaya, as used in UUID names.
+
+    Raises:
+        ValueError: If the riwaya has no name in KNOWN_NARRATIONS
+    """
+    narration = NARRATION_NAMES.get(riwaya_key, riwaya_key)
+    if narration not in uuid_generator.KNOWN_NARRATIONS:
+        raise ValueError(f"{riwaya_key}: no known narration name")
+    return narration
+
+
+def page_line_counts(corpus) -> list:
+    """
+    Lines per page from the page and line span of each aya.
+
+    A page holds lines up to the last one an aya occupies there. When an
+    aya runs on to the next page, its line_start is only where it begins,
+    so such a page is counted as full (the longest page of the corpus).
+
+    Raises:
+        ValueError: If some page holds no aya
+    """
+    pages = np.asarray(corpus["page"])
+    page_end = np.asarray(corpus["page_end"])
+    last_line = np.zeros(int(np.max(page_end)) + 1, dtype=np.int64)
+    np.maximum.at(last_line, pages, np.asarray(corpus["line_start"]))
+    np.maximum.at(last_line, page_end, np.asarray(corpus["line_end"]))
+    last_line[pages[pages != page_end]] = last_line.max()
+
+    line_counts = last_line[1:]
+    if not line_counts.all():
+        missing = (np.flatnonzero(line_counts == 0) + 1).tolist()
+        raise ValueError(f"pages without ayat: {missing}")
+    return line_counts.tolist()
+
+
+def riwaya_counts(riwaya_key: str) -> dict:
+    """
+    Read the coordinate space of a riwaya from its whole-ayah corpus.
+
+    Returns:
+        {"verse_counts": [...114], "word_counts": [...], "line_counts": [...]}
+
+    Raises:
+        ValueError: If ayat are not numbered 1..n within each surah
+    """
+    corpus = load_riwaya_ayat(riwaya_key)
+    sura_no = np.asarray(corpus["sura_no"])
+    aya_no = np.asarray(corpus["aya_no"])
+
+    verse_counts = np.bincount(sura_no, minlength=SURAH_COUNT + 1)[1:]
+    expected = np.concatenate([np.arange(1, n + 1) for n in verse_counts])
+    if len(verse_counts) != SURAH_COUNT or not np.array_equal(aya_no, expected):
+        raise ValueError(f"{riwaya_key}: ayat are not numbered 1..n within each surah")
+
+    return {
+        "verse_counts": verse_counts.tolist(),
+        "word_counts": [count_words(text) for text in corpus["aya_text"]],
+        "line_counts": page_line_counts(corpus),
+    }
+
+
+def check_sample(tables: UUIDTables, narration: str, edition: str, size: int = 200):
+    """Compare a random sample of table IDs with uuid_generator."""
+    rng = random.Random(0)
+    checks = {
+        "verse": uuid_generator.verse_id,
+        "word": uuid_generator.word_id,
+        "juz": uuid_generator.juz_id,
+        "hizb": uuid_generator.hizb_id,
+        "rub": uuid_generator.rub_id,
+        "page": lambda n, p: uuid_generator.page_id(n, edition, p),
+        "line": lambda n, p, ln: uuid_generator.line_id(n, edition, p, ln),
+    }
+    for entity, expected_id in checks.items():
+        table = tables[entity]
+        for index in rng.sample(range(len(table)), min(size, len(table))):
+            coordinate = table.coordinate_of(index)
+            expected = expected_id(narration, *coordinate)
+            if table.id(*coordinate) != expected or table.coordinate(expected) != coordinate:
+                raise SystemExit(f"{narration}:{entity}{coordinate} does not match uuid_generator")
+
+
+def main(riwayat: list, output_dir: Path, edition: str):
+    for key in riwayat:
+        narration = narration_name(key)
+        counts = riwaya_counts(key)
+        directory = UUIDTables.build(output_dir, narration, edition=edition, **counts)
+        tables = UUIDTables.open(output_dir, narration)
+        check_sample(tables, narration, edition)
+
+        sizes = ", ".join(f"{entity} {n:,}" for entity, n in tables.manifest["counts"].items())
+        print(f"{key}: {sizes} -> {directory}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", action="append", choices=sorted(RIWAYAT),
+        help="Riwaya to build (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=OUTPUT_DIR,
+        help=f"Output directory (default: {OUTPUT_DIR})",
+    )
+    parser.add_argument(
+        "--edition", default=DEFAULT_EDITION,
+        help=f"Edition name for page/line IDs (default: {DEFAULT_EDITION})",
+    )
+    args = parser.parse_args()
+    main(args.riwaya or list(RIWAYAT), args.output, args.edition)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Round-trip check and benchmark for the binary layer container.
+
+CHR (character composition) and WRD (word structure) entities are built
+for a riwaya following schemas/chr-character-composition and
+schemas/wrd-word-structure, saved both as JSON (LayerGenerator.save) and
+as a layer container (LayerGenerator.save_container), and checked:
+- the container decodes to exactly the entities in the JSON file
+- per-surah and per-verse reads match the corresponding JSON slices
+- decoded entities validate against the layer schema (needs jsonschema)
+File sizes, full-load times and single-surah fetch times are reported.
+
+Usage:
+    python scripts/check_layer_container.py
+    python scripts/check_layer_container.py --riwaya warsh --surah 18
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Project paths
+SCRIPT_DIR = Path(__file__).parent
+RESEARCH_TOOLS = SCRIPT_DIR.parent / "research-tools"
+SCHEMAS = SCRIPT_DIR.parent / "schemas"
+
+# Add research-tools packages to path
+sys.path.insert(0, str(RESEARCH_TOOLS))
+sys.path.insert(0, str(RESEARCH_TOOLS / "data-loaders"))
+
+from generators.layer_container import LayerContainer
+from generators.layer_generator import LayerGenerator
+from generators.uuid_generator import HierarchicalIDBuilder, narration_id, verse_id
+from riwaya_corpus import strip_aya_marker
+from validators.schema_validator import SchemaValidator
+
+from generate_mushafs_metadata import RIWAYAT, load_riwaya_ayat
+
+# Base letter -> CHR phonetic_class (everything else is "consonant")
+PHONETIC_CLASSES = {
+    **dict.fromkeys("ءأإؤئ", "hamza"),
+    **dict.fromkeys("اٱآ", "alif"),
+    "و": "waw", "ي": "ya", "ى": "ya", "ن": "noon", "م": "meem", "ل": "lam", "ر": "ra",
+    **dict.fromkeys("قطبجد", "qalqalah"),
+}
+
+# Base letters of CHR entities (schema pattern ^[\u0600-\u06FF]$)
+ARABIC_BLOCK = ("\u0600", "\u06ff")
+
+LAYER_SCHEMAS = {
+    "character-composition": "chr-character-composition",
+    "word-structure": "wrd-word-structure",
+}
+
+
+class SavedLayer(LayerGenerator):
+    """Holds prebuilt entities so they can be saved in both formats."""
+
+    def generate(self, source_data: Any, context: Dict[str, str]) -> Dict[str, Any]:
+        return {"entities": source_data}
+
+    def validate(self, layer_data: Dict[str, Any]) -> bool:
+        return bool(layer_data["entities"])
+
+    def get_dependencies(self) -> List[str]:
+        return []
+
+
+def build_entities(riwaya_key: str) -> Tuple[List[Dict], List[Dict], Dict[str, Tuple]]:
+    """
+    Build CHR and WRD entities for a riwaya.
+
+    Returns:
+        (characters, words, verse UUID -> (surah, verse))
+    """
+    corpus = load_riwaya_ayat(riwaya_key)
+    ids = HierarchicalIDBuilder(riwaya_key)
+    narration_ref = narration_id(riwaya_key)
+    characters, words, verses = [], [], {}
+
+    for s, a, text in zip(corpus["sura_no"], corpus["aya_no"], corpus["aya_text"]):
+        surah, verse = int(s), int(a)
+        verse_ref = verse_id(riwaya_key, surah, verse)
+        verses[verse_ref] = (surah, verse)
+        position = 0
+        for w, word in enumerate(strip_aya_marker(text).split(), 1):
+            base = [ch for ch in word if not unicodedata.combining(ch)]
+            if not base or not all(ARABIC_BLOCK[0] <= ch <= ARABIC_BLOCK[1] for ch in base):
+                continue  # Aya marker glyph left by strip_aya_marker (plain space before it)
+            word_ref = ids.word_id(surah, verse, w)
+            char_ids = ids.char_ids([(surah, verse, w, c) for c in range(1, len(base) + 1)])
+            words.append({
+                "word_id": word_ref,
+                "verse_ref": verse_ref,
+                "word_position": w - 1,
+                "character_range": [position, position + len(base) - 1],
+                "character_refs": char_ids,
+            })
+            for char_id, letter in zip(char_ids, base):
+                character = {
+                    "character_id": char_id,
+                    "narration_ref": narration_ref,
+                    "verse_ref": verse_ref,
+                    "position": position,
+                    "base_letter": letter,
+                    "phonetic_class": PHONETIC_CLASSES.get(letter, "consonant"),
+                    "orthography_type": "uthmani",
+                    "word_ref": word_ref,
+                }
+                if letter in "قطبجد":  # Optional field on some entities only
+                    character["tajweed_class"] = "qalqalah"
+                characters.append(character)
+                position += 1
+    return characters, words, verses
+
+
+def schema_errors(validator: SchemaValidator, schema_dir: str, entities: List[Dict]) -> int:
+    """Validate entities against a layer schema; returns the number of failures."""
+    schema = validator.load_schema(Path(schema_dir) / "schema.json")
+    failures = 0
+    for entity in entities:
+        valid, _ = validator.validate_json_schema(entity, schema, strict=False)
+        failures += not valid
+    return failures
+
+
+def check_layer(
+    name: str,
+    number: int,
+    entities: List[Dict],
+    verses: Dict[str, Tuple],
+    surah: int,
+    output_dir: Path,
+    validator: SchemaValidator
+) -> bool:
+    generator = SavedLayer(name, number, output_dir)
+    coordinates = lambda entity: verses[entity["verse_ref"]]  # noqa: E731
+    layer_data = generator.generate(entities, {})
+
+    json_path = generator.save(layer_data)
+    container_path = generator.save_container(layer_data, coordinates)
+    raw_path = generator.save_container(layer_data, coordinates, f"{name}-raw.qudl", "none")
+
+    start = time.perf_counter()
+    with open(json_path, encoding="utf-8") as f:
+        expected = json.load(f)["data"]["entities"]
+    json_seconds = time.perf_counter() - start
+
+    ok = True
+    with LayerContainer(container_path) as layer:
+        start = time.perf_counter()
+        decoded = layer.to_layer_data()["entities"]
+        load_seconds = time.perf_counter() - start
+        if decoded != expected:
+            print(f"ERROR: {name}: container differs from JSON")
+            ok = False
+
+    with LayerContainer(container_path) as layer:  # Fresh open: nothing decoded yet
+        start = time.perf_counter()
+        one_surah = layer.read_surah(surah)
+        surah_seconds = time.perf_counter() - start
+        verse = layer.verses(surah)[-1]
+        one_verse = layer.read_verse(surah, verse)
+
+    if one_surah != [e for e in expected if coordinates(e)[0] == surah] or \
+            one_verse != [e for e in expected if coordinates(e) == (surah, verse)]:
+        print(f"ERROR: {name}: surah {surah} reads differ from JSON")
+        ok = False
+
+    with LayerContainer(raw_path) as layer:
+        if layer.to_layer_data()["entities"] != expected:
+            print(f"ERROR: {name}: uncompressed container differs from JSON")
+            ok = False
+
+    try:
+        failures = schema_errors(validator, LAYER_SCHEMAS[name], decoded)
+        schema_status = "valid" if not failures else f"{failures} invalid"
+        ok = ok and not failures
+    except ImportError:
+        schema_status = "skipped (jsonschema not installed)"
+
+    mb = 1024 * 1024
+    print(f"{name}: {len(entities):,} entities, schema {schema_status}")
+    print(f"  json        {json_path.stat().st_size / mb:>8.1f} MB  load {json_seconds:.2f}s")
+    print(f"  container   {container_path.stat().st_size / mb:>8.1f} MB  load {load_seconds:.2f}s"
+          f"  surah {surah} {surah_seconds * 1000:.1f} ms ({len(one_surah):,} entities)")
+    print(f"  (no zlib)   {raw_path.stat().st_size / mb:>8.1f} MB")
+    return ok
+
+
+def main(riwaya_key: str, surah: int, output_dir: Path) -> int:
+    characters, words, verses = build_entities(riwaya_key)
+    validator = SchemaValidator(SCHEMAS)
+    ok = check_layer("character-composition", 0, characters, verses, surah, output_dir,
+                     validator)
+    ok = check_layer("word-structure", 3, words, verses, surah, output_dir, validator) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--riwaya", default="hafs", choices=sorted(RIWAYAT),
+        help="Riwaya to build (default: hafs)",
+    )
+    parser.add_argument(
+        "--surah", type=int, default=2,
+        help="Surah fetched for the random access timing (default: 2)",
+    )
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.exit(main(args.riwaya, args.surah, Path(tmp)))
@@ -5,17 +5,34 @@ Generate mushafs-metadata.json from QS-QIRAAT datasets.
 Outputs:
 - verse_counts: surah_no -> {riwaya: count}
 - word_counts: "surah:verse" -> {riwaya: count, or 0 if missing}
+
+Usage:
+    python scripts/generate_mushafs_metadata.py            # sequential
+    python scripts/generate_mushafs_metadata.py --jobs 0   # one worker process per core
+
+Parallel runs produce byte-identical output to sequential runs.
 """
 
+import argparse
 import json
+import os
+import sys
 from pathlib import Path
 from datetime import date
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 # Project paths
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "data" / "QS - QIRAAT"
 OUTPUT_FILE = SCRIPT_DIR.parent / "data" / "mushafs-metadata.json"
+CACHE_DIR = SCRIPT_DIR.parent / ".cache" / "qs-qiraat"
+
+# Add research-tools data loaders to path
+sys.path.insert(0, str(SCRIPT_DIR.parent / "research-tools" / "data-loaders"))
+
+from quran_loader import QuranLoader
+from riwaya_corpus import strip_aya_marker
 
 # Riwaya folder mappings
 RIWAYAT = {
@@ -39,28 +56,78 @@ def find_json_file(riwaya_folder: str) -> Path:
     raise FileNotFoundError(f"No JSON file found in {folder}")
 
 
-def clean_aya_text(text: str) -> str:
-    """Remove trailing NBSP + aya marker glyph."""
-    if len(text) >= 2 and text[-2] == "\xa0":
-        return text[:-2]
-    return text
-
-
 def count_words(text: str) -> int:
     """Count words in cleaned aya text."""
-    cleaned = clean_aya_text(text)
+    cleaned = strip_aya_marker(text)
     words = cleaned.split()
     return len(words)
 
 
-def load_riwaya_data(riwaya_key: str) -> list[dict]:
-    """Load JSON data for a riwaya."""
+def load_riwaya_ayat(riwaya_key: str):
+    """Load a riwaya as whole-ayah records (page-split ayat already merged)."""
     json_file = find_json_file(RIWAYAT[riwaya_key])
-    with open(json_file, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return QuranLoader(cache_dir=CACHE_DIR).load_whole_ayat(json_file)
+
 
+def collect_riwaya(riwaya_key: str) -> dict:
+    """
+    Load one riwaya and reduce it to compact per-riwaya counts.
+
+    Runs in a worker process in parallel mode, so it returns plain lists
+    instead of the loaded corpus.
+
+    Returns:
+        {"surah_names": {sura_no: {...}}, "sura_no": [...], "aya_no": [...], "word_counts": [...]}
+    """
+    ayat = load_riwaya_ayat(riwaya_key)
+
+    surah_names = {
+        sura_no: {"name_ar": names["sura_name_ar"], "name_en": names["sura_name_en"]}
+        for sura_no, names in ayat.surah_names.items()
+    }
+
+    return {
+        "surah_names": surah_names,
+        "sura_no": ayat["sura_no"].tolist(),
+        "aya_no": ayat["aya_no"].tolist(),
+        "word_counts": [count_words(aya_text) for aya_text in ayat["aya_text"]],
+    }
 
-def main():
+
+def collect_all(jobs: int = 1) -> dict:
+    """
+    Collect per-riwaya results, sequentially or in a process pool.
+
+    Results are returned in RIWAYAT order either way, so merging them
+    produces the same output regardless of the number of jobs.
+
+    Raises:
+        ValueError: If jobs is below 1
+    """
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+    if jobs == 1:
+        results = {}
+        for riwaya_key in RIWAYAT:
+            print(f"  Processing {riwaya_key}...")
+            results[riwaya_key] = collect_riwaya(riwaya_key)
+        return results
+
+    workers = min(jobs, len(RIWAYAT))
+    print(f"  Processing {len(RIWAYAT)} riwayat with {workers} workers...")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(RIWAYAT, executor.map(collect_riwaya, RIWAYAT)))
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for --jobs: an integer of 0 or more."""
+    jobs = int(value)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {jobs}")
+    return jobs
+
+
+def main(jobs: int = 1):
     print("Generating mushafs-metadata.json...")
 
     # Collect all surah names (from any riwaya, they should be the same)
@@ -75,44 +142,23 @@ def main():
     # Track all surah:verse combinations across all riwayat
     all_verses = set()
 
+    results = collect_all(jobs)
+
     for riwaya_key in RIWAYAT:
-        print(f"  Processing {riwaya_key}...")
-        data = load_riwaya_data(riwaya_key)
-
-        # Group by surah
-        surah_verses = defaultdict(dict)  # surah_no -> {aya_no: aya_text}
-
-        for item in data:
-            sura_no = item["sura_no"]
-            aya_no = item["aya_no"]
-            aya_text = item["aya_text"]
-
-            # Store surah names (once)
-            if sura_no not in surah_names:
-                surah_names[sura_no] = {
-                    "name_ar": item["sura_name_ar"],
-                    "name_en": item["sura_name_en"],
-                }
-
-            # Store verse (overwrite if duplicate due to page splits)
-            # We want the full verse, so concatenate if split across pages
-            if aya_no in surah_verses[sura_no]:
-                # Concatenate text (remove trailing marker from first part)
-                existing = clean_aya_text(surah_verses[sura_no][aya_no])
-                new_part = clean_aya_text(aya_text)
-                surah_verses[sura_no][aya_no] = existing + " " + new_part
-            else:
-                surah_verses[sura_no][aya_no] = aya_text
-
-            all_verses.add(f"{sura_no}:{aya_no}")
-
-        # Calculate counts
-        for sura_no, verses in surah_verses.items():
-            verse_counts[str(sura_no)][riwaya_key] = len(verses)
-
-            for aya_no, aya_text in verses.items():
-                key = f"{sura_no}:{aya_no}"
-                word_counts[key][riwaya_key] = count_words(aya_text)
+        result = results[riwaya_key]
+
+        # Store surah names (first riwaya wins)
+        for sura_no, names in result["surah_names"].items():
+            surah_names.setdefault(sura_no, names)
+
+        for sura_no, aya_no, count in zip(
+            result["sura_no"], result["aya_no"], result["word_counts"]
+        ):
+            key = f"{sura_no}:{aya_no}"
+            surah_counts = verse_counts[str(sura_no)]
+            surah_counts[riwaya_key] = surah_counts.get(riwaya_key, 0) + 1
+            word_counts[key][riwaya_key] = count
+            all_verses.add(key)
 
     # Fill in 0 for missing verses in any riwaya
     for verse_key in all_verses:
@@ -155,4 +201,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-j", "--jobs", type=non_negative_int, default=1,
+        help="Worker processes for riwaya ingestion (1 = sequential, 0 = all cores)",
+    )
+    args = parser.parse_args()
+    main(jobs=args.jobs or os.cpu_count() or 1)
@@ -0,0 +1,10 @@
+"""Make research-tools and the scripts importable the way the scripts do."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+RESEARCH_TOOLS = ROOT / "research-tools"
+
+for path in (ROOT / "scripts", RESEARCH_TOOLS / "data-loaders", RESEARCH_TOOLS):
+    sys.path.insert(0, str(path))
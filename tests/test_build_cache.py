@@ -0,0 +1,72 @@
+"""Build cache keys: source files, key sources and the generator code version."""
+
+import inspect
+from typing import Any, Dict, List
+
+import pytest
+
+from generators.build_cache import BuildCache, code_version
+from generators.layer_generator import LayerGenerator
+from orchestration.layer_scheduler import LayerScheduler
+
+CONTEXT = {"qiraat": "asim", "narration": "hafs", "edition": None}
+
+
+class LineCountLayer(LayerGenerator):
+    """Lines of a text file, using the default single partition."""
+
+    def __init__(self):
+        super().__init__("line-counts", 0)
+
+    def generate(self, source_data: Any, context: Dict[str, str]) -> Dict[str, Any]:
+        with open(source_data, encoding="utf-8") as f:
+            return {"entities": [{"line": line.rstrip("\n")} for line in f]}
+
+    def validate(self, layer_data: Dict[str, Any]) -> bool:
+        return True
+
+    def get_dependencies(self) -> List[str]:
+        return []
+
+
+def test_edited_source_file_is_rebuilt(tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_text("a\nb\n", encoding="utf-8")
+    cache = BuildCache(tmp_path / "cache")
+    layer = LineCountLayer()
+
+    assert cache.build(layer, str(source), CONTEXT).rebuilt == ["all"]
+    assert cache.build(layer, str(source), CONTEXT).reused == ["all"]
+
+    source.write_text("a\nc\n", encoding="utf-8")  # Same size, new content
+    result = cache.build(layer, str(source), CONTEXT)
+    assert result.rebuilt == ["all"]
+    assert result.layer_data == {"entities": [{"line": "a"}, {"line": "c"}]}
+
+
+def test_key_sources_need_their_own_partitions(tmp_path):
+    cache = BuildCache(tmp_path / "cache")
+    with pytest.raises(ValueError, match="not a file"):
+        cache.build(LineCountLayer(), "hafs", CONTEXT)
+
+    scheduler = LayerScheduler(executor="serial", cache=cache)
+    scheduler.register(LineCountLayer())
+    with pytest.raises(ValueError, match="override partitions"):
+        scheduler.run_one("hafs", CONTEXT)
+
+
+def test_code_version_covers_base_class_modules(monkeypatch):
+    import generators.layer_generator as base_module
+
+    before = code_version(LineCountLayer())
+    getsource = inspect.getsource
+    monkeypatch.setattr(inspect, "getsource", lambda obj: getsource(obj) + (
+        "# edited\n" if obj is base_module else ""
+    ))
+    assert code_version(LineCountLayer()) != before
+
+
+def test_explicit_code_version_is_used():
+    layer = LineCountLayer()
+    layer.code_version = "7"
+    assert code_version(layer) == "7"
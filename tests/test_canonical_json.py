@@ -0,0 +1,79 @@
+"""Canonical JSON output against json.dumps, with and without the C encoder."""
+
+import hashlib
+import json
+import math
+import uuid
+
+import pytest
+
+import generators.canonical_json as canonical_json
+from generators.canonical_json import STREAM_THRESHOLD, CanonicalEncoder
+from generators.uuid_generator import json_default
+
+LARGE = STREAM_THRESHOLD + 5
+
+NESTED = {"b": 1, "a": {"d": [1.5, "ي"], "c": None}, "": 0}
+
+VALUES = [
+    "بِسْمِ ٱللَّهِ", "quote \" backslash \\ newline \n tab \t \x00   \U0001f600",
+    0, -1, 2 ** 70, True, False, None,
+    0.1, -0.0, 1.0, 1e-7, 1e22, 1.7976931348623157e308, float("inf"), float("-inf"),
+    [], {}, (), [1, "a", None], (1, 2),
+    NESTED,
+    {3: "int", 1: "one", 2: "two"}, {True: "t", False: "f"}, {1.5: "x", 0.25: "y"},
+    {None: 1},
+    {"nested": [{"z": [[[]]], "y": {"x": [{"w": 1}]}}] * 3},
+    {"uuid": uuid.UUID(int=7).bytes, "tuple": (1, (2, 3))},
+    list(range(LARGE)),
+    {"entities": [{"id": i, "text": "ن" * i, "score": i / 7} for i in range(LARGE)]},
+    {f"k{i}": [i] * LARGE for i in range(LARGE)},
+    {i: "int keys" for i in range(LARGE)},
+    [{"a": list(range(LARGE))}, list(range(LARGE)), (LARGE, "tuple")],
+]
+
+
+def dumps(value):
+    return json.dumps(
+        value, sort_keys=True, ensure_ascii=False, separators=(", ", ": "), default=json_default
+    )
+
+
+@pytest.fixture(params=["c", "python"])
+def encoder(request, monkeypatch):
+    if request.param == "c":
+        if canonical_json.c_make_encoder is None:
+            pytest.skip("json C accelerator not available")
+    else:
+        monkeypatch.setattr(canonical_json, "c_make_encoder", None)
+    return CanonicalEncoder()
+
+
+@pytest.mark.parametrize("value", VALUES, ids=range(len(VALUES)))
+def test_output_matches_json_dumps(encoder, value):
+    expected = dumps(value)
+    assert encoder.encode(value) == expected
+    assert "".join(encoder.iterencode(value)) == expected
+
+    digest = hashlib.sha256()
+    encoder.update(digest, value)
+    assert digest.hexdigest() == hashlib.sha256(expected.encode("utf-8")).hexdigest()
+
+
+def test_nan_matches_json_dumps(encoder):
+    assert encoder.encode([math.nan]) == dumps([math.nan]) == "[NaN]"
+
+
+@pytest.mark.parametrize("value", [{1: "a", "b": 2}, {"x": object()}])
+def test_unencodable_values_raise_like_json_dumps(encoder, value):
+    with pytest.raises(TypeError):
+        dumps(value)
+    with pytest.raises(TypeError):
+        encoder.encode(value)
+
+
+def test_module_functions_use_the_shared_encoder():
+    assert canonical_json.canonical_dumps(NESTED) == dumps(NESTED)
+    digest = hashlib.sha256()
+    canonical_json.update_canonical(digest, NESTED)
+    assert digest.digest() == hashlib.sha256(dumps(NESTED).encode("utf-8")).digest()
@@ -0,0 +1,147 @@
+"""Diff backends against a DP LCS, and DataComparator on top of them."""
+
+import difflib
+import random
+
+import pytest
+
+from analyzers.data_comparator import CharacterDiff, DataComparator
+from analyzers.diff_engine import BitParallelDiff, DifflibDiff, get_diff_backend
+
+rng = random.Random(25)
+
+# Short Arabic-like alphabet so random strings share many characters
+ALPHABET = "بتثنَُِْ "
+
+PAIRS = [("", ""), ("", "abc"), ("abc", ""), ("abc", "abc"), ("abcd", "acbd"),
+         ("بِسْمِ ٱللَّهِ", "بسم الله"), ("aaaa", "aa"), ("abcabba", "cbabac")] + [
+    (
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randrange(0, 60))),
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randrange(0, 60))),
+    )
+    for _ in range(150)
+]
+
+
+def lcs_length(a, b):
+    """Textbook O(n*m) dynamic program."""
+    row = [0] * (len(b) + 1)
+    for x in a:
+        previous_diagonal = 0
+        for j, y in enumerate(b, 1):
+            previous_diagonal, row[j] = row[j], (
+                previous_diagonal + 1 if x == y else max(row[j], row[j - 1])
+            )
+    return row[-1]
+
+
+def check_opcodes(opcodes, a, b):
+    """Opcodes must tile both sequences in order and turn a into b."""
+    i = j = 0
+    rebuilt = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        assert tag in ("equal", "replace", "delete", "insert")
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+        rebuilt.append(a[i1:i2] if tag == "equal" else b[j1:j2])
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    assert "".join(rebuilt) == b
+
+
+@pytest.mark.parametrize("a, b", PAIRS)
+def test_bitparallel_diff_is_a_minimal_diff(a, b):
+    result = BitParallelDiff().diff(a, b)
+    check_opcodes(result.opcodes, a, b)
+    assert result.matches == lcs_length(a, b)
+    assert result.matches == sum(i2 - i1 for tag, i1, i2, _, _ in result.opcodes
+                                 if tag == "equal")
+    assert BitParallelDiff().ratio(a, b) == pytest.approx(result.ratio)
+
+
+@pytest.mark.parametrize("cells", [1, 4, 64])
+@pytest.mark.parametrize("a, b", PAIRS[::5])
+def test_split_path_agrees_with_traceback(a, b, cells):
+    split = BitParallelDiff(max_traceback_cells=cells).diff(a, b)
+    check_opcodes(split.opcodes, a, b)
+    assert split.matches == BitParallelDiff().diff(a, b).matches
+
+
+def test_word_sequences_are_diffed_too():
+    a = "bismi allahi alrrahmani alrraheemi".split()
+    b = "bismi allahi alrahmani alraheemi".split()
+    result = BitParallelDiff(max_traceback_cells=1).diff(a, b)
+    assert result.matches == 2
+    assert result.opcodes == [("equal", 0, 2, 0, 2), ("replace", 2, 4, 2, 4)]
+
+
+@pytest.mark.parametrize("a, b", PAIRS[:40])
+def test_difflib_backend_matches_sequence_matcher(a, b):
+    matcher = difflib.SequenceMatcher(None, a, b)
+    result = DifflibDiff().diff(a, b)
+    assert result.opcodes == matcher.get_opcodes()
+    assert result.ratio == matcher.ratio() == DifflibDiff().ratio(a, b)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown diff backend"):
+        get_diff_backend("myers")
+
+
+def baseline_compare_strings(str1, str2, context_window=10):
+    """DataComparator.compare_strings before diff backends (difflib, replace/delete only)."""
+    differences = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, str1, str2).get_opcodes():
+        if tag in ("replace", "delete"):
+            for pos in range(i1, i2):
+                context_start = max(0, pos - context_window)
+                context_end = min(len(str1), pos + context_window + 1)
+                differences.append(CharacterDiff(
+                    pos, str1[pos], str2[pos] if tag == "replace" else "",
+                    str1[context_start:pos], str1[pos + 1:context_end],
+                ))
+    return differences
+
+
+# Substitutions and deletions that keep replaced characters at the same index
+ALIGNED_EDITS = [
+    ("مالك يوم الدين", "مالك يوم الدبن"),
+    ("الصراط المستقيم", "السراط المستقيم"),
+    ("abcdefghij", "abXdefghiY"),
+    ("abcdefghij", "abcdefgh"),
+]
+
+
+@pytest.mark.parametrize("str1, str2", ALIGNED_EDITS)
+def test_difflib_comparator_matches_previous_output(str1, str2):
+    comparator = DataComparator(backend="difflib")
+    assert comparator.compare_strings(str1, str2) == baseline_compare_strings(str1, str2)
+
+    verse = comparator.compare_verses({"text": str1}, {"text": str2})
+    assert verse.similarity_ratio == difflib.SequenceMatcher(None, str1, str2).ratio()
+    assert verse.char_differences == baseline_compare_strings(str1, str2)
+
+
+@pytest.mark.parametrize("backend", ["bitparallel", "difflib"])
+def test_uneven_replace_reports_insertions(backend):
+    comparator = DataComparator(context_window=2, backend=backend)
+    diffs = comparator.compare_strings("axb", "ayzb")
+    assert [(d.position, d.char1, d.char2) for d in diffs] == [(1, "x", "y"), (2, "", "z")]
+    assert (diffs[1].context_before, diffs[1].context_after) == ("ax", "b")
+
+    diffs = comparator.compare_strings("ab", "azb")
+    assert [(d.position, d.char1, d.char2, d.context_after) for d in diffs] == [
+        (1, "", "z", "b")
+    ]
+
+
+@pytest.mark.parametrize("a, b", PAIRS[::3])
+def test_character_diffs_account_for_every_edit(a, b):
+    comparator = DataComparator()
+    result = comparator.backend.diff(a, b)
+    diffs = comparator.compare_strings(a, b)
+    removed = "".join(d.char1 for d in diffs)
+    added = "".join(d.char2 for d in diffs)
+    assert len(removed) == len(a) - result.matches
+    assert len(added) == len(b) - result.matches
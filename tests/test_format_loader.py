@@ -0,0 +1,23 @@
+"""Typed record coercion shared by all source formats."""
+
+from format_loader import coerce_record
+
+
+def test_string_cells_become_ints_and_page_spans_stay_strings():
+    record = coerce_record({"id": "7", "page": "34-35", "sura_no": "2", "aya_text": "x"})
+    assert record == {"id": 7, "page": "34-35", "sura_no": 2, "aya_text": "x"}
+
+
+def test_empty_cells_become_none():
+    record = coerce_record({"id": "7", "page": "", "line_start": " ", "sura_no": None})
+    assert record == {"id": 7, "page": None, "line_start": None, "sura_no": None}
+
+
+def test_json_typed_values_are_kept():
+    raw = {"id": 7, "page": 3}
+    assert coerce_record(raw) == raw
+
+
+def test_non_string_values_pass_through():
+    raw = {"id": 7.0, "page": None, "sura_no": 2.0, "line_start": True}
+    assert coerce_record(raw) == raw
@@ -0,0 +1,21 @@
+"""Import-time budget of research-tools modules (see benchmark_import_time.py)."""
+
+import os
+
+import pytest
+
+from benchmark_import_time import BUDGETS, check, startup_modules
+
+# Multiplies every budget, e.g. QUD_IMPORT_BUDGET_SCALE=2.0 on slow CI machines
+SCALE = float(os.environ.get("QUD_IMPORT_BUDGET_SCALE", "1.0"))
+
+
+@pytest.fixture(scope="module")
+def startup():
+    return startup_modules()
+
+
+@pytest.mark.parametrize("target", list(BUDGETS))
+def test_import_within_budget(target, startup):
+    best, problems = check(target, startup, repeat=3, scale=SCALE)
+    assert problems == [], f"{target}: {best:.1f} ms"
@@ -0,0 +1,75 @@
+"""Layer container round trip against JSON, and schema validation of its entities."""
+
+import json
+
+import pytest
+
+from check_layer_container import LAYER_SCHEMAS, SCHEMAS, SavedLayer, build_entities
+from generators.layer_container import LayerContainer
+from validators.schema_validator import SchemaValidator
+
+# Short and long surahs; 2:286 ends with an aya marker after a plain space
+SURAHS = (1, 2, 108, 112, 113, 114)
+
+LAYERS = [("character-composition", 0), ("word-structure", 3)]
+
+
+@pytest.fixture(scope="module")
+def hafs():
+    characters, words, verses = build_entities("hafs")
+    keep = lambda entity: verses[entity["verse_ref"]][0] in SURAHS  # noqa: E731
+    return {
+        "character-composition": [e for e in characters if keep(e)],
+        "word-structure": [e for e in words if keep(e)],
+        "verses": verses,
+    }
+
+
+@pytest.fixture(scope="module", params=LAYERS, ids=[name for name, _ in LAYERS])
+def saved(request, hafs, tmp_path_factory):
+    """A layer saved as JSON, as a zlib container and as a raw container."""
+    name, number = request.param
+    generator = SavedLayer(name, number, tmp_path_factory.mktemp(name))
+    layer_data = generator.generate(hafs[name], {})
+    coordinates = lambda entity: hafs["verses"][entity["verse_ref"]]  # noqa: E731
+
+    json_path = generator.save(layer_data)
+    with open(json_path, encoding="utf-8") as f:
+        expected = json.load(f)["data"]["entities"]
+    return {
+        "name": name,
+        "expected": expected,
+        "coordinates": coordinates,
+        "container": generator.save_container(layer_data, coordinates),
+        "raw": generator.save_container(layer_data, coordinates, f"{name}-raw.qudl", "none"),
+    }
+
+
+@pytest.mark.parametrize("kind", ["container", "raw"])
+def test_container_decodes_to_json_entities(saved, kind):
+    with LayerContainer(saved[kind]) as layer:
+        assert layer.to_layer_data()["entities"] == saved["expected"]
+        assert layer.surahs == list(SURAHS)
+
+
+@pytest.mark.parametrize("surah", SURAHS)
+def test_surah_and_verse_reads_match_json_slices(saved, surah):
+    coordinates = saved["coordinates"]
+    with LayerContainer(saved["container"]) as layer:
+        assert layer.read_surah(surah) == [
+            e for e in saved["expected"] if coordinates(e)[0] == surah
+        ]
+        for verse in layer.verses(surah)[::7]:
+            assert layer.read_verse(surah, verse) == [
+                e for e in saved["expected"] if coordinates(e) == (surah, verse)
+            ]
+
+
+def test_decoded_entities_validate_with_jsonschema(saved):
+    pytest.importorskip("jsonschema")
+    validator = SchemaValidator(SCHEMAS)
+    schema = validator.load_schema(f"{LAYER_SCHEMAS[saved['name']]}/schema.json")
+    with LayerContainer(saved["container"]) as layer:
+        for entity in layer.to_layer_data()["entities"]:
+            assert validator.validate_json_schema(entity, schema, strict=False) == (True, None)
+
@@ -0,0 +1,34 @@
+"""Rewriting a sharded narration while readers hold its previous manifest."""
+
+import generators.layer_shards as layer_shards
+from generators.layer_shards import ShardedLayer, write_layer_shards
+
+OLD = [{"id": i, "surah": 1 + i // 10, "verse": 1 + i % 10} for i in range(25)]
+NEW = [{**entity, "id": -entity["id"]} for entity in OLD]
+
+
+def coordinates(entity):
+    return entity["surah"], entity["verse"]
+
+
+def test_rewrite_leaves_listed_shards_alone_until_the_manifest_swap(tmp_path, monkeypatch):
+    write_layer_shards(tmp_path, OLD, coordinates, "hafs", max_workers=1)
+    old_layer = ShardedLayer(tmp_path)
+    old_paths = {shard.path for shard in old_layer.shards()}
+
+    write_manifest = layer_shards._write_manifest
+
+    def check_then_write(*args):
+        # New shards are on disk, the manifest is not swapped yet
+        assert old_layer.read() == OLD
+        assert old_layer.verify() == []
+        return write_manifest(*args)
+
+    monkeypatch.setattr(layer_shards, "_write_manifest", check_then_write)
+    write_layer_shards(tmp_path, NEW, coordinates, "hafs", max_workers=1)
+
+    new_layer = ShardedLayer(tmp_path)
+    assert new_layer.read() == NEW
+    assert old_paths.isdisjoint(shard.path for shard in new_layer.shards())
+    assert not any((tmp_path / path).exists() for path in old_paths)
+    assert not list(tmp_path.rglob("*.partial"))
@@ -0,0 +1,110 @@
+"""Trailing metadata checks of streamed layers and JSON Lines shards."""
+
+import json
+
+import pytest
+
+from generators.layer_generator import LayerGenerator, iter_layer_entities, read_layer_metadata
+from generators.build_cache import surah_partitions
+from generators.layer_shards import ShardedLayer, write_layer_shards
+
+
+class ListLayer(LayerGenerator):
+    def generate(self, source_data, context):
+        return {"entities": source_data}
+
+    def validate(self, layer_data):
+        return True
+
+    def get_dependencies(self):
+        return []
+
+
+ENTITIES = [{"id": i, "surah": 1 + i // 10, "verse": 1 + i % 10} for i in range(25)]
+
+
+class SurahLayer(ListLayer):
+    """Partitioned by surah; records which partitions were generated."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.generated = []
+
+    def generate(self, source_data, context):
+        raise AssertionError("a partitioned layer must not be generated whole")
+
+    def partitions(self, source_data, context, dependencies):
+        return surah_partitions(source_data, surah_field="surah")
+
+    def generate_partition(self, partition, context):
+        self.generated.append(partition[0]["surah"])
+        return {"entities": partition}
+
+
+@pytest.fixture
+def stream(tmp_path):
+    generator = ListLayer("test", 0, tmp_path)
+    return generator.save_stream([ENTITIES[:10], ENTITIES[10:]])
+
+
+def rewrite(path, lines):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+
+
+def test_stream_round_trip(stream):
+    assert [e for chunk in iter_layer_entities(stream, chunk_size=7) for e in chunk] == ENTITIES
+    assert read_layer_metadata(stream)["entity_count"] == len(ENTITIES)
+
+
+def test_partitioned_layer_streams_one_partition_at_a_time(tmp_path):
+    generator = SurahLayer("test", 0, tmp_path)
+    chunks = generator.generate_stream(ENTITIES, {}, chunk_size=4)
+    assert next(chunks) == ENTITIES[:4]
+    assert generator.generated == [1]
+    assert [e for chunk in chunks for e in chunk] == ENTITIES[4:]
+    assert generator.generated == [1, 2, 3]
+
+    path = generator.save_stream(generator.generate_stream(ENTITIES, {}, chunk_size=4))
+    assert read_layer_metadata(path)["chunk_count"] == 8  # 10, 10 and 5 entities in chunks of 4
+
+
+def test_unpartitioned_layer_is_generated_whole(tmp_path):
+    generator = ListLayer("test", 0, tmp_path)
+    assert list(generator.generate_stream(ENTITIES, {}, chunk_size=10)) == [
+        ENTITIES[:10], ENTITIES[10:20], ENTITIES[20:]
+    ]
+
+
+def test_truncated_stream_fails_before_yielding(stream):
+    lines = stream.read_text(encoding="utf-8").splitlines()
+    rewrite(stream, lines[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        next(iter_layer_entities(stream, chunk_size=1))
+
+
+def test_entity_with_metadata_field_is_not_the_metadata_line(stream):
+    lines = stream.read_text(encoding="utf-8").splitlines()
+    rewrite(stream, lines[:-1] + [json.dumps({"id": 99, "metadata": {}})])
+    with pytest.raises(ValueError, match="truncated"):
+        next(iter_layer_entities(stream))
+
+
+def test_entity_count_must_match_metadata(stream):
+    lines = stream.read_text(encoding="utf-8").splitlines()
+    rewrite(stream, lines[:5] + lines[-1:])
+    with pytest.raises(ValueError, match="metadata records 25"):
+        list(iter_layer_entities(stream))
+
+
+def test_truncated_shard_is_rejected(tmp_path):
+    coordinates = lambda entity: (entity["surah"], entity["verse"])  # noqa: E731
+    write_layer_shards(tmp_path, ENTITIES, coordinates, "hafs", max_workers=1)
+    layer = ShardedLayer(tmp_path)
+    assert layer.read() == ENTITIES
+
+    shard = layer.shards(surahs=2)[0]
+    path = tmp_path / shard.path
+    lines = path.read_text(encoding="utf-8").splitlines()
+    rewrite(path, lines[:-2] + [json.dumps({"metadata": {"entity_count": len(lines) - 1}})])
+    with pytest.raises(ValueError, match="truncated"):
+        layer.read(surahs=2)
@@ -0,0 +1,48 @@
+"""Lazy subpackage exports."""
+
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+
+import generators
+
+PACKAGES = ["analyzers", "generators", "orchestration", "provenance", "validators"]
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_every_export_resolves(package):
+    module = __import__(package)
+    assert module.__all__ == sorted(module._LAZY_ATTRS)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_type_checking_imports_match_exports(package):
+    module = __import__(package)
+    tree = ast.parse(Path(module.__file__).read_text(encoding="utf-8"))
+    blocks = [node for node in tree.body if isinstance(node, ast.If)
+              and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING"]
+    imported = {
+        alias.asname or alias.name: statement.module or alias.name
+        for block in blocks for statement in block.body
+        for alias in statement.names
+    }
+    assert imported == module._LAZY_ATTRS
+
+
+def test_export_imports_submodule_once_and_caches():
+    value = generators.MerkleTree
+    assert "generators.merkle_tree" in sys.modules
+    assert vars(generators)["MerkleTree"] is value
+    assert generators.uuid_generator is sys.modules["generators.uuid_generator"]
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        generators.missing
+    with pytest.raises(ImportError):
+        from generators import missing  # noqa: F401
@@ -0,0 +1,122 @@
+"""Merkle tree diffs and the binary hash file."""
+
+import pytest
+
+from generators.merkle_tree import (
+    _ALGORITHM_FIELD,
+    _RECORD,
+    MAGIC,
+    MAGIC_V1,
+    MerkleChange,
+    MerkleTree,
+)
+
+AYAT = [
+    (1, 1, "بِسْمِ ٱللَّهِ ٱلرَّحْمَٰنِ ٱلرَّحِيمِ"),
+    (1, 2, "ٱلْحَمْدُ لِلَّهِ رَبِّ ٱلْعَٰلَمِينَ"),
+    (1, 3, "ٱلرَّحْمَٰنِ ٱلرَّحِيمِ"),
+    (2, 1, "الٓمٓ"),
+    (2, 2, "ذَٰلِكَ ٱلْكِتَٰبُ لَا رَيْبَ"),
+]
+
+
+def edited(replace=(), drop=(), extra=()):
+    """AYAT with some verse texts replaced, verses dropped and verses appended."""
+    replace = dict(replace)
+    ayat = [(s, v, replace.get((s, v), text)) for s, v, text in AYAT if (s, v) not in drop]
+    return MerkleTree.from_ayat(ayat + list(extra))
+
+
+@pytest.fixture(scope="module")
+def tree():
+    return MerkleTree.from_ayat(AYAT)
+
+
+def test_equal_data_has_no_changes(tree):
+    assert MerkleTree.from_ayat(reversed(AYAT)).root_hash == tree.root_hash
+    assert tree.diff(MerkleTree.from_ayat(AYAT)).changes == []
+
+
+def test_edited_diacritic_is_one_character(tree):
+    # Kasra -> fatha on the first letter of the second word of 1:2
+    new = edited(replace={(1, 2): "ٱلْحَمْدُ لَلَّهِ رَبِّ ٱلْعَٰلَمِينَ"})
+    assert tree.diff(new).changes == [MerkleChange((1, 2, 2, 1), "changed")]
+    assert tree.diff(new, max_depth=2).changes == [MerkleChange((1, 2), "changed")]
+    assert tree.diff(new, max_depth=2).changes[0].level == "verse"
+
+
+def test_added_and_removed_words(tree):
+    longer = edited(replace={(1, 3): "ٱلرَّحْمَٰنِ ٱلرَّحِيمِ ٱلْمَلِكِ"})
+    assert tree.diff(longer).changes == [MerkleChange((1, 3, 3), "added")]
+    assert longer.diff(tree).changes == [MerkleChange((1, 3, 3), "removed")]
+
+
+def test_added_and_removed_ayat(tree):
+    added = edited(extra=[(2, 3, "ٱلَّذِينَ يُؤْمِنُونَ")])
+    assert tree.diff(added).changes == [MerkleChange((2, 3), "added")]
+    assert added.diff(tree).changes == [MerkleChange((2, 3), "removed")]
+
+    removed = edited(drop={(1, 1)})
+    assert tree.diff(removed).changes == [MerkleChange((1, 1), "removed")]
+
+    new_surah = edited(extra=[(3, 1, "الٓمٓ")])
+    change, = tree.diff(new_surah).changes
+    assert (change.path, change.kind, change.level) == ((3,), "added", "surah")
+
+
+def test_changes_are_in_path_order(tree):
+    new = edited(
+        replace={(2, 2): "ذَٰلِكَ ٱلْكِتَٰبُ لَا رَيْبَ فِيهِ"},
+        drop={(1, 1)},
+        extra=[(1, 4, "مَٰلِكِ يَوْمِ ٱلدِّينِ")],
+    )
+    assert tree.diff(new, max_depth=2).changes == [
+        MerkleChange((1, 1), "removed"),
+        MerkleChange((1, 4), "added"),
+        MerkleChange((2, 2), "changed"),
+    ]
+
+
+def test_save_load_round_trip(tree, tmp_path):
+    full = MerkleTree.load(tree.save(tmp_path / "full.merkle"))
+    assert full.nodes == tree.nodes
+    assert full.children == tree.children
+
+    verses = MerkleTree.load(tree.save(tmp_path / "verses.merkle", depth=2))
+    assert verses.depth == 2
+    assert verses.nodes == tree.truncate(2).nodes
+    assert verses.children == tree.truncate(2).children
+    assert verses.diff(tree).changes == []
+
+    new = edited(replace={(1, 2): "ٱلْحَمْدُ لَلَّهِ رَبِّ ٱلْعَٰلَمِينَ"})
+    # The stored tree stops at verses, so the change is reported there
+    assert verses.diff(new).changes == [MerkleChange((1, 2), "changed")]
+
+
+def test_algorithm_is_stored(tmp_path):
+    tree = MerkleTree.from_ayat(AYAT, algorithm="blake2b")
+    loaded = MerkleTree.load(tree.save(tmp_path / "blake.merkle"))
+    assert loaded.algorithm == "blake2b"
+    assert loaded.root_hash == tree.root_hash
+    with pytest.raises(ValueError, match="Cannot compare"):
+        loaded.diff(MerkleTree.from_ayat(AYAT))
+
+
+def test_version_1_file_is_sha256(tree, tmp_path):
+    records = tree.save(tmp_path / "v2.merkle").read_bytes()[len(MAGIC) + _ALGORITHM_FIELD:]
+    legacy = tmp_path / "v1.merkle"
+    legacy.write_bytes(MAGIC_V1 + records)
+
+    loaded = MerkleTree.load(legacy)
+    assert loaded.algorithm == "sha256"
+    assert loaded.nodes == tree.nodes
+    assert loaded.diff(tree).changes == []
+
+
+@pytest.mark.parametrize("data", [b"", b"QUDMRKL9" + b"\0" * _RECORD.size,
+                                  MAGIC_V1 + b"\0" * (_RECORD.size - 1)])
+def test_foreign_file_is_rejected(tmp_path, data):
+    path = tmp_path / "bad.merkle"
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match="Not a Merkle tree file"):
+        MerkleTree.load(path)
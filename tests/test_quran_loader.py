@@ -0,0 +1,39 @@
+"""Verse lookups in QuranLoader over raw data and a prebuilt VerseIndex."""
+
+import pytest
+
+from quran_loader import QuranLoader
+
+FLAT = [
+    {"sura_no": s, "aya_no": a, "aya_text": f"{s}:{a}"}
+    for s, count in ((1, 7), (2, 5), (114, 6))
+    for a in range(1, count + 1)
+]
+NESTED = {
+    "surahs": [
+        {"number": s, "verses": [{"number": a, "text": f"{s}:{a}"} for a in range(1, count + 1)]}
+        for s, count in ((1, 7), (2, 5), (114, 6))
+    ]
+}
+
+
+@pytest.mark.parametrize("data", [FLAT, NESTED], ids=["flat", "nested"])
+def test_raw_data_and_index_agree(data):
+    loader = QuranLoader()
+    index = loader.build_verse_index(data)
+    for surah, verse in [(1, 1), (2, 5), (114, 6), (2, None)]:
+        assert loader.get_verses(data, surah, verse) == loader.get_verses(index, surah, verse)
+
+    refs = [(114, 6), (1, 1), (2, 3)]
+    assert loader.get_verses_many(data, refs) == loader.get_verses_many(index, refs)
+
+
+@pytest.mark.parametrize("data", [FLAT, NESTED], ids=["flat", "nested"])
+def test_missing_refs_raise(data):
+    loader = QuranLoader()
+    with pytest.raises(ValueError, match="Surah 3 not found"):
+        loader.get_verses(data, 3, 1)
+    with pytest.raises(ValueError, match="Verse 2:9 not found"):
+        loader.get_verses(data, 2, 9)
+    with pytest.raises(ValueError, match="Verses not found: 2:9, 3:1"):
+        loader.get_verses_many(data, [(1, 1), (2, 9), (3, 1)])
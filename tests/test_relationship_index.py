@@ -0,0 +1,81 @@
+"""ID and hash checks when mappings are added to a RelationshipIndex."""
+
+import json
+import re
+import uuid
+
+import pytest
+
+from generators.relationship_index import _LENGTH, MAGIC, RelationshipIndex
+
+HAFS = {"qiraah": "hafs"}
+AYA = {"code": "AYA", "context": HAFS}
+WRD = {"code": "WRD", "context": HAFS}
+
+
+def ids(n):
+    return [str(uuid.uuid4()) for _ in range(n)]
+
+
+def test_saved_index_round_trips(tmp_path):
+    index = RelationshipIndex()
+    verse, words = ids(1)[0], ids(3)
+    mapping_id = index.add(AYA, verse, WRD, words, "composition")
+
+    loaded = RelationshipIndex.load(index.save(tmp_path / "test.qudrel"))
+    assert loaded.targets(verse, layer="WRD") == words
+    assert loaded.get(mapping_id) == index.get(mapping_id)
+
+
+@pytest.mark.parametrize("bad_id", ["verse-1", str(uuid.uuid4()).upper(), "a" * 36, 7])
+def test_non_uuid_entity_ids_are_rejected(bad_id):
+    index = RelationshipIndex()
+    with pytest.raises(ValueError, match="entity_id"):
+        index.add(AYA, bad_id, WRD, ids(2), "composition")
+    with pytest.raises(ValueError, match="entity_id"):
+        index.add(AYA, ids(1)[0], WRD, [*ids(1), bad_id], "composition")
+    assert len(index) == 0 and index.entity_count == 0
+
+
+@pytest.mark.parametrize("bad_hash", [
+    "sha256:zz", "sha256:" + "a" * 63, "sha256:" + "A" * 64, "blake2b:" + "a" * 64,
+])
+def test_malformed_semantic_hashes_are_rejected(bad_hash):
+    index = RelationshipIndex()
+    with pytest.raises(ValueError, match="semantic_hash"):
+        index.add(AYA, ids(1)[0], WRD, ids(2), "composition", semantic_hash=bad_hash)
+
+
+def test_mapping_id_must_be_a_uuid():
+    index = RelationshipIndex()
+    with pytest.raises(ValueError, match="mapping_id"):
+        index.add(AYA, ids(1)[0], WRD, ids(2), "composition", mapping_id="m-1")
+
+
+SCHEMA_HASH = re.compile(r"^sha256:[a-f0-9]{64}$")  # entity-mapping-schema.json
+
+
+def test_semantic_hashes_match_the_schema():
+    index = RelationshipIndex()
+    mapping_id = index.add(AYA, ids(1)[0], WRD, ids(2), "composition")
+    semantic_hash = index.get(mapping_id)["semantic_hash"]
+    assert SCHEMA_HASH.match(semantic_hash)
+    assert index.find(semantic_hash)["mapping_id"] == mapping_id
+
+
+def test_hash_algorithms_outside_the_schema_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="semantic_hash must use"):
+        RelationshipIndex("blake2b")
+
+    index = RelationshipIndex()
+    index.add(AYA, ids(1)[0], WRD, ids(2), "composition")
+    data = index.save(tmp_path / "test.qudrel").read_bytes()
+    (length,) = _LENGTH.unpack_from(data, len(MAGIC))
+    start = len(MAGIC) + _LENGTH.size
+    header = json.loads(data[start:start + length])
+    header["hash_algorithm"] = "blake2b"
+    encoded = json.dumps(header).encode("utf-8")
+    path = tmp_path / "blake2b.qudrel"
+    path.write_bytes(MAGIC + _LENGTH.pack(len(encoded)) + encoded + data[start + length:])
+    with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+        RelationshipIndex.load(path)
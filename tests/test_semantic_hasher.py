@@ -0,0 +1,42 @@
+"""Batch hashing defaults and Merkle trees of each hash algorithm."""
+
+import pytest
+
+from generators.merkle_tree import MerkleTree
+from generators.semantic_hasher import HASH_ALGORITHMS, SemanticHasher
+
+AYAT = [(1, 1, "بِسۡمِ ٱللَّهِ ٱلرَّحۡمَٰنِ"), (1, 2, "ٱلۡحَمۡدُ لِلَّهِ")]
+
+
+def test_batches_are_serial_by_default(monkeypatch):
+    import generators.semantic_hasher as semantic_hasher
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a pool was started")
+
+    monkeypatch.setattr(semantic_hasher, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(semantic_hasher, "ThreadPoolExecutor", no_pool)
+    hasher = SemanticHasher()
+    items = [f"item {i}" for i in range(5)]
+    assert hasher.hash_many(items, max_workers=4, batch_size=2) == [
+        hasher.hash_string(item) for item in items
+    ]
+
+
+@pytest.mark.parametrize("algorithm", list(HASH_ALGORITHMS))
+def test_merkle_tree_uses_the_hasher_algorithm(algorithm, tmp_path):
+    tree = SemanticHasher(algorithm).merkle_tree(AYAT)
+    assert tree.algorithm == algorithm
+    assert tree.root_hash == MerkleTree.from_ayat(AYAT, algorithm).root_hash
+
+    loaded = MerkleTree.load(tree.save(tmp_path / "tree.merkle"))
+    assert loaded.algorithm == algorithm
+    assert loaded.diff(tree).changes == []
+
+
+def test_merkle_algorithms_differ_and_do_not_compare():
+    sha256 = SemanticHasher("sha256").merkle_tree(AYAT)
+    blake2b = SemanticHasher("blake2b").merkle_tree(AYAT)
+    assert sha256.root_hash != blake2b.root_hash
+    with pytest.raises(ValueError, match="blake2b"):
+        sha256.diff(blake2b)
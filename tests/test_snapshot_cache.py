@@ -0,0 +1,32 @@
+"""Snapshot rebuilds never touch files a live reader maps."""
+
+import json
+
+from riwaya_corpus import RiwayaCorpus
+from snapshot_cache import SnapshotCache
+
+
+def records(text):
+    return [{
+        "id": verse, "jozz": 1, "page": 1, "sura_no": 1, "sura_name_en": "Al-Fatiha",
+        "sura_name_ar": "الفاتحة", "line_start": verse, "line_end": verse,
+        "aya_no": verse, "aya_text": f"{text} {verse}",
+    } for verse in range(1, 8)]
+
+
+def test_snapshot_rebuild_keeps_mapped_files(tmp_path):
+    source = tmp_path / "source.json"
+    source.write_text(json.dumps(records("old")), encoding="utf-8")
+    cache = SnapshotCache(tmp_path / "cache")
+    cache.store(source, RiwayaCorpus.from_records(records("old")))
+    old = cache.load(source)
+    assert old is not None
+
+    source.write_text(json.dumps(records("new")), encoding="utf-8")
+    snapshot = cache.store(source, RiwayaCorpus.from_records(records("new")))
+
+    assert old["aya_text"][0] == "old 1"
+    assert old["sura_no"].tolist() == [1] * 7
+    assert cache.load(source)["aya_text"][0] == "new 1"
+    assert len(list(snapshot.glob("data-*"))) == 1
+
@@ -0,0 +1,182 @@
+"""uuid_generator: binary conversion, hierarchical and bulk IDs, mint hooks."""
+
+import uuid
+
+import numpy as np
+import pytest
+
+from generators import uuid_generator
+from generators.uuid_generator import (
+    QUD_NAMESPACE,
+    VALID_PATTERNS,
+    HierarchicalIDBuilder,
+    _generate,
+    _generate_many,
+    add_mint_hook,
+    char_ids,
+    pack_ids,
+    remove_mint_hook,
+    unpack_ids,
+    uuid_to_bytes,
+    uuid_to_str,
+)
+
+SAMPLE = "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
+
+BAD_UUIDS = [
+    "a" * 36,
+    "6ba7b810-9dad-11d1-80b4-00c04fd430c",
+    "6ba7b810-9dad-11d1-80b4-00c04fd430 8",
+    "6ba7b810 9dad 11d1 80b4 00c04fd430c8",
+    "6ba7b810-9dad-11d1-80b4-00c04fd430cg",
+]
+
+
+def test_canonical_string_converts_both_ways():
+    assert uuid_to_bytes(SAMPLE) == uuid.UUID(SAMPLE).bytes
+    assert uuid_to_str(uuid.UUID(SAMPLE).bytes) == SAMPLE
+    assert uuid_to_str(SAMPLE.upper()) == SAMPLE
+
+
+@pytest.mark.parametrize("bad", BAD_UUIDS)
+def test_malformed_strings_are_rejected(bad):
+    with pytest.raises(ValueError):
+        uuid_to_bytes(bad)
+    with pytest.raises(ValueError):
+        uuid_to_str(bad)
+    with pytest.raises(ValueError):
+        pack_ids([SAMPLE, bad])
+
+
+def test_wrong_length_bytes_are_rejected():
+    with pytest.raises(ValueError):
+        uuid_to_bytes(b"\x00" * 15)
+
+
+def test_packed_ids_round_trip():
+    refs = [(1, 1, 1, c) for c in range(1, 6)]
+    strings = char_ids("hafs", refs)
+    mixed = [strings[0], uuid_to_bytes(strings[1]), uuid.UUID(strings[2])] + strings[3:]
+
+    packed = pack_ids(mixed)
+    assert len(packed) == 16 * len(strings)
+    assert unpack_ids(packed) == strings
+    assert unpack_ids(packed, binary=True) == char_ids("hafs", refs, binary=True)
+
+    with pytest.raises(ValueError):
+        unpack_ids(packed[:-1])
+
+
+# Refs out of document order too, so the builder drops and rebuilds prefixes
+SYMBOL_REFS = [
+    (1, 1, 1, 1, 1), (1, 1, 1, 1, 2), (1, 1, 1, 2, 1), (1, 1, 2, 1, 1), (1, 2, 1, 1, 1),
+    (2, 255, 4, 2, 1), (1, 1, 1, 1, 3), (114, 6, 3, 10, 12), (2, 255, 4, 2, 1),
+]
+COORDINATES = ("surah", "verse", "word", "char", "symbol")
+
+# Entity -> (name fields, bulk method, single-ID method)
+LEVELS = {
+    "verse": (COORDINATES[:2], "verse_ids", "verse_id"),
+    "word": (COORDINATES[:3], "word_ids", "word_id"),
+    "char": (COORDINATES[:4], "char_ids", "char_id"),
+    "symbol": (COORDINATES, "symbol_ids", "symbol_id"),
+}
+
+
+def expected_ids(entity, fields, refs, binary):
+    """IDs straight from uuid.uuid5 over the VALID_PATTERNS name."""
+    ids = [
+        uuid.uuid5(QUD_NAMESPACE, VALID_PATTERNS[entity].format(
+            narration="warsh", **dict(zip(fields, ref))
+        ))
+        for ref in refs
+    ]
+    return [u.bytes if binary else str(u) for u in ids]
+
+
+@pytest.mark.parametrize("binary", [False, True], ids=["str", "binary"])
+@pytest.mark.parametrize("entity", list(LEVELS))
+def test_hierarchical_ids_equal_uuid5(entity, binary):
+    fields, bulk, single = LEVELS[entity]
+    refs = [ref[:len(fields)] for ref in SYMBOL_REFS]
+    expected = expected_ids(entity, fields, refs, binary)
+
+    builder = HierarchicalIDBuilder("warsh", binary)
+    assert getattr(builder, bulk)(refs) == expected
+    assert [getattr(builder, single)(*ref) for ref in refs] == expected
+    assert getattr(uuid_generator, bulk)("warsh", refs, binary=binary) == expected
+    assert getattr(uuid_generator, bulk)("warsh", np.array(refs), binary=binary) == expected
+    if not binary:
+        assert [getattr(uuid_generator, single)("warsh", *ref) for ref in refs] == expected
+
+
+@pytest.mark.parametrize("binary", [False, True], ids=["str", "binary"])
+def test_hierarchical_sentence_ids_equal_uuid5(binary):
+    refs = [(1, 1, 1), (1, 1, 2), (2, 255, 1), (1, 1, 3)]
+    expected = expected_ids("sentence", ("surah", "verse", "sentence"), refs, binary)
+
+    builder = HierarchicalIDBuilder("warsh", binary)
+    assert builder.sentence_ids(refs) == expected
+    assert [builder.sentence_id(*ref) for ref in refs] == expected
+    if not binary:
+        assert [uuid_generator.sentence_id("warsh", *ref) for ref in refs] == expected
+
+
+NAMES = ["hafs:s1:v1", "hafs:s2:v255:w4:c2", "qir:hafs", "s114", "hafs:s1:v1"]
+
+
+def test_generate_many_equals_single_generation():
+    expected = [uuid.uuid5(QUD_NAMESPACE, name) for name in NAMES]
+    assert _generate_many(NAMES) == [str(u) for u in expected]
+    assert _generate_many(NAMES, binary=True) == [u.bytes for u in expected]
+    assert _generate_many(iter(NAMES)) == [_generate(name) for name in NAMES]
+    assert _generate_many([]) == []
+
+
+@pytest.fixture
+def minted():
+    """Record every (name, id) pair minted while the test runs."""
+    pairs = []
+
+    def hook(names, ids):
+        pairs.extend(zip(names, ids))
+
+    add_mint_hook(hook)
+    add_mint_hook(hook)  # Registered once
+    yield pairs
+    remove_mint_hook(hook)
+    remove_mint_hook(hook)  # No-op when absent
+
+
+@pytest.mark.parametrize("binary", [False, True], ids=["str", "binary"])
+def test_mint_hooks_see_every_generated_id(minted, binary):
+    refs = [(2, 255, 4, 1), (2, 255, 4, 2), (1, 1, 1, 1)]
+    ids = char_ids("hafs", refs, binary=binary)
+    ids += HierarchicalIDBuilder("hafs", binary).symbol_ids([(1, 1, 1, 1, 1)])
+    single = uuid_generator.verse_id("hafs", 2, 255)
+
+    names = [uuid_generator.get_char_name("hafs", *ref) for ref in refs] + [
+        "hafs:s1:v1:w1:c1:sym1", "hafs:s2:v255",
+    ]
+    assert minted == list(zip(names, ids + [single]))
+    assert all(uuid.uuid5(QUD_NAMESPACE, name) == uuid.UUID(uuid_to_str(value))
+               for name, value in minted)
+
+
+def test_removed_hook_is_not_called():
+    calls = []
+    hook = lambda names, ids: calls.append(names)  # noqa: E731
+    add_mint_hook(hook)
+    remove_mint_hook(hook)
+    char_ids("hafs", [(1, 1, 1, 1)])
+    assert calls == []
+
+
+@pytest.mark.parametrize("bad_ref", [
+    (0, 1, 1, 1), (115, 1, 1, 1), (1, 0, 1, 1), (1, 1, 1, -2), (1, 1, 1, 1.0),
+    (1, 1, 1, True), (1, 1, 1),
+])
+def test_invalid_ref_rejects_the_whole_batch(minted, bad_ref):
+    with pytest.raises(ValueError):
+        char_ids("hafs", [(1, 1, 1, 1), bad_ref])
+    assert minted == []
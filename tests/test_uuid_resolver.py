@@ -0,0 +1,78 @@
+"""UUIDResolver log persistence and name parsing."""
+
+import re
+
+import pytest
+
+from generators import uuid_generator
+from generators.uuid_generator import VALID_PATTERNS
+from generators.uuid_resolver import INT_FIELDS, UUIDResolver, parse_name
+
+SAMPLE_FIELDS = {
+    "narration": "warsh", "edition": "kfgqpc_v2", "publisher": "kfgqpc", "name": "warsh_v2",
+    "surah": 2, "verse": 255, "word": 4, "char": 2, "symbol": 1, "sentence": 3,
+    "page": 42, "line": 7, "juz": 15, "hizb": 30, "rub": 120,
+}
+
+
+@pytest.mark.parametrize("entity", list(VALID_PATTERNS))
+def test_parse_name_inverts_every_pattern(entity):
+    pattern = VALID_PATTERNS[entity]
+    fields = {key: SAMPLE_FIELDS[key] for key in re.findall(r"\{(\w+)\}", pattern)}
+    assert parse_name(pattern.format(**fields)) == (entity, fields)
+    assert all(isinstance(fields[key], int) == (key in INT_FIELDS) for key in fields)
+
+
+def test_parse_name_rejects_unknown_names():
+    assert parse_name("hafs:s2:v0") == (None, {})
+    assert parse_name("hafs:s2:v255:x1") == (None, {})
+
+
+def mint(log_path, refs):
+    with UUIDResolver(log_path) as resolver:
+        ids = uuid_generator.char_ids("hafs", refs)
+    return resolver, ids
+
+
+def test_log_reloads_minted_ids(tmp_path):
+    log_path = tmp_path / "resolver.log"
+    refs = [(1, 1, 1, 1), (2, 255, 4, 2)]
+    _, ids = mint(log_path, refs)
+    single = uuid_generator.verse_id("hafs", 2, 255)  # Minted after detaching
+
+    resolver = UUIDResolver(log_path)
+    assert len(resolver) == 2
+    resolved = resolver.resolve(ids[1])
+    assert (resolved.entity, resolved.coordinates) == ("char", (2, 255, 4, 2))
+    assert resolved.fields["narration"] == "hafs"
+    assert resolver.resolve(single) is None
+
+    resolver.register(["hafs:s2:v255"])
+    assert resolver.resolve(single).entity == "verse"
+    resolver.close()
+    assert single in UUIDResolver(log_path)
+
+
+def test_truncated_tail_is_dropped_and_overwritten(tmp_path):
+    log_path = tmp_path / "resolver.log"
+    _, ids = mint(log_path, [(1, 1, 1, 1), (1, 1, 1, 2), (1, 1, 1, 3)])
+    data = log_path.read_bytes()
+    log_path.write_bytes(data[:-3])  # Interrupted write of the last record
+
+    resolver = UUIDResolver(log_path)
+    assert [value in resolver for value in ids] == [True, True, False]
+
+    resolver.register([uuid_generator.get_char_name("hafs", 1, 1, 1, 4)])
+    resolver.close()
+    # The partial record was cut off before appending (names have equal length)
+    assert len(log_path.read_bytes()) == len(data)
+    reloaded = UUIDResolver(log_path)
+    assert len(reloaded) == 3
+    assert reloaded.resolve(uuid_generator.char_id("hafs", 1, 1, 1, 4)).coordinates == (1, 1, 1, 4)
+
+
+def test_foreign_file_is_rejected(tmp_path):
+    log_path = tmp_path / "resolver.log"
+    log_path.write_bytes(b"not a resolver log")
+    with pytest.raises(ValueError, match="Not a UUID resolver log"):
+        UUIDResolver(log_path)
@@ -0,0 +1,21 @@
+"""UUID table rebuilds never touch files a live reader maps."""
+
+from generators.uuid_tables import SURAH_COUNT, UUIDTables
+
+
+def test_uuid_table_rebuild_keeps_mapped_files(tmp_path):
+    counts = {
+        "verse_counts": [1] * SURAH_COUNT,
+        "word_counts": [2] * SURAH_COUNT,
+        "line_counts": [15, 15],
+    }
+    UUIDTables.build(tmp_path, "hafs", edition="first", **counts)
+    old = UUIDTables.open(tmp_path, "hafs")
+    old_page = old["page"].id(1)
+
+    directory = UUIDTables.build(tmp_path, "hafs", edition="second", **counts)
+
+    assert old["page"].id(1) == old_page
+    assert old["page"].coordinate(old_page) == (1,)
+    assert UUIDTables.open(tmp_path, "hafs")["page"].id(1) != old_page
+    assert len(list(directory.glob("data-*"))) == 1